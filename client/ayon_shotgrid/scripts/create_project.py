@@ -87,7 +87,7 @@ def create_project(project_code):
         }
     )
 
-def sync_shotgrid_to_ayon(project_code):
+def sync_shotgrid_to_ayon(project_code, incremental=False):
     """
     Trigger synchronization of a ShotGrid project to AYON.
 
@@ -95,6 +95,7 @@ def sync_shotgrid_to_ayon(project_code):
 
     Args:
         project_code (str): The ShotGrid project code to sync.
+        incremental (bool): Only sync what changed since the last sync.
 
     Logs:
         Success message upon successful synchronization event spawn.
@@ -113,6 +114,7 @@ def sync_shotgrid_to_ayon(project_code):
             "project_name": project_name,
             "project_code": project_code,
             "project_code_field": "sg_code",
+            "incremental": incremental,
         },
         finished=True,
         store=True,
@@ -97,6 +97,194 @@ class ShotgridServiceSettings(BaseSettingsModel):
         ),
     )
 
+    leecher_projects_cache_ttl: int = SettingsField(
+        default=300,
+        title="Leecher: Refresh projects every (in seconds)",
+        description=(
+            "How long the leecher caches the list of ShotGrid projects with "
+            "'AYON Auto Sync' enabled, the list is refreshed right away "
+            "whenever the field changes in a project."
+        ),
+        section="---",
+    )
+
+    leecher_min_polling_interval: float = SettingsField(
+        default=1,
+        title="Leecher: Minimum time (in seconds) between queries",
+        description=(
+            "While idle, the leecher waits this long between ShotGrid "
+            "queries, doubling it each time no events are found up to the "
+            "polling frequency."
+        ),
+    )
+
+    leecher_max_page_size: int = SettingsField(
+        default=500,
+        title="Leecher: Maximum amount of events queried at once",
+        description=(
+            "While there's a backlog of events, the leecher queries pages "
+            "back to back, doubling their size up to this amount."
+        ),
+    )
+
+    leecher_dispatch_workers: int = SettingsField(
+        default=1,
+        title="Leecher: Threads dispatching events to AYON",
+        description=(
+            "With more than one, the leecher queries the next events while "
+            "the previous ones are sent to AYON. Events of the same project "
+            "are always sent in order."
+        ),
+    )
+
+    leecher_coalesce_window: float = SettingsField(
+        default=0,
+        title="Leecher: Coalesce changes of an entity within (in seconds)",
+        description=(
+            "Consecutive change events of the same entity within this "
+            "amount of seconds are sent to AYON as a single event. "
+            "Use 0 to disable it."
+        ),
+    )
+
+    leecher_compact_payloads: bool = SettingsField(
+        default=False,
+        title="Leecher: Compact event payloads",
+        description=(
+            "Only store in AYON the parts of the ShotGrid events the "
+            "processor needs, instead of the whole event twice. Events "
+            "dispatched before enabling it are still processed."
+        ),
+    )
+
+    leecher_ignore_own_events: bool = SettingsField(
+        default=True,
+        title="Leecher: Ignore changes done by the services",
+        description=(
+            "Leave out of the ShotGrid query the events caused by the "
+            "processor and the transmitter, which are already in AYON."
+        ),
+    )
+
+    leecher_ignored_session_uuids: list[str] = SettingsField(
+        default_factory=list,
+        title="Leecher: Ignored ShotGrid session UUIDs",
+        description=(
+            "Events created by ShotGrid sessions with any of these UUIDs "
+            "are never leeched."
+        ),
+    )
+
+    processor_workers: int = SettingsField(
+        default=1,
+        title="Processor: Amount of concurrent workers",
+        description=(
+            "How many ShotGrid events the processor handles at the same "
+            "time. Events of different projects run concurrently, while the "
+            "ones of the same project are always processed in order, within "
+            "a single processor, so only run one processor replica when this "
+            "is above 1. Set to 1 to process all events sequentially."
+        ),
+    )
+
+    processor_batch_size: int = SettingsField(
+        default=1,
+        title="Processor: Amount of events applied at once",
+        description=(
+            "The processor enrolls up to this amount of ShotGrid events and "
+            "applies the ones of the same project together, with a single "
+            "commit to AYON and a single batch request to ShotGrid. Only run "
+            "one processor replica when this is above 1. Set to 1 to apply "
+            "the events one by one."
+        ),
+    )
+
+    sync_prefetch_max_entities: int = SettingsField(
+        default=50000,
+        title="Processor: Load whole projects when syncing up to (entities)",
+        description=(
+            "When synchronizing a project from ShotGrid, the whole AYON "
+            "project is loaded at once if the ShotGrid project has up to "
+            "this amount of entities. Bigger projects are loaded along the "
+            "hierarchy to keep the memory usage down."
+        ),
+    )
+
+    sync_commit_chunk_size: int = SettingsField(
+        default=10000,
+        title="Processor: Commit syncs every (entities)",
+        description=(
+            "When synchronizing a project from ShotGrid, the changes are "
+            "committed every time this amount of entities is processed and "
+            "the progress is stored in the sync event, so a retry of the "
+            "event resumes from there. 0 commits everything at the end."
+        ),
+    )
+
+    sg_batch_size: int = SettingsField(
+        default=100,
+        title="Maximum amount of requests per ShotGrid batch call",
+    )
+
+    sg_fetch_concurrency: int = SettingsField(
+        default=4,
+        title="Processor: Parallel ShotGrid queries when syncing",
+        description=(
+            "When synchronizing a project, the entity types are queried in "
+            "parallel with up to this amount of ShotGrid connections. "
+            "1 queries them one after the other."
+        ),
+    )
+
+    sg_schema_cache_ttl: int = SettingsField(
+        default=600,
+        title="Cached ShotGrid schema lifetime (in seconds)",
+        description=(
+            "The processor and the transmitter read the fields of each "
+            "ShotGrid entity type, and the hierarchy of each project, once "
+            "and keep them for this long. The processor also refreshes them "
+            "whenever a field or a project changes."
+        ),
+    )
+
+    ayon_anatomy_cache_ttl: int = SettingsField(
+        default=600,
+        title="Cached AYON project anatomy lifetime (in seconds)",
+        description=(
+            "The processor and the transmitter read the statuses, tags, "
+            "task and folder types and attributes of each AYON project once "
+            "and keep them for this long. The transmitter also refreshes "
+            "them whenever the project changes."
+        ),
+    )
+
+    hub_cache_max_projects: int = SettingsField(
+        default=20,
+        title="Processor: Maximum amount of cached projects",
+        description=(
+            "The processor keeps the projects it works on cached between "
+            "events, this is the maximum amount of projects to keep."
+        ),
+    )
+
+    hub_cache_max_memory: int = SettingsField(
+        default=512,
+        title="Processor: Cached projects memory limit (MB)",
+        description=(
+            "Estimated memory the cached projects can use before the least "
+            "recently used ones are discarded."
+        ),
+    )
+
+    hub_cache_max_age: int = SettingsField(
+        default=600,
+        title="Processor: Cached projects lifetime (in seconds)",
+        description=(
+            "Time after which a cached project is queried again, so changes "
+            "done outside of the processor are picked up."
+        ),
+    )
+
 
 class AttributesMappingModel(BaseSettingsModel):
     _layout = "compact"
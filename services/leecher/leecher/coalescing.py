@@ -0,0 +1,106 @@
+"""
+Merge bursts of change events on the same entity into a single event.
+"""
+from utils import get_logger
+
+
+class ChangeEventsCoalescer:
+    """Coalesce consecutive `_Change` events of the same entity.
+
+    A single edit in Shotgrid (i.e. changing the status, tags and a couple
+    of custom fields of a Shot) produces an event per attribute, while the
+    processor updates the whole entity from any of them. Consecutive change
+    events of the same entity created within `window` seconds of the first
+    one are merged into the last of them, which gets the names of all the
+    changed attributes in `meta["attribute_names"]` and the IDs of the merged
+    events in `meta["coalesced_event_ids"]`.
+
+    Only consecutive events are merged, so events are never reordered.
+
+    Args:
+        window (float): Maximum seconds between the first and the last
+            merged event, 0 disables coalescing.
+    """
+    log = get_logger(__file__)
+
+    def __init__(self, window=0):
+        self.window = window
+        self._pending = None
+        self._pending_started_at = None
+
+    def add(self, event):
+        """Add the next event to be dispatched.
+
+        Args:
+            event (dict): The Shotgrid Event data.
+
+        Returns:
+            list[dict]: Events ready to be dispatched, in order.
+        """
+        if not self.window:
+            return [event]
+
+        if self._can_merge(event):
+            self._merge(event)
+            return []
+
+        ready_events = self.flush()
+        if self._is_coalescible(event):
+            self._pending = event
+            self._pending_started_at = event["created_at"]
+        else:
+            ready_events.append(event)
+        return ready_events
+
+    def flush(self):
+        """Release the event being held, if any.
+
+        Returns:
+            list[dict]: Events ready to be dispatched.
+        """
+        if self._pending is None:
+            return []
+
+        event = self._pending
+        self._pending = None
+        self._pending_started_at = None
+        return [event]
+
+    def _is_coalescible(self, event):
+        return (
+            event["event_type"].endswith("_Change")
+            and bool(event.get("entity"))
+            and event["entity"].get("type") != "Project"
+        )
+
+    def _can_merge(self, event):
+        if self._pending is None or not self._is_coalescible(event):
+            return False
+
+        return (
+            event["event_type"] == self._pending["event_type"]
+            and event["entity"]["id"] == self._pending["entity"]["id"]
+            and (
+                (event["created_at"] - self._pending_started_at)
+                .total_seconds() <= self.window
+            )
+        )
+
+    def _merge(self, event):
+        pending_meta = self._pending.get("meta") or {}
+        attribute_names = pending_meta.get(
+            "attribute_names", [self._pending["attribute_name"]])
+        coalesced_event_ids = pending_meta.get(
+            "coalesced_event_ids", []) + [self._pending["id"]]
+
+        if event["attribute_name"] not in attribute_names:
+            attribute_names = attribute_names + [event["attribute_name"]]
+
+        event["meta"] = dict(
+            event.get("meta") or {},
+            attribute_names=attribute_names,
+            coalesced_event_ids=coalesced_event_ids,
+        )
+        self.log.debug(
+            f"Coalesced events {coalesced_event_ids} into {event['id']}.")
+        self._pending = event
@@ -0,0 +1,212 @@
+"""
+Helpers to dispatch leeched events to AYON while the next page is fetched.
+"""
+import time
+import queue
+import threading
+
+from utils import get_logger
+
+
+class EventCursor:
+    """Keep track of the last event ID that is safe to resume from.
+
+    Events are registered in ascending ID order as they are leeched and
+    confirmed once they reach AYON, potentially out of order. The cursor only
+    moves past an event once it's confirmed, so restarting from it never
+    skips an event that was leeched but not dispatched yet.
+
+    Args:
+        last_event_id (int): The ID to start from.
+    """
+
+    def __init__(self, last_event_id):
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._last_seen = last_event_id
+
+    def add(self, event_id):
+        """Register an event about to be dispatched."""
+        with self._lock:
+            self._pending.add(event_id)
+            self._last_seen = max(self._last_seen, event_id)
+
+    def skip(self, event_id):
+        """Register an event that won't be dispatched (i.e. ignored)."""
+        with self._lock:
+            self._last_seen = max(self._last_seen, event_id)
+
+    def confirm(self, event_id):
+        """Mark a registered event as dispatched."""
+        with self._lock:
+            self._pending.discard(event_id)
+
+    @property
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def last_event_id(self):
+        """Highest ID such that every event up to it has been handled."""
+        with self._lock:
+            if self._pending:
+                return min(self._pending) - 1
+            return self._last_seen
+
+
+class EventDispatcherPool:
+    """Dispatch events to AYON from a pool of threads.
+
+    Each thread consumes its own bounded queue, and events are routed to a
+    queue by partition key (i.e. the Shotgrid project ID), so the events of a
+    project are always dispatched one after the other and in the order they
+    were leeched. When the queues are full `submit` blocks, which stops the
+    leecher from running too far ahead of AYON.
+
+    A failing dispatch is retried with an increasing delay, blocking its
+    partition, and the cursor stays before it. Transient errors (i.e. AYON
+    can't be reached) are retried until the event reaches AYON. Any other
+    error is most likely caused by the event itself, so after `max_attempts`
+    it's handed to `failed_func` to be recorded and confirmed, so a single
+    event can't stop the leecher. Without `is_transient_func` or
+    `failed_func` events are never given up on.
+
+    Args:
+        dispatch_func (Callable): Function dispatching a single event, called
+            with the event and any extra arguments given to `submit`.
+        cursor (EventCursor): Cursor confirmed after each dispatch.
+        workers (int): Amount of dispatching threads.
+        queue_size (int): Maximum amount of events waiting per thread.
+        max_attempts (int): Attempts after which the delay between retries
+            stops increasing and failures are logged as errors.
+        is_transient_func (Optional[Callable]): Function telling whether
+            an exception raised by `dispatch_func` is worth retrying
+            forever.
+        failed_func (Optional[Callable]): Function recording an event given
+            up on, called with the event, the exception and any extra
+            arguments given to `submit`.
+    """
+    log = get_logger(__file__)
+
+    def __init__(
+        self,
+        dispatch_func,
+        cursor,
+        workers=4,
+        queue_size=500,
+        max_attempts=5,
+        is_transient_func=None,
+        failed_func=None,
+    ):
+        self._dispatch_func = dispatch_func
+        self._cursor = cursor
+        self._max_attempts = max_attempts
+        self._is_transient_func = is_transient_func
+        self._failed_func = failed_func
+        self._queues = [
+            queue.Queue(maxsize=queue_size) for _ in range(workers)
+        ]
+        for index, events_queue in enumerate(self._queues):
+            threading.Thread(
+                target=self._worker,
+                args=(events_queue,),
+                name=f"shotgrid_dispatch_{index}",
+                daemon=True,
+            ).start()
+
+    def submit(self, partition_key, event, *args):
+        """Queue an event to be dispatched.
+
+        Args:
+            partition_key (Hashable): Events sharing a key are dispatched
+                sequentially.
+            event (dict): The Shotgrid event, must have an `id`.
+        """
+        self._cursor.add(event["id"])
+        events_queue = self._queues[hash(partition_key) % len(self._queues)]
+        events_queue.put((event, args))
+
+    def wait(self, timeout=None):
+        """Wait for the queued events to be dispatched.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait.
+
+        Returns:
+            bool: Whether all the events were dispatched.
+        """
+        start = time.time()
+        while self._cursor.pending_count:
+            if timeout is not None and time.time() - start > timeout:
+                return False
+            time.sleep(0.1)
+        return True
+
+    def _worker(self, events_queue):
+        while True:
+            event, args = events_queue.get()
+            try:
+                self._dispatch(event, args)
+                # Only once it reached AYON, the cursor must not move past it
+                self._cursor.confirm(event["id"])
+            finally:
+                events_queue.task_done()
+
+    def _dispatch(self, event, args):
+        """Dispatch an event, retrying until it succeeds or is given up."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self._dispatch_func(event, *args)
+                return
+            except Exception as exc:
+                if (
+                    attempt >= self._max_attempts
+                    and self._give_up(event, args, exc)
+                ):
+                    return
+
+                if attempt < self._max_attempts:
+                    self.log.warning(
+                        f"Failed to dispatch event {event['id']} "
+                        f"(attempt {attempt}/{self._max_attempts}).",
+                        exc_info=True
+                    )
+                else:
+                    self.log.error(
+                        f"Failed to dispatch event {event['id']} "
+                        f"(attempt {attempt}), blocking the events of its "
+                        "project until it succeeds.",
+                        exc_info=True
+                    )
+            time.sleep(2 ** min(attempt, self._max_attempts))
+
+    def _give_up(self, event, args, exc):
+        """Record an event that keeps failing for a non transient error.
+
+        Returns:
+            bool: Whether the event was recorded and can be confirmed.
+        """
+        if (
+            self._failed_func is None
+            or self._is_transient_func is None
+            or self._is_transient_func(exc)
+        ):
+            return False
+
+        self.log.error(
+            f"Giving up on event {event['id']} after {self._max_attempts} "
+            f"attempts: {exc}",
+            exc_info=exc
+        )
+        try:
+            self._failed_func(event, exc, *args)
+        except Exception:
+            self.log.error(
+                f"Failed to record event {event['id']} as failed.",
+                exc_info=True
+            )
+            return False
+        return True
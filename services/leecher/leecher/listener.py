@@ -5,8 +5,10 @@ This service will continually run and query the EventLogEntry table from
 Shotgrid and converts them to Ayon events, and can be configured from the Ayon
 Addon settings page.
 """
+import os
 import sys
 import json
+import collections
 import time
 import signal
 import socket
@@ -17,16 +19,42 @@ from pprint import pformat
 from utils import (
     get_logger,
     get_event_hash,
+    get_sg_service_session_uuid,
 )
 
 from constants import (
+    CUST_FIELD_CODE_AUTO_SYNC,
+    SG_CACHE_ENTITY_TYPES,
     SG_EVENT_TYPES,
+    SG_EVENT_META_FIELDS,
     SG_EVENT_QUERY_FIELDS,
 )
 
+# Environment variable pointing to the file where the leecher persists the
+# last dispatched event ID, ideally in a volume that survives restarts.
+CHECKPOINT_FILE_ENV = "LEECHER_CHECKPOINT_FILE"
+
 import ayon_api
+import requests
 import shotgun_api3
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .polling import AdaptivePollingController
+from .coalescing import ChangeEventsCoalescer
+from .dispatching import EventCursor, EventDispatcherPool
+
+# Topic of the events recording the Shotgrid events that couldn't be
+# dispatched, so the leecher can move past them.
+FAILED_EVENT_TOPIC = "shotgrid.event.failed"
+
+# Version of the payloads dispatched in compact mode, payloads without a
+# version are the original ones that also carry the whole event as `message`.
+COMPACT_PAYLOAD_VERSION = 2
+
 # TODO: remove hash in future since it is only used as backward compatibility
 LAST_EVENT_QUERY = """query LastShotgridEvent($eventTopic: String!) {
   events(last: 20, topics: [$eventTopic]) {
@@ -109,6 +137,25 @@ class ShotgridListener:
             self.sg_enabled_entities.append("ProjectUserConnection")
             ### Ends Alkemy-X Override ###
 
+            self.sg_event_types = self._get_supported_event_types()
+            self.sg_event_types_set = frozenset(self.sg_event_types)
+            self.sg_cache_event_types = self._get_supported_event_types(
+                SG_CACHE_ENTITY_TYPES)
+            self.sg_cache_event_types_set = frozenset(
+                self.sg_cache_event_types)
+
+            # Events caused by our own services, they'd just be echoes of
+            # changes that are already in AYON
+            self.ignore_own_events = bool(
+                service_settings.get("leecher_ignore_own_events", True)
+            )
+            self.ignored_session_uuids = list(
+                service_settings.get("leecher_ignored_session_uuids") or []
+            )
+            if self.ignore_own_events:
+                self.ignored_session_uuids.append(
+                    get_sg_service_session_uuid(self.sg_script_name))
+
             try:
                 self.shotgrid_polling_frequency = int(
                     service_settings["polling_frequency"]
@@ -116,6 +163,44 @@ class ShotgridListener:
             except Exception:
                 self.shotgrid_polling_frequency = 10
 
+            try:
+                self.polling_controller = AdaptivePollingController(
+                    min_interval=float(service_settings.get(
+                        "leecher_min_polling_interval", 1)),
+                    max_interval=self.shotgrid_polling_frequency,
+                    max_page_size=int(service_settings.get(
+                        "leecher_max_page_size", 500)),
+                )
+            except Exception:
+                self.polling_controller = AdaptivePollingController(
+                    max_interval=self.shotgrid_polling_frequency)
+
+            try:
+                self.sg_projects_cache_ttl = int(
+                    service_settings.get("leecher_projects_cache_ttl", 300)
+                )
+            except Exception:
+                self.sg_projects_cache_ttl = 300
+
+            try:
+                self.coalescer = ChangeEventsCoalescer(
+                    window=float(service_settings.get(
+                        "leecher_coalesce_window", 0))
+                )
+            except Exception:
+                self.coalescer = ChangeEventsCoalescer()
+
+            self.compact_payloads = bool(
+                service_settings.get("leecher_compact_payloads", False)
+            )
+
+            try:
+                self.dispatch_workers = int(
+                    service_settings.get("leecher_dispatch_workers", 1)
+                )
+            except Exception:
+                self.dispatch_workers = 1
+
         except Exception as e:
             self.log.error(
                 "Unable to get Addon settings from the server.")
@@ -132,15 +217,141 @@ class ShotgridListener:
             self.log.error("Unable to connect to Shotgrid Instance:")
             raise e
 
+        self.sg_api_user = None
+        if self.ignore_own_events:
+            self.sg_api_user = self._find_sg_api_user()
+        self._echo_filters = self._build_echo_filters()
+
+        # How many leeched events were dispatched or ignored, and why
+        self.filter_stats = collections.Counter()
+
+        self._sg_projects = None
+        self._sg_projects_by_id = {}
+        self._sg_projects_fetched_at = 0
+
+        self._event_cursor = None
+        self._dispatcher = None
+
+        self.checkpoint_path = os.environ.get(CHECKPOINT_FILE_ENV)
+        if self.checkpoint_path:
+            self.log.info(
+                f"Persisting last event ID to '{self.checkpoint_path}'.")
+
         signal.signal(signal.SIGINT, self._signal_teardown_handler)
         signal.signal(signal.SIGTERM, self._signal_teardown_handler)
 
     def _signal_teardown_handler(self, signalnum, frame):
         self.log.warning("Process stop requested. Terminating process.")
+        if self._dispatcher is not None:
+            if not self._dispatcher.wait(timeout=10):
+                self.log.warning("Some leeched events were not dispatched.")
+            self._write_checkpoint(self._event_cursor.last_event_id)
         self.sg_session.close()
         self.log.warning("Termination finished.")
         sys.exit(0)
 
+    def _get_sg_projects(self, force_refresh=False):
+        """Get the Shotgrid projects with "AYON Auto Sync" enabled.
+
+        The projects are cached for `sg_projects_cache_ttl` seconds, since
+        they rarely change and we need them on every poll.
+
+        Args:
+            force_refresh (bool): Query the projects even if the cache is
+                still valid.
+
+        Returns:
+            list[dict]: The projects with their `id`, `name` and code field.
+        """
+        if (
+            force_refresh
+            or self._sg_projects is None
+            or (
+                time.time() - self._sg_projects_fetched_at
+                > self.sg_projects_cache_ttl
+            )
+        ):
+            self._sg_projects = self.sg_session.find(
+                "Project",
+                filters=[[CUST_FIELD_CODE_AUTO_SYNC, "is", True]],
+                fields=["id", "name", self.sg_project_code_field],
+            )
+            self._sg_projects_by_id = {
+                sg_project["id"]: sg_project
+                for sg_project in self._sg_projects
+            }
+            self._sg_projects_fetched_at = time.time()
+            self.log.debug(
+                f"Found {len(self._sg_projects)} projects with "
+                "AYON Auto Sync enabled."
+            )
+
+        return self._sg_projects
+
+    def _find_sg_api_user(self):
+        """Find the ApiUser of the script the services connect with.
+
+        Returns:
+            Optional[dict]: The ApiUser entity, None if not found.
+        """
+        try:
+            sg_api_user = self.sg_session.find_one(
+                "ApiUser",
+                [["firstname", "is", self.sg_script_name]],
+                ["id"],
+            )
+        except Exception:
+            self.log.warning(
+                "Unable to find the script ApiUser.", exc_info=True)
+            return None
+
+        if not sg_api_user:
+            self.log.warning(
+                f"ApiUser of script '{self.sg_script_name}' not found, its "
+                "events won't be filtered out."
+            )
+            return None
+
+        return {"type": "ApiUser", "id": sg_api_user["id"]}
+
+    def _build_echo_filters(self):
+        """Build SG filters leaving out the events caused by our services.
+
+        These are the changes done by the processor and the transmitter,
+        identified by the script ApiUser and the session UUIDs they use,
+        which are already in AYON. Events with no user or session are kept.
+
+        Returns:
+            filters (list): Filters to add to the projects events query.
+        """
+        echo_filters = []
+        if self.sg_api_user:
+            echo_filters.append({
+                "filter_operator": "any",
+                "filters": [
+                    ["user", "is", None],
+                    ["user", "is_not", self.sg_api_user],
+                ],
+            })
+
+        if self.ignored_session_uuids:
+            echo_filters.append({
+                "filter_operator": "any",
+                "filters": [
+                    ["session_uuid", "is", None],
+                    ["session_uuid", "not_in", self.ignored_session_uuids],
+                ],
+            })
+
+        return echo_filters
+
+    def _is_auto_sync_change_event(self, event):
+        """Whether the event toggles "AYON Auto Sync" on a project."""
+        return (
+            event["event_type"] == "Shotgun_Project_Change"
+            and event["attribute_name"] == CUST_FIELD_CODE_AUTO_SYNC
+        )
+
     def _build_shotgrid_filters(self, sg_projects):
         """Build SG filters for Events query.
 
@@ -148,6 +359,12 @@ class ShotgridListener:
         meet our needs:
             1) Events of Projects with "AYON Auto Sync" enabled.
             2) Events on entities and type for entities we track.
+            3) Events not caused by our own services.
+
+        Plus any change of "AYON Auto Sync" on any project, so we can refresh
+        the cached projects as soon as it happens, and the events of the
+        entities in `SG_CACHE_ENTITY_TYPES` (i.e. fields being created), so
+        the processor can refresh its caches.
 
         Args:
             sg_projects (list): List of Shotgrid Project IDs.
@@ -155,21 +372,40 @@ class ShotgridListener:
         Returns:
             filters (list): Filter to apply to the SG query.
         """
-        filters = []
-
         if not sg_projects:
             return []
 
-        filters.append(["project", "in", sg_projects])
-
-        if sg_event_types := self._get_supported_event_types():
-            filters.append(["event_type", "in", sg_event_types])
-
-        return filters
+        projects_filters = [["project", "in", sg_projects]]
+
+        if self.sg_event_types:
+            projects_filters.append(["event_type", "in", self.sg_event_types])
+
+        projects_filters.extend(self._echo_filters)
+
+        return [{
+            "filter_operator": "any",
+            "filters": [
+                {
+                    "filter_operator": "all",
+                    "filters": projects_filters,
+                },
+                {
+                    "filter_operator": "all",
+                    "filters": [
+                        ["event_type", "is", "Shotgun_Project_Change"],
+                        ["attribute_name", "is", CUST_FIELD_CODE_AUTO_SYNC],
+                    ],
+                },
+                ["event_type", "in", self.sg_cache_event_types],
+            ],
+        }]
+
+    def _get_supported_event_types(self, entity_types=None) -> list[str]:
+        if entity_types is None:
+            entity_types = self.sg_enabled_entities
 
-    def _get_supported_event_types(self) -> list[str]:
         sg_event_types = []
-        for entity_type in self.sg_enabled_entities:
+        for entity_type in entity_types:
             sg_event_types.extend(
                 event_name.format(entity_type) for event_name in SG_EVENT_TYPES
             )
@@ -215,16 +451,83 @@ class ShotgridListener:
 
         return None
 
+    def _read_checkpoint(self):
+        """Read the last event ID from the checkpoint file.
+
+        Returns:
+            last_event_id (Optional[int]): The ID stored in the checkpoint,
+                None if there's no checkpoint or it can't be read.
+        """
+        if not self.checkpoint_path or not os.path.exists(
+            self.checkpoint_path
+        ):
+            return None
+
+        try:
+            with open(self.checkpoint_path, "r") as checkpoint_file:
+                return int(json.load(checkpoint_file)["last_event_id"])
+        except Exception:
+            self.log.warning(
+                f"Unable to read checkpoint '{self.checkpoint_path}'.",
+                exc_info=True
+            )
+        return None
+
+    def _write_checkpoint(self, last_event_id):
+        """Persist the last event ID to the checkpoint file.
+
+        The file is written next to the checkpoint and then renamed over it,
+        so a crash mid-write never leaves a corrupted checkpoint behind.
+
+        Args:
+            last_event_id (int): The last dispatched event ID.
+        """
+        if not self.checkpoint_path:
+            return
+
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        try:
+            with open(tmp_path, "w") as checkpoint_file:
+                json.dump({"last_event_id": last_event_id}, checkpoint_file)
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+            os.replace(tmp_path, self.checkpoint_path)
+        except Exception:
+            self.log.warning(
+                f"Unable to write checkpoint '{self.checkpoint_path}'.",
+                exc_info=True
+            )
+
     def _get_last_event_processed(self, sg_filters):
         """Find the Event ID for the last SG processed event.
 
-        First attempt to find it via AYON, if none is found we get the last
+        First attempt to find it via AYON and the local checkpoint file,
+        using the most recent of both, if none is found we get the last
         matching event from Shotgrid.
 
+        When events are dispatched concurrently the last event in AYON may
+        be ahead of events that were still queued when the leecher stopped,
+        so the checkpoint is trusted over AYON if there's one.
+
         Returns:
             last_event_id (int): The last known Event id.
         """
-        last_event_id = self._find_last_event_id()
+        checkpoint_event_id = self._read_checkpoint()
+        if checkpoint_event_id and self.dispatch_workers > 1:
+            last_event_id = checkpoint_event_id
+        else:
+            last_event_id = max(
+                (
+                    event_id
+                    for event_id in (
+                        self._find_last_event_id(),
+                        checkpoint_event_id,
+                    )
+                    if event_id
+                ),
+                default=None,
+            )
+
         if not last_event_id:
             last_event = self.sg_session.find_one(
                 "EventLogEntry",
@@ -236,6 +539,95 @@ class ShotgridListener:
 
         return last_event_id
 
+    def _query_events(self, sg_filters, last_event_id):
+        """Query the next page of events after `last_event_id`."""
+        sg_filters.append(["id", "greater_than", last_event_id])
+
+        events = self.sg_session.find(
+            "EventLogEntry",
+            sg_filters,
+            SG_EVENT_QUERY_FIELDS,
+            order=[{"column": "id", "direction": "asc"}],
+            limit=self.polling_controller.page_size,
+        )
+
+        self.log.debug(f"Last Event ID: {last_event_id}")
+        self.log.debug(f"Shotgrid filters: {sg_filters}")
+        self.log.debug(f"Found {len(events)} events in Shotgrid.")
+
+        return events
+
+    def _should_dispatch_event(self, event):
+        """Whether a leeched event has to be sent to AYON.
+
+        Changes of "AYON Auto Sync" on a project refresh the cached projects
+        as a side effect. Every decision is counted in `filter_stats`.
+
+        Args:
+            event (dict): The Shotgrid Event data.
+
+        Returns:
+            bool: False if the event has to be ignored.
+        """
+        if event["event_type"] in self.sg_cache_event_types_set:
+            self.filter_stats["cache_events"] += 1
+            return True
+
+        if self._is_auto_sync_change_event(event):
+            self.log.info(
+                "AYON Auto Sync changed on project "
+                f"{event['entity']}, refreshing projects."
+            )
+            self.filter_stats["auto_sync_changes"] += 1
+            self._get_sg_projects(force_refresh=True)
+            if event["event_type"] not in self.sg_event_types_set:
+                # Project entity events are not tracked
+                return False
+
+        if self._get_event_project_id(event) not in self._sg_projects_by_id:
+            # i.e. "AYON Auto Sync" was disabled in the project
+            self.log.info(
+                f"Ignoring event {event['id']} of project "
+                "without AYON Auto Sync enabled."
+            )
+            self.filter_stats["ignored_project"] += 1
+            return False
+
+        ignore_reason = None
+        if (
+            event["event_type"].endswith("_Change")
+            and (
+                event["attribute_name"].replace("sg_", "")
+                not in self.custom_sg_attribs
+            )
+        ):
+            # events related to custom attributes changes
+            # check if event was caused by api user
+            if self._is_api_user_event(event):
+                ignore_reason = "ignored_api_user"
+
+            # check meta if in_create is True and ignore
+            # those events as they are not useful for us
+            # we are interested only in changes in entities
+            # not in creation events
+            elif event.get("meta", {}).get("in_create"):
+                ignore_reason = "ignored_in_create"
+
+        elif event["event_type"] in self.sg_event_types_set:
+            # events related to changes in entities we track
+            # check if event was caused by api user
+            if self._is_api_user_event(event):
+                ignore_reason = "ignored_api_user"
+
+        if ignore_reason:
+            self.log.info(f"Ignoring event: {event['id']}")
+            self.log.debug(f"event payload: {pformat(event)}")
+            self.filter_stats[ignore_reason] += 1
+            return False
+
+        self.filter_stats["dispatched"] += 1
+        return True
+
     def start_listening(self):
         """Main loop querying the Shotgrid database for new events
 
@@ -244,17 +636,20 @@ class ShotgridListener:
 
         We try to continue from the last Event processed by the leecher, if
         none is found we start at the moment in time.
+
+        How many events we query at once and how long we wait between
+        queries is driven by the `AdaptivePollingController`.
         """
         self.log.info("Start listening for Shotgrid Events...")
 
+        if self.dispatch_workers > 1:
+            self._start_listening_pipelined()
+            return
+
         last_event_id = None
 
         while True:
-            sg_projects = self.sg_session.find(
-                "Project", filters=[["sg_ayon_auto_sync", "is", True]]
-            )
-
-            sg_filters = self._build_shotgrid_filters(sg_projects)
+            sg_filters = self._build_shotgrid_filters(self._get_sg_projects())
             if not sg_filters:
                 time.sleep(self.shotgrid_polling_frequency)
                 continue
@@ -262,72 +657,205 @@ class ShotgridListener:
             if last_event_id is None:
                 last_event_id = self._get_last_event_processed(sg_filters)
 
-            sg_filters.append(["id", "greater_than", last_event_id])
-
             try:
-                events = self.sg_session.find(
-                    "EventLogEntry",
-                    sg_filters,
-                    SG_EVENT_QUERY_FIELDS,
-                    order=[{"column": "id", "direction": "asc"}],
-                    limit=50,
-                )
+                events = self._query_events(sg_filters, last_event_id)
+                wait_time = self.polling_controller.update(len(events))
                 if not events:
-                    time.sleep(self.shotgrid_polling_frequency)
+                    time.sleep(wait_time)
                     continue
 
-                self.log.debug(f"Last Event ID: {last_event_id}")
-                self.log.debug(f"Shotgrid filters: {sg_filters}")
-                self.log.debug(f"Found {len(events)} events in Shotgrid.")
-
-                sg_projects_by_id = {
-                    sg_project["id"]: sg_project
-                    for sg_project in sg_projects
-                }
-                supported_event_types = []
-                if events:
-                    supported_event_types = self._get_supported_event_types()
-
                 for event in events:
                     if not event:
                         continue
 
-                    ignore_event = False
                     last_event_id = event["id"]
+                    if not self._should_dispatch_event(event):
+                        continue
+
+                    for ready_event in self.coalescer.add(event):
+                        self.send_shotgrid_event_to_ayon(
+                            ready_event, self._sg_projects_by_id)
+
+                for ready_event in self.coalescer.flush():
+                    self.send_shotgrid_event_to_ayon(
+                        ready_event, self._sg_projects_by_id)
 
-                    if (
-                        event["event_type"].endswith("_Change")
-                        and (
-                            event["attribute_name"].replace("sg_", "")
-                            not in self.custom_sg_attribs
-                        )
-                    ):
-                        # events related to custom attributes changes
-                        # check if event was caused by api user
-                        ignore_event = self._is_api_user_event(event)
-
-                        if not ignore_event:
-                            # check meta if in_create is True and ignore
-                            # those events as they are not useful for us
-                            # we are interested only in changes in entities
-                            # not in creation events
-                            ignore_event = event.get("meta", {}).get(
-                                "in_create")
-
-                    elif event["event_type"] in supported_event_types:
-                        # events related to changes in entities we track
-                        # check if event was caused by api user
-                        ignore_event = self._is_api_user_event(event)
-
-                    if ignore_event:
-                        self.log.info(f"Ignoring event: {event['id']}")
-                        self.log.debug(f"event payload: {pformat(event)}")
+                self._write_checkpoint(last_event_id)
+                self.log.debug(f"Filter decisions: {dict(self.filter_stats)}")
+
+                if wait_time:
+                    time.sleep(wait_time)
+
+            except Exception:
+                self.log.error(traceback.format_exc())
+                time.sleep(self.polling_controller.update(0))
+
+    def _start_listening_pipelined(self):
+        """Query the next pages of events while the previous are dispatched.
+
+        This thread is the only one using the Shotgrid session, it pages
+        through the EventLogEntry table and hands the events over to an
+        `EventDispatcherPool`, which sends them to AYON keeping the order
+        of the events of each project. Since events of different projects
+        may reach AYON out of order, the checkpoint only moves up to the
+        last event that has every previous event dispatched.
+        """
+        self.log.info(
+            f"Dispatching events with {self.dispatch_workers} workers.")
+
+        fetched_event_id = None
+        checkpoint_event_id = None
+
+        while True:
+            sg_filters = self._build_shotgrid_filters(self._get_sg_projects())
+            if not sg_filters:
+                time.sleep(self.shotgrid_polling_frequency)
+                continue
+
+            if self._event_cursor is None:
+                fetched_event_id = self._get_last_event_processed(sg_filters)
+                self._event_cursor = EventCursor(fetched_event_id)
+                self._dispatcher = EventDispatcherPool(
+                    self._dispatch_leeched_event,
+                    self._event_cursor,
+                    workers=self.dispatch_workers,
+                    queue_size=self.polling_controller.max_page_size,
+                    is_transient_func=self._is_transient_dispatch_error,
+                    failed_func=self._record_failed_event,
+                )
+            cursor = self._event_cursor
+
+            try:
+                events = self._query_events(sg_filters, fetched_event_id)
+                wait_time = self.polling_controller.update(len(events))
+
+                for event in events:
+                    if not event:
+                        continue
+
+                    fetched_event_id = event["id"]
+                    if not self._should_dispatch_event(event):
                         continue
 
-                    self.send_shotgrid_event_to_ayon(event, sg_projects_by_id)
+                    for ready_event in self.coalescer.add(event):
+                        self._submit_event(ready_event)
+
+                for ready_event in self.coalescer.flush():
+                    self._submit_event(ready_event)
+
+                # Ignored and coalesced events are handled as well
+                cursor.skip(fetched_event_id)
+
+                if cursor.last_event_id != checkpoint_event_id:
+                    checkpoint_event_id = cursor.last_event_id
+                    self._write_checkpoint(checkpoint_event_id)
+
+                self.log.debug(
+                    f"Fetched up to event {fetched_event_id}, dispatched up "
+                    f"to {checkpoint_event_id}, {cursor.pending_count} "
+                    "events pending."
+                )
+                self.log.debug(f"Filter decisions: {dict(self.filter_stats)}")
+
+                if wait_time:
+                    time.sleep(wait_time)
 
             except Exception:
                 self.log.error(traceback.format_exc())
+                time.sleep(self.polling_controller.update(0))
+
+    def _submit_event(self, event):
+        """Queue an event in the dispatcher, blocking while it's full."""
+        self._dispatcher.submit(
+            self._get_event_project_id(event),
+            event,
+            self._sg_projects_by_id,
+        )
+
+    def _dispatch_leeched_event(self, payload, sg_projects_by_id):
+        """Send an event to AYON, tolerating it was already dispatched.
+
+        After a restart the events between the checkpoint and the last one
+        that reached AYON are leeched again, AYON rejects them as their hash
+        already exists, so there's no need to retry them.
+        """
+        try:
+            self.send_shotgrid_event_to_ayon(payload, sg_projects_by_id)
+        except ayon_api.exceptions.HTTPRequestError as exc:
+            response = getattr(exc, "response", None)
+            if getattr(response, "status_code", None) != 409:
+                raise
+            self.log.debug(f"Event {payload['id']} was already dispatched.")
+
+    def _is_transient_dispatch_error(self, exc):
+        """Whether an error dispatching an event isn't the event's fault.
+
+        AYON not being reachable, not accepting the service credentials or
+        failing on its side affects every event, so those are retried
+        until they succeed instead of giving up on the event.
+
+        Args:
+            exc (Exception): The error raised dispatching the event.
+
+        Returns:
+            bool: True if the event should be retried forever.
+        """
+        if isinstance(exc, (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            ayon_api.exceptions.UrlError,
+            ayon_api.exceptions.ServerError,
+        )):
+            return True
+
+        if isinstance(exc, (
+            ayon_api.exceptions.HTTPRequestError,
+            requests.exceptions.HTTPError,
+        )):
+            response = getattr(exc, "response", None)
+            status_code = getattr(response, "status_code", None)
+            return (
+                status_code is None
+                or status_code >= 500
+                or status_code in (401, 403, 408, 429)
+            )
+
+        return False
+
+    def _record_failed_event(self, payload, exc, sg_projects_by_id):
+        """Record in AYON a Shotgrid event that couldn't be dispatched.
+
+        The event is stored with its own topic, which the processor doesn't
+        enroll, so it can be inspected and dispatched again by hand.
+
+        Args:
+            payload (dict): The Event data.
+            exc (Exception): The error raised dispatching the event.
+            sg_projects_by_id (dict): Unused, the project might be the
+                reason it failed.
+        """
+        try:
+            self._post_event(
+                topic=FAILED_EVENT_TOPIC,
+                sender=socket.gethostname(),
+                event_hash=get_event_hash(FAILED_EVENT_TOPIC, payload["id"]),
+                project_name=None,
+                username=None,
+                description=(
+                    f"Failed to dispatch '{payload.get('event_type')}' "
+                    f"event with ID '{payload['id']}'"
+                ),
+                summary={"sg_event_id": payload["id"]},
+                payload={
+                    "sg_event_id": payload["id"],
+                    "event_type": payload.get("event_type"),
+                    "error": repr(exc),
+                },
+            )
+        except ayon_api.exceptions.HTTPRequestError as post_exc:
+            response = getattr(post_exc, "response", None)
+            if getattr(response, "status_code", None) != 409:
+                raise
 
     def _is_api_user_event(self, event: dict[str, Any]) -> bool:
         """Check if the event was caused by an API user.
@@ -345,6 +873,82 @@ class ShotgridListener:
         ):
             return True
 
+    def _get_event_project_id(self, event: dict[str, Any]) -> Any:
+        """Get the ID of the project an event belongs to.
+
+        Args:
+            event (dict): The Shotgrid Event data.
+
+        Returns:
+            int: The Shotgrid project ID, "Undefined" if it can't be found.
+        """
+        if event.get("meta", {}).get("entity_type", "Undefined") == "Project":
+            return (event.get("entity") or {}).get("id", "Undefined")
+        return (event.get("project") or {}).get("id", "Undefined")
+
+    def _get_compact_sg_payload(self, payload):
+        """Strip a Shotgrid event down to what the processor reads.
+
+        The processor only relies on a handful of `meta` keys, everything
+        else in the event is left out to keep the AYON events table small.
+
+        Args:
+            payload (dict): The Event data.
+
+        Returns:
+            dict: The reduced Event data.
+        """
+        meta = payload.get("meta") or {}
+        return {
+            "id": payload["id"],
+            "event_type": payload["event_type"],
+            "attribute_name": payload.get("attribute_name"),
+            "created_at": payload["created_at"],
+            "meta": {
+                key: meta[key]
+                for key in SG_EVENT_META_FIELDS
+                if key in meta
+            },
+        }
+
+    def _post_event(
+        self,
+        topic,
+        sender,
+        event_hash,
+        project_name,
+        username,
+        description,
+        summary,
+        payload,
+    ):
+        """Same as `ayon_api.dispatch_event` serializing with orjson.
+
+        The request body is encoded here so it doesn't go through the
+        standard library encoder `requests` uses, which is several times
+        slower. Falls back to it if orjson is not installed.
+        """
+        event_data = {
+            "topic": topic,
+            "sender": sender,
+            "hash": event_hash,
+            "project": project_name,
+            "user": username,
+            "description": description,
+            "summary": summary,
+            "payload": payload,
+            "finished": True,
+            "store": True,
+        }
+        if orjson is not None:
+            body = orjson.dumps(event_data)
+        else:
+            body = json.dumps(event_data, separators=(",", ":")).encode()
+
+        response = ayon_api.raw_post("events", data=body)
+        response.raise_for_status()
+        return response
+
     def send_shotgrid_event_to_ayon(
         self, payload: dict[str, Any], sg_projects_by_id: dict[str, Any]
     ):
@@ -364,40 +968,58 @@ class ShotgridListener:
                 f"by '{user_name}'"
             )
 
-        # fix non serializable datetime
-        payload["created_at"] = payload["created_at"].isoformat()
+        # fix non serializable datetime, unless it's being retried
+        if not isinstance(payload["created_at"], str):
+            payload["created_at"] = payload["created_at"].isoformat()
 
-        payload_meta = payload.get("meta", {})
-        if payload_meta.get("entity_type", "Undefined") == "Project":
-            project_name = payload.get("entity", {}).get("name", "Undefined")
-            project_id = payload.get("entity", {}).get("id", "Undefined")
+        if payload_type in self.sg_cache_event_types_set:
+            # Not bound to any project
+            action = "shotgrid-cache-event"
+            sg_project = {}
         else:
-            project_name = payload.get("project", {}).get("name", "Undefined")
-            project_id = payload.get("project", {}).get("id", "Undefined")
+            action = "shotgrid-event"
+            sg_project = sg_projects_by_id[
+                self._get_event_project_id(payload)]
 
-        sg_project = sg_projects_by_id[project_id]
+        project_name = sg_project.get("name")
         new_event_hash = get_event_hash("shotgrid.event", payload["id"])
 
-        ayon_api.dispatch_event(
-            "shotgrid.event",
-            sender=socket.gethostname(),
-            event_hash=new_event_hash,
-            project_name=project_name,
-            username=user_name,
-            description=description,
-            summary={
-                "sg_event_id": payload_id,
-            },
-            payload={
-                "message": json.dumps(payload, indent=2),
-                "action": "shotgrid-event",
-                "user_name": user_name,
-                "project_name": project_name,
-                "project_code": sg_project.get(self.sg_project_code_field),
-                "project_code_field": self.sg_project_code_field,
-                "sg_payload": payload,
-            },
-        )
+        ayon_payload = {
+            "action": action,
+            "user_name": user_name,
+            "project_name": project_name,
+            "project_code": sg_project.get(self.sg_project_code_field),
+            "project_code_field": self.sg_project_code_field,
+        }
+
+        if self.compact_payloads:
+            ayon_payload["payload_version"] = COMPACT_PAYLOAD_VERSION
+            ayon_payload["sg_payload"] = self._get_compact_sg_payload(payload)
+            self._post_event(
+                topic="shotgrid.event",
+                sender=socket.gethostname(),
+                event_hash=new_event_hash,
+                project_name=project_name,
+                username=user_name,
+                description=description,
+                summary={"sg_event_id": payload_id},
+                payload=ayon_payload,
+            )
+        else:
+            ayon_payload["message"] = json.dumps(payload, indent=2)
+            ayon_payload["sg_payload"] = payload
+            ayon_api.dispatch_event(
+                "shotgrid.event",
+                sender=socket.gethostname(),
+                event_hash=new_event_hash,
+                project_name=project_name,
+                username=user_name,
+                description=description,
+                summary={
+                    "sg_event_id": payload_id,
+                },
+                payload=ayon_payload,
+            )
 
         self.log.info("Dispatched Ayon event with payload: %s", payload)
 
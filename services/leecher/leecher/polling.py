@@ -0,0 +1,79 @@
+"""
+Adaptive control of how often and how many events the leecher queries.
+"""
+from utils import get_logger
+
+
+class AdaptivePollingController:
+    """Decide the page size and the wait time between EventLogEntry queries.
+
+    While there's a backlog of events (i.e. a mass import of shots or a
+    restart after some downtime) every query returns a full page, so we
+    query the next page straight away doubling the page size each time, up
+    to `max_page_size`. As soon as a page comes back partially filled the
+    backlog is drained, the page size goes back to `min_page_size` and we
+    wait `min_interval`; every consecutive empty query doubles the wait,
+    up to `max_interval`.
+
+    Args:
+        min_interval (float): Seconds to wait after a partial page.
+        max_interval (float): Maximum seconds to wait while idle.
+        min_page_size (int): Amount of events queried when there's no
+            backlog.
+        max_page_size (int): Maximum amount of events queried at once.
+    """
+    log = get_logger(__file__)
+
+    def __init__(
+        self,
+        min_interval=1,
+        max_interval=10,
+        min_page_size=50,
+        max_page_size=500,
+    ):
+        self.min_interval = min(min_interval, max_interval)
+        self.max_interval = max_interval
+        self.min_page_size = min(min_page_size, max_page_size)
+        self.max_page_size = max_page_size
+
+        self.page_size = self.min_page_size
+        self.interval = self.min_interval
+        self.state = "idle"
+
+    def update(self, events_count):
+        """Update the controller with the result of the last query.
+
+        Args:
+            events_count (int): Amount of events the last query returned,
+                use 0 if the query failed.
+
+        Returns:
+            float: Seconds to wait before the next query.
+        """
+        if events_count >= self.page_size:
+            state = "draining"
+            wait_time = 0
+            self.interval = self.min_interval
+            self.page_size = min(self.page_size * 2, self.max_page_size)
+
+        elif events_count:
+            state = "polling"
+            wait_time = self.interval = self.min_interval
+            self.page_size = self.min_page_size
+
+        else:
+            state = "idle"
+            wait_time = self.interval
+            self.interval = min(self.interval * 2, self.max_interval)
+            self.page_size = self.min_page_size
+
+        if state != self.state:
+            self.log.info(
+                f"Polling state changed from '{self.state}' to '{state}'.")
+            self.state = state
+
+        self.log.debug(
+            f"Polling state: {self.state} | events: {events_count} | "
+            f"next page size: {self.page_size} | wait: {wait_time}s"
+        )
+        return wait_time
@@ -0,0 +1,40 @@
+"""
+Handle Shotgrid Events that invalidate what the processor has cached.
+
+These are events on entities that don't belong to any project, the leecher
+forwards the ones of the entity types in `SG_CACHE_ENTITY_TYPES`.
+"""
+from utils import (
+    get_logger,
+    sg_reference_data,
+    sg_schema_catalog,
+    sg_user_logins,
+)
+
+
+REGISTER_EVENT_TYPE = ["shotgrid-cache-event"]
+
+log = get_logger(__file__)
+
+
+def process_event(
+    sg_processor,
+    event,
+):
+    """Invalidate the caches affected by a Shotgrid Event."""
+    sg_event_meta = (event.get("sg_payload") or {}).get("meta") or {}
+    sg_entity_type = sg_event_meta.get("entity_type")
+
+    if sg_entity_type == "DisplayColumn":
+        # A field was created, changed or removed, we don't know in which
+        # entity type without querying it, but it's rare enough
+        log.info("ShotGrid fields changed, invalidating the schema cache.")
+        sg_schema_catalog.invalidate()
+
+    elif sg_entity_type == "HumanUser":
+        # Login changes or users being removed
+        sg_user_logins.invalidate(sg_event_meta.get("entity_id"))
+
+    elif sg_entity_type in sg_reference_data.ENTITY_FIELDS:
+        sg_reference_data.update_from_sg_event(
+            sg_processor.get_sg_connection(), sg_event_meta)
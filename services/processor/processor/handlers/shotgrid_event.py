@@ -1,12 +1,58 @@
 """
 Handle Events originated from Shotgrid.
 """
-from ayon_shotgrid_hub import AyonShotgridHub
+from constants import CUST_FIELD_CODE_AUTO_SYNC
+from utils import ay_project_anatomies, sg_project_hierarchies
 
 
 REGISTER_EVENT_TYPE = ["shotgrid-event"]
 
 
+def _get_sg_event_meta(event):
+    """Get the ShotGrid event `meta` from the AYON event payload.
+
+    Both the original payloads and the compact ones (`payload_version` 2)
+    carry the event `meta` under `sg_payload`, compact payloads only keep
+    the keys listed in `SG_EVENT_META_FIELDS`.
+    """
+    sg_payload = event.get("sg_payload", {})
+    if not sg_payload:
+        raise ValueError("The Event payload is empty!")
+
+    if not sg_payload.get("meta", {}):
+        raise ValueError("The Event payload is missing the action to perform!")
+
+    return sg_payload["meta"]
+
+
+def _is_project_event(sg_event_meta):
+    """Whether the event changes the Project itself.
+
+    Changes on the Project (i.e. the tracking settings, the code field or
+    `sg_ayon_auto_sync`) invalidate the cached hub of the project.
+    """
+    return (
+        sg_event_meta.get("entity_type") == "Project"
+        or sg_event_meta.get("attribute_name") == CUST_FIELD_CODE_AUTO_SYNC
+    )
+
+
+def _invalidate_project_caches(sg_processor, project_name, sg_events_meta):
+    """Forget what's cached about a project if any of the events changes it.
+
+    Besides the project hub and its anatomy, changes on the Project entity
+    (i.e. its tracking settings) invalidate the project hierarchy.
+    """
+    for sg_event_meta in sg_events_meta:
+        if not _is_project_event(sg_event_meta):
+            continue
+
+        sg_processor.hub_registry.invalidate(project_name)
+        ay_project_anatomies.invalidate(project_name)
+        if sg_event_meta.get("entity_type") == "Project":
+            sg_project_hierarchies.invalidate(sg_event_meta.get("entity_id"))
+
+
 def process_event(
     sg_processor,
     event,
@@ -17,21 +63,58 @@ def process_event(
     function, where we attempt to replicate a change coming form Shotgrid, like
     creating a new Shot, renaming a Task, etc.
     """
-    sg_payload = event.get("sg_payload", {})
-    if not sg_payload:
-        raise ValueError("The Event payload is empty!")
+    sg_event_meta = _get_sg_event_meta(event)
+    project_name = event.get("project_name")
 
-    if not sg_payload.get("meta", {}):
-        raise ValueError("The Event payload is missing the action to perform!")
+    _invalidate_project_caches(sg_processor, project_name, [sg_event_meta])
 
-    hub = AyonShotgridHub(
-        sg_processor.get_sg_connection(),
-        event.get("project_name"),
+    hub = sg_processor.get_project_hub(
+        project_name,
         event.get("project_code"),
-        sg_project_code_field=sg_processor.sg_project_code_field,
-        custom_attribs_map=sg_processor.custom_attribs_map,
-        custom_attribs_types=sg_processor.custom_attribs_types,
-        sg_enabled_entities=sg_processor.sg_enabled_entities,
     )
 
-    hub.react_to_shotgrid_event(sg_payload["meta"])
+    hub.react_to_shotgrid_event(sg_event_meta)
+
+
+def process_events(
+    sg_processor,
+    events,
+):
+    """React to a batch of Shotgrid Events of the same project.
+
+    Same as `process_event` but all the events are applied with a single
+    AYON commit and a single `sg.batch()` call.
+
+    Returns:
+        dict[int, Exception]: Errors of the events that failed, keyed by
+            their index in `events`.
+    """
+    errors = {}
+    sg_events_meta = []
+    events_indexes = []
+    for index, event in enumerate(events):
+        try:
+            sg_events_meta.append(_get_sg_event_meta(event))
+            events_indexes.append(index)
+        except ValueError as e:
+            errors[index] = e
+
+    if not sg_events_meta:
+        return errors
+
+    project_name = events[events_indexes[0]].get("project_name")
+    _invalidate_project_caches(sg_processor, project_name, sg_events_meta)
+
+    hub = sg_processor.get_project_hub(
+        project_name,
+        events[events_indexes[0]].get("project_code"),
+    )
+
+    hub_errors = hub.react_to_shotgrid_events(
+        sg_events_meta,
+        sg_batch_size=sg_processor.sg_batch_size,
+    )
+    for index, error in hub_errors.items():
+        errors[events_indexes[index]] = error
+
+    return errors
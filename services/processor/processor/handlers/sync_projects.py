@@ -1,11 +1,16 @@
 """Sync Projects - A `processor.handler` to ensure two Projects
 are in sync between AYON and Shotgrid, uses the `AyonShotgridHub`.
 """
+import ayon_api
+
 from ayon_shotgrid_hub import AyonShotgridHub
+from utils import ay_project_anatomies, get_logger, sg_project_hierarchies
 
 
 REGISTER_EVENT_TYPE = ["sync-from-shotgrid", "sync-from-ayon"]
 
+log = get_logger(__file__)
+
 
 def process_event(
     sg_processor,
@@ -16,6 +21,12 @@ def process_event(
     Events with the action `sync-from-shotgrid` or `sync-from-ayon` will
     trigger this function, where we traverse a whole project, either in
     Shotgrid or AYON, and replicate it's structure in the other platform.
+
+    Syncs from Shotgrid with `"incremental": True` in the payload only
+    replicate what changed since the last sync.
+
+    Syncs from Shotgrid store their progress in the event as they commit,
+    if the event is retried the sync resumes from there.
     """
     hub = AyonShotgridHub(
         sg_processor.get_sg_connection(),
@@ -27,8 +38,51 @@ def process_event(
         sg_enabled_entities=sg_processor.sg_enabled_entities,
     )
 
+    # A full sync is the usual way to pick up changes in the project
+    # hierarchy, so don't trust what's cached.
+    sg_project_hierarchies.invalidate()
+
     # This will ensure that the project exists in both platforms.
     hub.create_project()
     sync_source = (
         "ayon" if event.get("action") == "sync-from-ayon" else "shotgrid")
-    hub.synchronize_projects(source=sync_source)
+    hub.synchronize_projects(
+        source=sync_source,
+        sg_batch_size=sg_processor.sg_batch_size,
+        ay_prefetch_max_entities=sg_processor.sync_prefetch_max_entities,
+        incremental=bool(event.get("incremental")),
+        commit_chunk_size=sg_processor.sync_commit_chunk_size,
+        sync_checkpoint=event.get("sync_checkpoint"),
+        checkpoint_callback=_get_checkpoint_callback(event),
+    )
+
+    # A full sync might create the project or change its attributes, so
+    # make sure other events don't reuse an outdated hub.
+    sg_processor.hub_registry.invalidate(event.get("project_name"))
+    ay_project_anatomies.invalidate(event.get("project_name"))
+
+
+def _get_checkpoint_callback(event):
+    """Get a function that stores a sync checkpoint in the event payload."""
+    event_id = event.get("event_id")
+    if not event_id:
+        return None
+
+    payload = {
+        key: value
+        for key, value in event.items()
+        if key != "event_id"
+    }
+
+    def _store_checkpoint(sync_checkpoint):
+        payload["sync_checkpoint"] = sync_checkpoint
+        try:
+            ayon_api.update_event(event_id, payload=payload)
+        except Exception:
+            # Not worth failing the sync, a retry would start over
+            log.warning(
+                f"Unable to store the sync checkpoint in event {event_id}",
+                exc_info=True
+            )
+
+    return _store_checkpoint
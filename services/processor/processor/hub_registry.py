@@ -0,0 +1,179 @@
+"""
+A registry of warm `AyonShotgridHub` instances for the processor.
+
+Creating an `AyonShotgridHub` requires querying the addon settings, the AYON
+project and the Shotgrid project, which on busy projects costs more than
+processing the event itself, so we keep the hubs around and reuse them
+across events of the same project. Only the addon settings and the Shotgrid
+project are kept warm, the AYON project is queried again for every event.
+"""
+import time
+import threading
+import collections
+
+from utils import get_logger
+
+
+# Rough amount of memory an entity cached in an `EntityHub` takes, used to
+# estimate the memory footprint of the registry without having to walk
+# every object graph.
+ESTIMATED_ENTITY_SIZE = 4 * 1024
+
+
+class AyonShotgridHubRegistry:
+    """Least Recently Used cache of `AyonShotgridHub` keyed by project name.
+
+    Hubs are evicted whenever the registry holds more than `max_projects`
+    hubs or their estimated memory exceeds `max_memory` megabytes, and they
+    are rebuilt once they are older than `max_age` seconds, so changes done
+    outside of the processor (i.e. the addon settings or the Shotgrid
+    project) are picked up eventually.
+
+    Only the addon settings and the Shotgrid project of a hub are kept warm.
+    Every time a hub is handed out its `EntityHub` is replaced by a new one,
+    so the AYON project entity and the other AYON entities are queried fresh
+    from the server, the project's statuses and attributes included.
+
+    The registry is thread safe, but a hub must only be used by one thread at
+    a time, which the processor guarantees by processing the events of a
+    project sequentially.
+
+    Args:
+        hub_factory (Callable[[str, str], AyonShotgridHub]): Function that
+            creates a new hub given a project name and code.
+        max_projects (int): Maximum amount of hubs to keep.
+        max_memory (int): Maximum estimated memory (in MB) of all the hubs.
+        max_age (int): Seconds after which a hub is considered stale.
+    """
+    log = get_logger(__file__)
+
+    def __init__(
+        self,
+        hub_factory,
+        max_projects=20,
+        max_memory=512,
+        max_age=600,
+    ):
+        self._hub_factory = hub_factory
+        self.max_projects = max_projects
+        self.max_memory = max_memory
+        self.max_age = max_age
+
+        # project name -> (hub, creation time)
+        self._hubs = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_hub(self, project_name, project_code, sg_connection=None):
+        """Return a hub for the project, creating it if needed.
+
+        Args:
+            project_name (str): The AYON project name.
+            project_code (str): The project code.
+            sg_connection (Optional[shotgun_api3.Shotgun]): Connection to bind
+                the hub to, useful when the hub was created with a different
+                session than the one the caller is using.
+
+        Returns:
+            AyonShotgridHub: The hub for the project.
+        """
+        with self._lock:
+            hub = self._get_cached_hub(project_name, project_code)
+            if hub is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._hubs.move_to_end(project_name)
+
+        if hub is None:
+            # Create the hub outside of the lock so other projects don't
+            # have to wait for it.
+            hub = self._hub_factory(project_name, project_code)
+            # Do not keep hubs of projects missing in any of the platforms,
+            # they might be created at any time.
+            if hub.projects_exist():
+                with self._lock:
+                    self._hubs[project_name] = (hub, time.time())
+        else:
+            hub.reset_entities_cache()
+
+        with self._lock:
+            self._enforce_limits()
+
+        if sg_connection is not None:
+            hub.set_sg_connection(sg_connection)
+
+        return hub
+
+    def _get_cached_hub(self, project_name, project_code):
+        cached = self._hubs.get(project_name)
+        if cached is None:
+            return None
+
+        hub, created_at = cached
+        if (
+            hub.project_code != project_code
+            or time.time() - created_at > self.max_age
+        ):
+            self.log.debug(f"Cached hub for '{project_name}' is stale.")
+            self._hubs.pop(project_name)
+            return None
+
+        return hub
+
+    def _get_estimated_memory(self):
+        """Estimated memory (in MB) used by all the hubs."""
+        entities_count = sum(
+            hub.get_cached_entities_count()
+            for hub, _ in self._hubs.values()
+        )
+        return entities_count * ESTIMATED_ENTITY_SIZE / (1024 * 1024)
+
+    def _enforce_limits(self):
+        """Evict least recently used hubs until we are within the limits."""
+        while len(self._hubs) > 1 and (
+            len(self._hubs) > self.max_projects
+            or self._get_estimated_memory() > self.max_memory
+        ):
+            project_name, _ = self._hubs.popitem(last=False)
+            self.evictions += 1
+            self.log.debug(f"Evicted hub of project '{project_name}'.")
+
+    def invalidate(self, project_name=None):
+        """Forget the hub of a project, or all of them.
+
+        Args:
+            project_name (Optional[str]): The project to invalidate, if not
+                provided the whole registry is cleared.
+        """
+        with self._lock:
+            if project_name is None:
+                self.invalidations += len(self._hubs)
+                self._hubs.clear()
+                return
+
+            if self._hubs.pop(project_name, None) is not None:
+                self.invalidations += 1
+                self.log.debug(
+                    f"Invalidated hub of project '{project_name}'.")
+
+    def stats(self):
+        """Counters describing how the registry is performing.
+
+        Returns:
+            dict: Hits, misses, evictions, invalidations and current size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "projects": len(self._hubs),
+                "estimated_memory_mb": round(
+                    self._get_estimated_memory(), 2),
+            }
@@ -11,17 +11,33 @@ from pprint import pformat
 import time
 import types
 import socket
+import threading
 import importlib.machinery
 import traceback
 
 import ayon_api
 import shotgun_api3
 
-from utils import get_logger
+from ayon_shotgrid_hub import AyonShotgridHub
+from utils import (
+    ay_project_anatomies,
+    get_logger,
+    get_sg_service_session_uuid,
+    sg_project_hierarchies,
+    sg_schema_catalog,
+    sg_sessions_pool,
+)
+
+from .hub_registry import AyonShotgridHubRegistry
+from .workers import ProjectOrderedExecutor
+
+# Times an event enrolled without the `sequential` flag is processed before
+# giving up on it. They are retried in the processor instead of by AYON, so
+# the later events of the project wait for them.
+MAX_EVENT_ATTEMPTS = 3
 
 
 class ShotgridProcessor:
-    _sg: shotgun_api3.Shotgun = None
     log = get_logger(__file__)
 
     def __init__(self):
@@ -44,6 +60,8 @@ class ShotgridProcessor:
         self.log.info("Initializing the Shotgrid Processor.")
 
         self.handlers_map = None
+        # Shotgrid sessions are not thread safe, each worker gets its own
+        self._sg_sessions = threading.local()
 
         try:
             ayon_api.init_service()
@@ -86,6 +104,67 @@ class ShotgridProcessor:
             except Exception:
                 self.sg_polling_frequency = 10
 
+            try:
+                self.processor_workers = max(
+                    int(service_settings.get("processor_workers", 1)), 1)
+            except Exception:
+                self.processor_workers = 1
+
+            try:
+                self.processor_batch_size = max(
+                    int(service_settings.get("processor_batch_size", 1)), 1)
+            except Exception:
+                self.processor_batch_size = 1
+
+            try:
+                self.sg_batch_size = max(
+                    int(service_settings.get("sg_batch_size", 100)), 1)
+            except Exception:
+                self.sg_batch_size = 100
+
+            try:
+                self.sync_prefetch_max_entities = int(
+                    service_settings.get("sync_prefetch_max_entities", 50000))
+            except Exception:
+                self.sync_prefetch_max_entities = 50000
+
+            try:
+                self.sync_commit_chunk_size = max(
+                    int(service_settings.get("sync_commit_chunk_size", 10000)),
+                    0
+                )
+            except Exception:
+                self.sync_commit_chunk_size = 10000
+
+            try:
+                sg_sessions_pool.max_sessions = max(
+                    int(service_settings.get("sg_fetch_concurrency", 4)), 1)
+            except Exception:
+                sg_sessions_pool.max_sessions = 4
+
+            try:
+                sg_schema_catalog.ttl = int(
+                    service_settings.get("sg_schema_cache_ttl", 600))
+            except Exception:
+                sg_schema_catalog.ttl = 600
+            sg_project_hierarchies.ttl = sg_schema_catalog.ttl
+
+            try:
+                ay_project_anatomies.ttl = int(
+                    service_settings.get("ayon_anatomy_cache_ttl", 600))
+            except Exception:
+                ay_project_anatomies.ttl = 600
+
+            self.hub_registry = AyonShotgridHubRegistry(
+                self._create_hub,
+                max_projects=int(
+                    service_settings.get("hub_cache_max_projects", 20)),
+                max_memory=int(
+                    service_settings.get("hub_cache_max_memory", 512)),
+                max_age=int(
+                    service_settings.get("hub_cache_max_age", 600)),
+            )
+
             self.custom_attribs_map = {
                 attr["ayon"]: attr["sg"]
                 for attr in self.settings["compatibility_settings"]["custom_attribs_map"]
@@ -158,11 +237,14 @@ class ShotgridProcessor:
 
         Start connections to the APIs and catch any possible error, we abort if
         this steps fails for any reason.
-        """
 
-        if self._sg is None:
+        Each thread gets its own session since `shotgun_api3.Shotgun` objects
+        can't be shared across threads.
+        """
+        sg_session = getattr(self._sg_sessions, "sg", None)
+        if sg_session is None:
             try:
-                self._sg = shotgun_api3.Shotgun(
+                sg_session = shotgun_api3.Shotgun(
                     self.sg_url,
                     script_name=self.sg_script_name,
                     api_key=self.sg_api_key
@@ -170,15 +252,47 @@ class ShotgridProcessor:
             except Exception as e:
                 self.log.error("Unable to create Shotgrid Session.")
                 raise e
+            # Let the leecher skip the events caused by the processor
+            sg_session.set_session_uuid(
+                get_sg_service_session_uuid(self.sg_script_name))
+            self._sg_sessions.sg = sg_session
 
         try:
-            self._sg.connect()
+            sg_session.connect()
 
         except Exception as e:
             self.log.error("Unable to connect to Shotgrid.")
             raise e
 
-        return self._sg
+        return sg_session
+
+    def _create_hub(self, project_name, project_code):
+        """Create a new `AyonShotgridHub` with the processor settings."""
+        return AyonShotgridHub(
+            self.get_sg_connection(),
+            project_name,
+            project_code,
+            sg_project_code_field=self.sg_project_code_field,
+            custom_attribs_map=self.custom_attribs_map,
+            custom_attribs_types=self.custom_attribs_types,
+            sg_enabled_entities=self.sg_enabled_entities,
+        )
+
+    def get_project_hub(self, project_name, project_code):
+        """Get a warm `AyonShotgridHub` for the project from the registry.
+
+        Args:
+            project_name (str): The AYON project name.
+            project_code (str): The project code.
+
+        Returns:
+            AyonShotgridHub: The hub for the project.
+        """
+        return self.hub_registry.get_hub(
+            project_name,
+            project_code,
+            sg_connection=self.get_sg_connection(),
+        )
 
     def start_processing(self):
         """Enroll AYON events of topic `shotgrid.event`
@@ -191,9 +305,31 @@ class ShotgridProcessor:
         For example, an event that has `{"action": "create-project"}` payload,
         will trigger the `handlers/project_sync.py` since that one has the
         attribute REGISTER_EVENT_TYPE = ["create-project"]
+
+        If more than one worker is configured, events are processed in
+        parallel, see `_start_processing_in_pool`, and if a batch size is
+        configured, several events are enrolled and applied at once, see
+        `_process_events`.
+
+        Only the one by one processing relies on AYON, through the
+        `sequential` flag, to keep the events in order. Parallel and batched
+        processing keep the order of the events of a project within this
+        process only, so a single processor replica is supported with them.
         """
+        if self.processor_workers > 1:
+            return self._start_processing_in_pool()
+
         while True:
             try:
+                if self.processor_batch_size > 1:
+                    events = self._enroll_events(self.processor_batch_size)
+                    if not events:
+                        time.sleep(self.sg_polling_frequency)
+                        continue
+
+                    self._process_events(events)
+                    continue
+
                 event = ayon_api.enroll_event_job(
                     "shotgrid.event*",
                     "shotgrid.proc",
@@ -209,78 +345,392 @@ class ShotgridProcessor:
 
                 # Get source event because it is having payload to process
                 source_event = ayon_api.get_event(event["dependsOn"])
-                payload = source_event["payload"]
-                summary = source_event["summary"]
-
-                if source_sg_event_id := summary.get("sg_event_id"):
-                    event_id_text = (
-                        f". Shotgrid Event ID: {source_sg_event_id}."
-                    )
-                else:
-                    event_id_text = "."
-
-                if not payload:
-                    # TODO: maybe remove this - unrealistic scenario
-                    ayon_api.update_event(
-                        event["id"],
-                        description=(
-                            f"Unable to process the event{event_id_text} > "
-                            f"<{source_event['id']}> since it has no "
-                            "Shotgrid Payload!"
-                        ),
-                        status="finished"
-                    )
+                if not self._process_event(event, source_event):
                     time.sleep(self.sg_polling_frequency)
+
+            except Exception:
+                self.log.error(traceback.format_exc())
+
+    def _start_processing_in_pool(self):
+        """Enroll AYON events and process them in a pool of workers.
+
+        Events are enrolled without the `sequential` flag, and are handed to
+        a `ProjectOrderedExecutor` which runs events of different projects
+        concurrently but the ones of the same project (and hence the same
+        entity) strictly in the order they were enrolled. Each worker thread
+        talks to Shotgrid through its own session.
+
+        A failing event is retried before the next events of its project
+        run, see `_process_event_safe`, and AYON never enrolls it again.
+        The order is kept within this process, so only a single processor
+        replica is supported.
+        """
+        self.log.info(
+            f"Processing events with {self.processor_workers} workers.")
+        executor = ProjectOrderedExecutor(self.processor_workers)
+        # Do not enroll more events than we can chew
+        max_pending_events = self.processor_workers * 4
+
+        while True:
+            try:
+                if executor.pending_count >= max_pending_events:
+                    time.sleep(0.1)
                     continue
 
-                for handler in self.handlers_map.get(payload["action"], []):
-                    # If theres any handler "subscribed" to this event type..
-                    try:
-                        self.log.info(f"Running the Handler {handler}")
-                        ayon_api.update_event(
-                            event["id"],
-                            description=(
-                                "Processing event with Handler "
-                                f"{payload['action']}..."
-                            ),
-                            status="in_progress",
-                        )
-                        self.log.debug(
-                            f"processing event {pformat(payload)}")
-                        handler.process_event(
-                            self,
-                            payload,
+                if self.processor_batch_size > 1:
+                    events = self._enroll_events(self.processor_batch_size)
+                    if not events:
+                        time.sleep(self.sg_polling_frequency)
+                        continue
+
+                    for project_name, project_events in (
+                        self._group_events_by_project(events).items()
+                    ):
+                        executor.submit(
+                            project_name,
+                            self._process_events_safe,
+                            project_events,
                         )
+                    continue
 
-                    except Exception as e:
-                        self.log.error(
-                            f"Unable to process handler {handler.__name__}",
-                            exc_info=True
-                        )
-                        ayon_api.update_event(
-                            event["id"],
-                            status="failed",
-                            description=(
-                                "An error ocurred while processing"
-                                f"{event_id_text}"
-                            ),
-                            payload={
-                                "message": traceback.format_exc(),
-                            },
-                        )
-                        raise e
+                event = ayon_api.enroll_event_job(
+                    "shotgrid.event*",
+                    "shotgrid.proc",
+                    socket.gethostname(),
+                    description="Enrolling to any `shotgrid.event` Event...",
+                    max_retries=0,
+                    sequential=False,
+                )
+
+                if not event:
+                    time.sleep(self.sg_polling_frequency)
+                    continue
+
+                # We need the source event to know which project it belongs to
+                source_event = ayon_api.get_event(event["dependsOn"])
+                payload = source_event["payload"] or {}
+                project_name = (
+                    source_event.get("project")
+                    or payload.get("project_name")
+                )
+                executor.submit(
+                    project_name,
+                    self._process_event_safe,
+                    event,
+                    source_event,
+                )
+
+            except Exception:
+                self.log.error(traceback.format_exc())
 
-                self.log.info(
-                    "Event has been processed... setting to finished!")
+    def _enroll_events(self, max_events):
+        """Enroll up to `max_events` pending `shotgrid.event` events.
 
+        Events are enrolled without the `sequential` flag since we hold
+        several of them in progress at the same time, they are returned in
+        the order they were enrolled. AYON doesn't retry them, failed events
+        are retried in order by `_process_project_events`.
+
+        Args:
+            max_events (int): Maximum amount of events to enroll.
+
+        Returns:
+            list[tuple[dict, dict]]: The enrolled events and their
+                source events.
+        """
+        events = []
+        while len(events) < max_events:
+            event = ayon_api.enroll_event_job(
+                "shotgrid.event*",
+                "shotgrid.proc",
+                socket.gethostname(),
+                description="Enrolling to any `shotgrid.event` Event...",
+                max_retries=0,
+                sequential=False,
+            )
+            if not event:
+                break
+
+            events.append((event, ayon_api.get_event(event["dependsOn"])))
+
+        return events
+
+    def _group_events_by_project(self, events):
+        """Group enrolled events by project keeping their order.
+
+        Args:
+            events (list[tuple[dict, dict]]): Events and their source events.
+
+        Returns:
+            dict[str, list[tuple[dict, dict]]]: Events by project name.
+        """
+        events_by_project = {}
+        for event, source_event in events:
+            payload = source_event["payload"] or {}
+            project_name = (
+                source_event.get("project")
+                or payload.get("project_name")
+            )
+            events_by_project.setdefault(project_name, []).append(
+                (event, source_event)
+            )
+        return events_by_project
+
+    def _is_batchable(self, source_event):
+        """Whether all the handlers of the event can process it in batch."""
+        payload = source_event["payload"]
+        if not payload:
+            return False
+
+        handlers = self.handlers_map.get(payload["action"], [])
+        return bool(handlers) and all(
+            hasattr(handler, "process_events") for handler in handlers
+        )
+
+    def _process_events(self, events):
+        """Process several events, batching them where possible.
+
+        Events are grouped by project, and consecutive events of the same
+        project and action whose handlers implement `process_events` are
+        applied together; any other event is processed on its own. Each AYON
+        event gets its own status regardless.
+
+        Args:
+            events (list[tuple[dict, dict]]): Events and their source events.
+        """
+        for project_events in self._group_events_by_project(events).values():
+            self._process_project_events(project_events)
+
+    def _process_events_safe(self, events):
+        """Process events of a project logging any error."""
+        try:
+            self._process_project_events(events)
+        except Exception:
+            self.log.error(traceback.format_exc())
+
+    def _process_project_events(self, events):
+        """Process events of a single project in order.
+
+        An event that fails is retried before processing the next ones, so
+        the later events of the project are held back until it either
+        succeeds or runs out of attempts.
+        """
+        batch = []
+        for event, source_event in events:
+            if batch and (
+                not self._is_batchable(source_event)
+                or source_event["payload"]["action"]
+                != batch[0][1]["payload"]["action"]
+            ):
+                self._process_events_batch(batch)
+                batch = []
+
+            if self._is_batchable(source_event):
+                batch.append((event, source_event))
+                continue
+
+            self._process_event_safe(event, source_event)
+
+        if batch:
+            self._process_events_batch(batch)
+
+    def _process_events_batch(self, events):
+        """Run the handlers of a batch of events with the same action.
+
+        Args:
+            events (list[tuple[dict, dict]]): Events and their source events,
+                all of them must share the same action.
+        """
+        payloads = [source_event["payload"] for _, source_event in events]
+        action = payloads[0]["action"]
+
+        for event, _ in events:
+            ayon_api.update_event(
+                event["id"],
+                description=(
+                    f"Processing event with Handler {action} in a batch "
+                    f"of {len(events)} events..."
+                ),
+                status="in_progress",
+            )
+
+        errors = {}
+        for handler in self.handlers_map.get(action, []):
+            self.log.info(
+                f"Running the Handler {handler} on {len(events)} events")
+            try:
+                handler_errors = handler.process_events(self, payloads)
+            except Exception as e:
+                self.log.error(
+                    f"Unable to process handler {handler.__name__}",
+                    exc_info=True
+                )
+                handler_errors = dict.fromkeys(range(len(events)), e)
+
+            for index, error in handler_errors.items():
+                errors.setdefault(index, error)
+
+        if errors:
+            # The hub might be left with half applied changes
+            self.hub_registry.invalidate(payloads[0].get("project_name"))
+
+        failed_events = []
+        for index, (event, source_event) in enumerate(events):
+            if source_sg_event_id := source_event["summary"].get(
+                "sg_event_id"
+            ):
+                event_id_text = f". Shotgrid Event ID: {source_sg_event_id}."
+            else:
+                event_id_text = "."
+
+            error = errors.get(index)
+            if error is None:
                 ayon_api.update_event(
                     event["id"],
-                    description=f"Event processed successfully{event_id_text}",
+                    description=(
+                        f"Event processed successfully{event_id_text}"),
                     status="finished",
                 )
+                continue
+
+            self.log.warning(
+                f"Event {event['id']} failed in a batch{event_id_text} "
+                f"{''.join(traceback.format_exception(error))}"
+            )
+            failed_events.append((event, source_event))
+
+        self.log.info(
+            f"Processed {len(events) - len(errors)} events successfully, "
+            f"{len(errors)} failed."
+        )
+        self.log.debug(
+            f"Hub registry stats: {self.hub_registry.stats()}")
+
+        # Retry the failed ones before any later event of the project, the
+        # batch counts as their first attempt
+        for event, source_event in failed_events:
+            self._process_event_safe(
+                event, source_event, max_attempts=MAX_EVENT_ATTEMPTS - 1)
+
+    def _process_event_safe(
+        self, event, source_event, max_attempts=MAX_EVENT_ATTEMPTS
+    ):
+        """Process an event, retrying it and logging any error.
+
+        Events enrolled without the `sequential` flag aren't retried by
+        AYON, so they're retried here, before the caller moves on to the
+        next event of the project. The event is left failed once it runs
+        out of attempts.
+
+        Args:
+            event (dict): The enrolled `shotgrid.proc` event.
+            source_event (dict): The `shotgrid.event` the job depends on.
+            max_attempts (int): Times the event is processed at most.
+        """
+        for attempt in range(1, max_attempts + 1):
+            try:
+                self._process_event(event, source_event)
+                return
+            except Exception:
+                if attempt >= max_attempts:
+                    self.log.error(
+                        f"Event {event['id']} failed after {attempt} "
+                        f"attempts.\n{traceback.format_exc()}"
+                    )
+                    return
+                self.log.warning(
+                    f"Event {event['id']} failed (attempt {attempt}/"
+                    f"{max_attempts}), retrying it.",
+                    exc_info=True
+                )
+                time.sleep(2 ** attempt)
+
+    def _process_event(self, event, source_event):
+        """Run all the handlers registered for the event's action.
+
+        Args:
+            event (dict): The enrolled `shotgrid.proc` event.
+            source_event (dict): The `shotgrid.event` the job depends on.
+
+        Returns:
+            bool: Whether the event had a payload to process.
+        """
+        payload = source_event["payload"]
+        summary = source_event["summary"]
+
+        if source_sg_event_id := summary.get("sg_event_id"):
+            event_id_text = (
+                f". Shotgrid Event ID: {source_sg_event_id}."
+            )
+        else:
+            event_id_text = "."
+
+        if not payload:
+            # TODO: maybe remove this - unrealistic scenario
+            ayon_api.update_event(
+                event["id"],
+                description=(
+                    f"Unable to process the event{event_id_text} > "
+                    f"<{source_event['id']}> since it has no "
+                    "Shotgrid Payload!"
+                ),
+                status="finished"
+            )
+            return False
+
+        for handler in self.handlers_map.get(payload["action"], []):
+            # If theres any handler "subscribed" to this event type..
+            try:
+                self.log.info(f"Running the Handler {handler}")
+                ayon_api.update_event(
+                    event["id"],
+                    description=(
+                        "Processing event with Handler "
+                        f"{payload['action']}..."
+                    ),
+                    status="in_progress",
+                )
+                self.log.debug(
+                    f"processing event {pformat(payload)}")
+                # Handlers that store their progress in the event, like
+                # project syncs, need its ID
+                handler.process_event(
+                    self,
+                    dict(payload, event_id=source_event["id"]),
+                )
 
             except Exception as e:
-                self.log.error(traceback.format_exc())
+                self.log.error(
+                    f"Unable to process handler {handler.__name__}",
+                    exc_info=True
+                )
+                # The hub might be left with half applied changes
+                self.hub_registry.invalidate(
+                    payload.get("project_name"))
+                ayon_api.update_event(
+                    event["id"],
+                    status="failed",
+                    description=(
+                        "An error ocurred while processing"
+                        f"{event_id_text}"
+                    ),
+                    payload={
+                        "message": traceback.format_exc(),
+                    },
+                )
+                raise e
+
+        self.log.info(
+            "Event has been processed... setting to finished!")
+
+        ayon_api.update_event(
+            event["id"],
+            description=f"Event processed successfully{event_id_text}",
+            status="finished",
+        )
+        self.log.debug(
+            f"Hub registry stats: {self.hub_registry.stats()}")
+        return True
 
 
 def service_main():
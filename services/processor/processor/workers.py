@@ -0,0 +1,77 @@
+"""
+Helpers to process events concurrently while keeping their order per project.
+"""
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import get_logger
+
+
+class ProjectOrderedExecutor:
+    """Thread pool that runs tasks of the same key one after the other.
+
+    Tasks submitted with different keys (i.e. project names) run concurrently
+    on the pool, while tasks sharing a key are queued and executed strictly
+    in submission order, never two at the same time. Since an entity always
+    belongs to a single project, this also preserves the order of the events
+    of any given entity.
+
+    Args:
+        max_workers (int): Maximum amount of tasks running at the same time.
+    """
+    log = get_logger(__file__)
+
+    def __init__(self, max_workers):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="shotgrid_proc",
+        )
+        self._lock = threading.Lock()
+        # key -> tasks waiting for the running task of that key to finish
+        self._queues = {}
+        self._pending_count = 0
+
+    @property
+    def pending_count(self):
+        """Amount of submitted tasks that haven't finished yet."""
+        with self._lock:
+            return self._pending_count
+
+    def submit(self, key, func, *args):
+        """Schedule `func(*args)` after any other task with the same key.
+
+        Args:
+            key (Hashable): Tasks with the same key run sequentially.
+            func (Callable): The function to run.
+        """
+        with self._lock:
+            self._pending_count += 1
+            queue = self._queues.get(key)
+            if queue is not None:
+                # A task of this key is running, it'll pick this one up
+                queue.append((func, args))
+                return
+            self._queues[key] = collections.deque()
+
+        self._executor.submit(self._run, key, func, args)
+
+    def _run(self, key, func, args):
+        try:
+            func(*args)
+        except Exception:
+            self.log.error(f"Task of '{key}' failed.", exc_info=True)
+
+        with self._lock:
+            self._pending_count -= 1
+            queue = self._queues[key]
+            if not queue:
+                del self._queues[key]
+                return
+            func, args = queue.popleft()
+
+        # Re-submit instead of looping so busy keys don't hog a worker
+        self._executor.submit(self._run, key, func, args)
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
@@ -3,6 +3,7 @@ that provided a valid Project name and code, will perform all the necessary
 checks and provide methods to keep an Ayon and Shotgrid project in sync.
 """
 import re
+import functools
 
 from constants import (
     AYON_SHOTGRID_ENTITY_TYPE_MAP,
@@ -18,6 +19,7 @@ from .match_shotgrid_hierarchy_in_ayon import match_shotgrid_hierarchy_in_ayon
 from .match_ayon_hierarchy_in_shotgrid import match_ayon_hierarchy_in_shotgrid
 
 from .update_from_shotgrid import (
+    ShotgridEventsBatch,
     create_ay_entity_from_sg_event,
     update_ayon_entity_from_sg_event,
     remove_ayon_entity_from_sg_event,
@@ -46,6 +48,28 @@ from utils import get_logger
 PROJECT_NAME_REGEX = re.compile("^[a-zA-Z0-9_-]+$")
 
 
+def _count_entities_after(method):
+    """Count the entities left in the EntityHub once the method finishes.
+
+    The count is read by the processor's hub registry from other threads,
+    so it's kept in the hub instead of walking the EntityHub when asked.
+    Walking it is linear in its size, so only the public entry points are
+    decorated and they call each other through undecorated helpers.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            if self._ay_project is None:
+                self._entities_count = 0
+            else:
+                self._entities_count = sum(
+                    1 for _ in self._ay_project.entities)
+
+    return wrapper
+
+
 class AyonShotgridHub:
     """A Hub to manage a Project in both AYON and Shotgrid
 
@@ -90,6 +114,8 @@ class AyonShotgridHub:
 
         self._ay_project = None
         self._sg_project = None
+        # Entities in the EntityHub, see `get_cached_entities_count`
+        self._entities_count = 0
 
         if sg_project_code_field:
             self.sg_project_code_field = sg_project_code_field
@@ -165,6 +191,51 @@ class AyonShotgridHub:
             self.log.warning(f"Project with code {self.project_code} does not exist in Shotgrid. ")
             self._sg_project = None
 
+    def set_sg_connection(self, sg_connection):
+        """Swap the Shotgrid connection used by the hub.
+
+        Hubs can outlive the session they were created with (i.e. when kept
+        warm by the processor), so we allow re-binding them.
+
+        Args:
+            sg_connection (shotgun_api3.Shotgun): The Shotgrid connection.
+        """
+        self._sg = sg_connection
+
+    def reset_entities_cache(self):
+        """Drop all the cached folders and tasks from the AYON EntityHub.
+
+        The EntityHub is replaced by a new one, so the hub can be reused for
+        a new event without querying the addon settings and the Shotgrid
+        project again, while the AYON entities, the project included, are
+        queried fresh from the server when needed.
+        """
+        if self._ay_project is None:
+            return
+
+        self._ay_project = EntityHub(self.project_name)
+        self._entities_count = 0
+
+    def projects_exist(self):
+        """Whether the project was found in both AYON and Shotgrid.
+
+        Returns:
+            bool: True if the project exists in both platforms.
+        """
+        return self._ay_project is not None and self._sg_project is not None
+
+    def get_cached_entities_count(self):
+        """Amount of entities cached by the AYON EntityHub.
+
+        The amount is updated every time the hub finishes creating,
+        synchronizing or reacting to events.
+
+        Returns:
+            int: Number of entities, 0 if the AYON project does not exist.
+        """
+        return self._entities_count
+
+    @_count_entities_after
     def create_project(self):
         """Create project in AYON and Shotgrid.
         """
@@ -216,12 +287,34 @@ class AyonShotgridHub:
         self.create_sg_attributes()
         self.log.info(f"Project {self.project_name} ({self.project_code}) available in SG and AYON.")
 
-    def synchronize_projects(self, source="ayon"):
+    @_count_entities_after
+    def synchronize_projects(
+        self,
+        source="ayon",
+        sg_batch_size=100,
+        ay_prefetch_max_entities=50000,
+        incremental=False,
+        commit_chunk_size=0,
+        sync_checkpoint=None,
+        checkpoint_callback=None,
+    ):
         """ Ensure a Project matches in the other platform.
 
         Args:
             source (str): Either "ayon" or "shotgrid", dictates which one is the
                 "source of truth".
+            sg_batch_size (int): Maximum amount of requests per `sg.batch()`.
+            ay_prefetch_max_entities (int): Maximum amount of Shotgrid
+                entities for which the whole AYON project is loaded at once
+                when syncing from Shotgrid.
+            incremental (bool): When syncing from Shotgrid, only sync what
+                changed since the last sync.
+            commit_chunk_size (int): When syncing from Shotgrid, amount of
+                entities per AYON commit, 0 to commit once at the end.
+            sync_checkpoint (dict): When syncing from Shotgrid, checkpoint
+                of a previous attempt of the sync to resume from.
+            checkpoint_callback (callable): When syncing from Shotgrid,
+                called with a checkpoint after each committed chunk.
         """
         if not self._ay_project or not self._sg_project:
             raise ValueError("""The project is missing in one of the two platforms:
@@ -267,7 +360,8 @@ class AyonShotgridHub:
                     self._sg,
                     self.sg_enabled_entities,
                     self.sg_project_code_field,
-                    self.custom_attribs_map
+                    self.custom_attribs_map,
+                    sg_batch_size=sg_batch_size,
                 )
 
             case "shotgrid":
@@ -285,7 +379,13 @@ class AyonShotgridHub:
                     self._sg,
                     self.sg_enabled_entities,
                     self.sg_project_code_field,
-                    self.custom_attribs_map
+                    self.custom_attribs_map,
+                    sg_batch_size=sg_batch_size,
+                    ay_prefetch_max_entities=ay_prefetch_max_entities,
+                    incremental=incremental,
+                    commit_chunk_size=commit_chunk_size,
+                    sync_checkpoint=sync_checkpoint,
+                    checkpoint_callback=checkpoint_callback,
                 )
 
             case _:
@@ -293,7 +393,110 @@ class AyonShotgridHub:
                     "The `source` argument can only be `ayon` or `shotgrid`."
                 )
 
-    def react_to_shotgrid_event(self, sg_event_meta):
+    @_count_entities_after
+    def react_to_shotgrid_events(self, sg_events_meta, sg_batch_size=100):
+        """React to several events incoming from Shotgrid at once.
+
+        All the events are applied to the AYON EntityHub which is committed a
+        single time at the end, and the AYON IDs written back to Shotgrid are
+        sent through `sg.batch()` calls of `sg_batch_size` requests.
+
+        An event failing half way might leave some of its changes in the
+        EntityHub, so when an event fails the EntityHub is replaced and only
+        the events before it are applied again and committed. The events
+        after it are held back, not applied, and returned as errors too, so
+        the caller can retry the failed event and then apply them, in order.
+        The events are applied again at most once, if that fails too the
+        whole batch is held back.
+
+        Args:
+            sg_events_meta (list[dict]): The `meta` key of the ShotGrid
+                Events, in the order they have to be applied.
+            sg_batch_size (int): Maximum amount of requests per `sg.batch()`.
+
+        Returns:
+            dict[int, Exception]: The errors of the events that failed or
+                were held back, keyed by their index in `sg_events_meta`.
+        """
+        errors = {}
+        if not self._ay_project:
+            self.log.info(
+                f"Ignoring events, AYON project {self.project_name} not found.")
+            return errors
+
+        applied_count = len(sg_events_meta)
+        replays_count = 0
+        while True:
+            sg_events_batch = ShotgridEventsBatch()
+            failed_index = None
+            for index in range(applied_count):
+                sg_events_batch.current_event_index = index
+                try:
+                    self._react_to_shotgrid_event(
+                        sg_events_meta[index], sg_events_batch=sg_events_batch)
+                except Exception as e:
+                    self.log.error(
+                        f"Unable to process event {sg_events_meta[index]}",
+                        exc_info=True
+                    )
+                    errors[index] = e
+                    failed_index = index
+                    break
+
+            if failed_index is None:
+                break
+
+            self.reset_entities_cache()
+            if replays_count:
+                # Events that were applied before failed now, don't keep
+                # replaying the batch
+                applied_count = 0
+            else:
+                applied_count = failed_index
+
+            for index in range(applied_count, len(sg_events_meta)):
+                errors.setdefault(index, Exception(
+                    f"Event held back since event {failed_index} of the "
+                    "batch failed."
+                ))
+
+            if not applied_count:
+                self.log.info(
+                    f"Holding back the {len(sg_events_meta)} events of the "
+                    f"batch after applying it {replays_count + 1} times."
+                )
+                return errors
+
+            replays_count += 1
+            self.log.info(
+                f"Applying again the {applied_count} events before the "
+                f"failed one, {len(errors)} events failed or held back."
+            )
+
+        if replays_count:
+            self.log.info(
+                f"Applied the batch {replays_count + 1} times, committing "
+                f"{applied_count} of its {len(sg_events_meta)} events."
+            )
+
+        try:
+            sg_errors = sg_events_batch.commit(
+                self._ay_project, self._sg, chunk_size=sg_batch_size)
+        except Exception as e:
+            self.log.error("Unable to commit events changes.", exc_info=True)
+            # `commit_changes` isn't atomic, part of the changes might be in
+            # AYON already, so all the events are retried
+            for index in range(len(sg_events_meta)):
+                errors.setdefault(index, e)
+            return errors
+
+        for index, error in sg_errors.items():
+            errors.setdefault(index, error)
+
+        return errors
+
+    @_count_entities_after
+    def react_to_shotgrid_event(self, sg_event_meta, sg_events_batch=None):
         """React to events incoming from Shotgrid
 
         Whenever there's a `shotgrid.event` spawned by the `leecher` of a change
@@ -305,6 +508,17 @@ class AyonShotgridHub:
         Args:
             sg_event_meta (dict): The `meta` key of a ShotGrid Event, describing
                 what the change encompasses, i.e. a new shot, new asset, etc.
+            sg_events_batch (Optional[ShotgridEventsBatch]): If provided, the
+                changes are collected in it instead of being committed.
+        """
+        self._react_to_shotgrid_event(
+            sg_event_meta, sg_events_batch=sg_events_batch)
+
+    def _react_to_shotgrid_event(self, sg_event_meta, sg_events_batch=None):
+        """Same as `react_to_shotgrid_event` without counting the entities.
+
+        Used by `react_to_shotgrid_events` so the EntityHub is only walked
+        once per batch instead of once per event.
         """
         if not self._ay_project:
             self.log.info(
@@ -342,6 +556,7 @@ class AyonShotgridHub:
                         self.sg_enabled_entities,
                         self.sg_project_code_field,
                         self.custom_attribs_map,
+                        sg_events_batch=sg_events_batch,
                     )
 
             case "attribute_change":
@@ -358,6 +573,7 @@ class AyonShotgridHub:
                     self.sg_enabled_entities,
                     self.sg_project_code_field,
                     self.custom_attribs_map,
+                    sg_events_batch=sg_events_batch,
                 )
 
             case "entity_retirement":
@@ -370,13 +586,15 @@ class AyonShotgridHub:
                     sg_event_meta,
                     self._sg,
                     self._ay_project,
-                    self.sg_project_code_field
+                    self.sg_project_code_field,
+                    sg_events_batch=sg_events_batch,
                 )
 
             case _:
                 raise ValueError(
                     f"Unable to process event {sg_event_meta['type']}.")
 
+    @_count_entities_after
     def react_to_ayon_event(self, ayon_event):
         """React to events incoming from AYON
 
@@ -1,5 +1,5 @@
-import collections
 import shotgun_api3
+import collections
 from typing import Dict, List, Union
 
 import ayon_api
@@ -17,10 +17,15 @@ from constants import (
 )
 
 from utils import (
-    get_sg_entities,
+    iter_sg_entities,
     get_sg_entity_parent_field,
     get_sg_entity_as_ay_dict,
-    get_sg_custom_attributes_data
+    get_sg_custom_attributes_data,
+    get_sg_ay_dict_mapped_values,
+    get_mapped_values_hash,
+    get_sg_record_as_ay_dict,
+    send_sg_batch_requests,
+    sg_reference_data,
 )
 
 from utils import get_logger
@@ -36,13 +41,23 @@ def match_ayon_hierarchy_in_shotgrid(
     sg_enabled_entities: List[str],
     project_code_field: str,
     custom_attribs_map: Dict[str, str],
+    sg_batch_size: int = 100,
 ):
     """Replicate an AYON project into Shotgrid.
 
-    This function creates a "deck" which we keep increasing while traversing
-    the AYON project and finding new children, this is more efficient than
-    creating a dictionary with the whole AYON project structure since we
-    `popleft` the elements when processing them.
+    The AYON project is traversed breadth first, one depth level at a time.
+    The Shotgrid entities missing in a level, and the updates of the ones
+    that exist, are sent with `sg.batch()` calls of `sg_batch_size` requests
+    once the whole level is processed, so the children in the next level can
+    point to the entities created for their parents. The records returned by
+    Shotgrid are used as they are instead of querying them again.
+
+    All the Shotgrid records of the run, the project, the queried ones and
+    the created ones, are kept by their type and ID so each of them is read
+    at most once.
+
+    Existing Shotgrid entities are only updated when the hash of their
+    synced attributes differs from the one of the AYON entity.
 
     Args:
         entity_hub (ayon_api.entity_hub.EntityHub): The AYON EntityHub.
@@ -52,199 +67,295 @@ def match_ayon_hierarchy_in_shotgrid(
         sg_enabled_entities (list): List of Shotgrid entities to be enabled.
         custom_attribs_map (dict): Dictionary of extra attributes to
             store in the SG entity.
+        sg_batch_size (int): Maximum amount of requests per `sg.batch()`.
     """
     log.info("Getting AYON entities.")
     entity_hub.query_entities_from_server()
 
+    # The AYON project's direct children are the first level to process
+    sg_ay_project = get_sg_entity_as_ay_dict(
+        sg_session, "Project", sg_project["id"], project_code_field,
+        custom_attribs_map=custom_attribs_map
+    )
+
+    # Shotgrid IDs are only unique within an entity type, the entities are
+    # only looked up by ID alone for AYON entities without a Shotgrid type
     log.info("Getting Shotgrid entities.")
-    sg_ay_dicts, sg_ay_dicts_parents = get_sg_entities(
+    sg_ay_dicts_by_type_id = {_get_sg_type_id(sg_ay_project): sg_ay_project}
+    sg_ay_dicts_by_id = collections.defaultdict(list)
+    for sg_ay_dicts_page in iter_sg_entities(
         sg_session,
         sg_project,
         sg_enabled_entities,
         project_code_field,
         custom_attribs_map,
-    )
-
-    ay_entity_deck = collections.deque()
+    ):
+        for sg_ay_dict in sg_ay_dicts_page:
+            sg_ay_dicts_by_type_id[_get_sg_type_id(sg_ay_dict)] = sg_ay_dict
+            sg_entity_id = sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB]
+            sg_ay_dicts_by_id[sg_entity_id].append(sg_ay_dict)
 
-    # Append the AYON project's direct children into processing queue
-    for ay_entity_child in entity_hub._entities_by_parent_id[
-            entity_hub.project_name]:
-        ay_entity_deck.append((
-            get_sg_entity_as_ay_dict(
-                sg_session, "Project", sg_project["id"], project_code_field,
-                custom_attribs_map=custom_attribs_map
-            ),
-            ay_entity_child
-        ))
+    ay_entities_level = [
+        (sg_ay_project, ay_entity_child)
+        for ay_entity_child in entity_hub._entities_by_parent_id[
+            entity_hub.project_name]
+    ]
 
     ay_project_sync_status = "Synced"
     processed_ids = set()
-    while ay_entity_deck:
-        (sg_ay_parent_entity, ay_entity) = ay_entity_deck.popleft()
-        log.debug(f"Processing entity: '{ay_entity}'")
+    # Existing Shotgrid entities whose synced attributes changed in AYON, and
+    # the ones left untouched
+    updated_sg_entities_count = 0
+    unchanged_sg_entities_count = 0
+    level_index = 0
+    while ay_entities_level:
+        log.debug(
+            f"Processing level {level_index} with "
+            f"{len(ay_entities_level)} entities."
+        )
+        next_ay_entities_level = []
+        # The Shotgrid requests of the level, and for each of them the AYON
+        # entity and the Shotgrid parent and Step of the ones to create
+        sg_batch_requests = []
+        sg_batch_entities = []
 
-        sg_ay_dict = None
+        for sg_ay_parent_entity, ay_entity in ay_entities_level:
+            log.debug(f"Processing entity: '{ay_entity}'")
 
-        # Skip entities that are not tasks or folders
-        if ay_entity.entity_type not in ["task", "folder"]:
-            log.warning(
-                f"Entity '{ay_entity.name}' is not a task or folder, skipping..."
-            )
-            # even the folder is not synced, we need to process its children
-            _add_items_to_queue(
-                entity_hub, ay_entity_deck, ay_entity, sg_ay_parent_entity
-            )
-            continue
+            sg_ay_dict = None
 
-        # only sync folders with type in sg_enabled_entities and tasks
-        if (
-            ay_entity.entity_type == "folder"
-            and ay_entity.folder_type not in sg_enabled_entities
-        ):
-            log.warning(
-                f"Entity '{ay_entity.name}' is not enabled in "
-                "Shotgrid, skipping..."
-            )
-            # even the folder is not synced, we need to process its children
-            _add_items_to_queue(
-                entity_hub, ay_entity_deck, ay_entity, sg_ay_parent_entity
-            )
-            continue
+            # Skip entities that are not tasks or folders
+            if ay_entity.entity_type not in ["task", "folder"]:
+                log.warning(
+                    f"Entity '{ay_entity.name}' is not a task or folder, skipping..."
+                )
+                # even the folder is not synced, we need to process its children
+                _add_items_to_queue(
+                    entity_hub,
+                    next_ay_entities_level,
+                    ay_entity,
+                    sg_ay_parent_entity,
+                )
+                continue
 
-        sg_entity_id = ay_entity.attribs.get(SHOTGRID_ID_ATTRIB, None)
-        sg_entity_type = ay_entity.attribs.get(SHOTGRID_TYPE_ATTRIB, "")
+            # only sync folders with type in sg_enabled_entities and tasks
+            if (
+                ay_entity.entity_type == "folder"
+                and ay_entity.folder_type not in sg_enabled_entities
+            ):
+                log.warning(
+                    f"Entity '{ay_entity.name}' is not enabled in "
+                    "Shotgrid, skipping..."
+                )
+                # even the folder is not synced, we need to process its children
+                _add_items_to_queue(
+                    entity_hub,
+                    next_ay_entities_level,
+                    ay_entity,
+                    sg_ay_parent_entity,
+                )
+                continue
 
-        if sg_entity_id and sg_entity_id == "removed":
-            # if SG entity is removed then it is marked as "removed"
-            log.info(
-                f"Entity '{ay_entity.name}' was removed from "
-                "ShotGrid, skipping..."
-            )
-            continue
-        elif sg_entity_id:
-            # convert sg_entity_id to int if exists
-            sg_entity_id = int(sg_entity_id)
-
-        if sg_entity_type == "AssetCategory":
-            log.warning(
-                f"Entity '{ay_entity.name}' is an AssetCategory, skipping..."
-            )
-            # even the folder is not synced, we need to process its children
-            _add_items_to_queue(
-                entity_hub, ay_entity_deck, ay_entity, sg_ay_parent_entity
-            )
-            continue
-
-        # make sure we don't process the same entity twice
-        if sg_entity_id in processed_ids:
-            msg = (
-                f"Entity {sg_entity_id} already processed, skipping..."
-                f"Sg Ay Dict: {sg_ay_dict} - "
-                f"SG Ay Parent Entity: {sg_ay_parent_entity}"
-            )
-            log.warning(msg)
-            continue
+            sg_entity_id = ay_entity.attribs.get(SHOTGRID_ID_ATTRIB, None)
+            sg_entity_type = ay_entity.attribs.get(SHOTGRID_TYPE_ATTRIB, "")
 
-        # entity was already synced before and we need to update it
-        if sg_entity_id and sg_entity_id in sg_ay_dicts:
-            sg_ay_dict = sg_ay_dicts[sg_entity_id]
-            log.info(
-                f"Entity already exists in Shotgrid {sg_ay_dict['name']}")
+            if sg_entity_id and sg_entity_id == "removed":
+                # if SG entity is removed then it is marked as "removed"
+                log.info(
+                    f"Entity '{ay_entity.name}' was removed from "
+                    "ShotGrid, skipping..."
+                )
+                continue
+            elif sg_entity_id:
+                # convert sg_entity_id to int if exists
+                sg_entity_id = int(sg_entity_id)
 
-            if sg_ay_dict["data"][CUST_FIELD_CODE_ID] != ay_entity.id:
-                # QUESTION: Can this situation even occur?
+            if sg_entity_type == "AssetCategory":
                 log.warning(
-                    "Shotgrid record for AYON id does not match..."
-                    f"SG: {sg_ay_dict['data'][CUST_FIELD_CODE_ID]} - "
-                    f"AYON: {ay_entity.id}"
+                    f"Entity '{ay_entity.name}' is an AssetCategory, skipping..."
+                )
+                # even the folder is not synced, we need to process its children
+                _add_items_to_queue(
+                    entity_hub,
+                    next_ay_entities_level,
+                    ay_entity,
+                    sg_ay_parent_entity,
+                )
+                continue
+
+            # make sure we don't process the same entity twice
+            if (sg_entity_type, sg_entity_id) in processed_ids:
+                msg = (
+                    f"Entity {sg_entity_id} already processed, skipping..."
+                    f"Sg Ay Dict: {sg_ay_dict} - "
+                    f"SG Ay Parent Entity: {sg_ay_parent_entity}"
                 )
-                try:
+                log.warning(msg)
+                continue
+
+            # entity was already synced before and we need to update it
+            if sg_entity_id and sg_entity_type:
+                sg_ay_dict = sg_ay_dicts_by_type_id.get(
+                    (sg_entity_type, sg_entity_id))
+            elif sg_entity_id:
+                sg_ay_dicts_with_id = sg_ay_dicts_by_id.get(sg_entity_id, [])
+                if len(sg_ay_dicts_with_id) == 1:
+                    sg_ay_dict = sg_ay_dicts_with_id[0]
+
+            if sg_ay_dict:
+                log.info(
+                    f"Entity already exists in Shotgrid {sg_ay_dict['name']}")
+
+                if sg_ay_dict["data"][CUST_FIELD_CODE_ID] != ay_entity.id:
+                    # QUESTION: Can this situation even occur?
+                    log.warning(
+                        "Shotgrid record for AYON id does not match..."
+                        f"SG: {sg_ay_dict['data'][CUST_FIELD_CODE_ID]} - "
+                        f"AYON: {ay_entity.id}"
+                    )
                     log.info("Updating SG entity with AYON id...")
-                    sg_session.update(
-                        sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB],
-                        sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB],
-                        {
+                    sg_batch_requests.append({
+                        "request_type": "update",
+                        "entity_type": sg_ay_dict["attribs"][
+                            SHOTGRID_TYPE_ATTRIB],
+                        "entity_id": sg_ay_dict["attribs"][
+                            SHOTGRID_ID_ATTRIB],
+                        "data": {
                             CUST_FIELD_CODE_ID: ay_entity.id,
                             CUST_FIELD_CODE_SYNC: "Synced",
                         },
-                    )
-                except Exception:
-                    log.error(
-                        f"Unable to update SG entity {sg_ay_dict['name']}",
-                        exc_info=True
-                    )
-                    ay_project_sync_status = "Failed"
-
-            # Update SG entity custom attributes with AYON data
-            data_to_update = get_sg_custom_attributes_data(
-                sg_session,
-                ay_entity.attribs.to_dict(),
-                sg_entity_type,
-                custom_attribs_map
-            )
-            if data_to_update:
-                try:
-                    log.info("Updating SG entity custom attributes '%s'...", data_to_update)
-                    sg_session.update(
+                    })
+                    sg_batch_entities.append((ay_entity, None, None))
+
+                # Update SG entity custom attributes with AYON data, unless
+                # they already have the same values
+                ay_attribs = ay_entity.attribs.to_dict()
+                ay_mapped_values = {
+                    ay_attrib: ay_attribs[ay_attrib]
+                    for ay_attrib in custom_attribs_map
+                    if ay_attribs.get(ay_attrib) is not None
+                }
+                sg_mapped_values = get_sg_ay_dict_mapped_values(
+                    sg_ay_dict,
+                    {
+                        ay_attrib: custom_attribs_map[ay_attrib]
+                        for ay_attrib in ay_mapped_values
+                    },
+                )
+                data_to_update = None
+                if (
+                    get_mapped_values_hash(ay_mapped_values)
+                    == get_mapped_values_hash(sg_mapped_values)
+                ):
+                    unchanged_sg_entities_count += 1
+                else:
+                    data_to_update = get_sg_custom_attributes_data(
+                        sg_session,
+                        ay_attribs,
                         sg_entity_type,
-                        sg_entity_id,
-                        data_to_update
+                        custom_attribs_map
                     )
-                except Exception as e:
+                if data_to_update:
+                    updated_sg_entities_count += 1
+                    log.info("Updating SG entity custom attributes '%s'...", data_to_update)
+                    sg_batch_requests.append({
+                        "request_type": "update",
+                        "entity_type": sg_entity_type,
+                        "entity_id": sg_entity_id,
+                        "data": data_to_update,
+                    })
+                    sg_batch_entities.append((ay_entity, None, None))
+
+            # entity was not synced before and need to be created
+            # We only create new entities for Folders/Tasks entities
+            # For Version entities we only try update the status if it already exists
+            # Entities already linked to a Shotgrid entity are never created
+            # again, even if it isn't found
+            if sg_entity_type != "Version" and not sg_entity_id:
+                sg_parent_entity = {
+                    "type": sg_ay_parent_entity["attribs"][SHOTGRID_TYPE_ATTRIB],
+                    "id": sg_ay_parent_entity["attribs"][SHOTGRID_ID_ATTRIB],
+                }
+                sg_create_request, sg_step_name = _get_sg_create_request(
+                    ay_entity,
+                    sg_session,
+                    sg_project,
+                    sg_parent_entity,
+                    sg_enabled_entities,
+                    custom_attribs_map,
+                )
+                if not sg_create_request:
+                    log.error(f"Unable to create entity in SG from AYON entity: {ay_entity}")
+                    continue
+                sg_batch_requests.append(sg_create_request)
+                sg_batch_entities.append(
+                    (ay_entity, sg_parent_entity, sg_step_name))
+                continue
+
+            if not sg_ay_dict:
+                log.warning(
+                    f"Shotgrid entity {sg_entity_type} <{sg_entity_id}> of "
+                    f"AYON entity {ay_entity} not found in SG, ignoring it"
+                )
+                continue
+
+            _set_sg_entity_in_ay_entity(ay_entity, sg_ay_dict)
+
+            # add processed entity to the set for duplicity tracking
+            processed_ids.add(_get_sg_type_id(sg_ay_dict))
+
+            _add_items_to_queue(
+                entity_hub, next_ay_entities_level, ay_entity, sg_ay_dict)
+
+        sg_results, sg_errors = send_sg_batch_requests(
+            sg_session, sg_batch_requests, chunk_size=sg_batch_size)
+
+        for index, sg_request in enumerate(sg_batch_requests):
+            ay_entity, sg_parent_entity, sg_step_name = (
+                sg_batch_entities[index])
+            error = sg_errors.get(index)
+
+            if sg_request["request_type"] == "update":
+                if error is not None:
                     log.error(
-                        f"Unable to update SG entity {sg_ay_dict['name']} custom attributes: {e}",
-                        exc_info=True
+                        f"Unable to update SG entity {sg_request['entity_type']} "
+                        f"<{sg_request['entity_id']}> of AYON entity "
+                        f"{ay_entity.name}: {error}"
                     )
                     ay_project_sync_status = "Failed"
+                continue
 
-        # entity was not synced before and need to be created
-        # We only create new entities for Folders/Tasks entities
-        # For Version entities we only try update the status if it already exists
-        if sg_entity_type != "Version" and (not sg_entity_id or not sg_ay_dict):
-            sg_parent_entity = sg_session.find_one(
-                sg_ay_parent_entity["attribs"][SHOTGRID_TYPE_ATTRIB],
-                filters=[[
-                    "id",
-                    "is",
-                    sg_ay_parent_entity["attribs"][SHOTGRID_ID_ATTRIB]
-                ]]
-            )
-            sg_ay_dict = _create_new_entity(
-                ay_entity,
-                sg_session,
-                sg_project,
-                sg_parent_entity,
-                sg_enabled_entities,
-                project_code_field,
-                custom_attribs_map,
-            )
-            if not sg_ay_dict:
+            if error is not None:
+                log.error(
+                    f"Unable to create SG entity {sg_request['entity_type']} "
+                    f"with data: {sg_request['data']} -> {error}"
+                )
                 log.error(f"Unable to create entity in SG from AYON entity: {ay_entity}")
                 continue
-            sg_entity_id = sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB]
-            sg_ay_dicts[sg_entity_id] = sg_ay_dict
-            sg_ay_dicts_parents[sg_parent_entity["id"]].add(sg_entity_id)
 
-        if not sg_ay_dict:
-            log.warning(f"AYON entity {ay_entity} not found in SG, ignoring it")
-            continue
+            # The created record only has the fields we sent
+            sg_entity = dict(sg_request["data"], **sg_results[index])
+            if sg_step_name:
+                sg_entity["step"] = dict(sg_entity["step"], name=sg_step_name)
 
-        # add Shotgrid ID and type to AYON entity
-        ay_entity.attribs.set(
-            SHOTGRID_ID_ATTRIB,
-            sg_entity_id
-        )
+            sg_ay_dict = get_sg_record_as_ay_dict(
+                sg_entity, project_code_field, custom_attribs_map)
+            sg_ay_dicts_by_type_id[_get_sg_type_id(sg_ay_dict)] = sg_ay_dict
 
-        ay_entity.attribs.set(
-            SHOTGRID_TYPE_ATTRIB,
-            sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB]
-        )
+            _set_sg_entity_in_ay_entity(ay_entity, sg_ay_dict)
+            processed_ids.add(_get_sg_type_id(sg_ay_dict))
+            _add_items_to_queue(
+                entity_hub, next_ay_entities_level, ay_entity, sg_ay_dict)
 
-        # add processed entity to the set for duplicity tracking
-        processed_ids.add(sg_entity_id)
+        ay_entities_level = next_ay_entities_level
+        level_index += 1
 
-        _add_items_to_queue(entity_hub, ay_entity_deck, ay_entity, sg_ay_dict)
+    log.info(
+        "Processed entities successfully!. "
+        f"Amount of entities: {len(processed_ids)} "
+        f"(updated in Shotgrid: {updated_sg_entities_count}, "
+        f"unchanged: {unchanged_sg_entities_count})"
+    )
 
     try:
         # committing changes on project children
@@ -283,65 +394,94 @@ def match_ayon_hierarchy_in_shotgrid(
     entity_hub.commit_changes()
 
 
+def _get_sg_type_id(sg_ay_dict: Dict):
+    """Get the Shotgrid type and ID of a Shotgrid AYON entity dictionary."""
+    return (
+        sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB],
+        sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB],
+    )
+
+
+def _set_sg_entity_in_ay_entity(
+    ay_entity: Union[TaskEntity, FolderEntity],
+    sg_ay_dict: Dict
+):
+    """Add the Shotgrid ID and type to an AYON entity."""
+    ay_entity.attribs.set(
+        SHOTGRID_ID_ATTRIB,
+        sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB]
+    )
+
+    ay_entity.attribs.set(
+        SHOTGRID_TYPE_ATTRIB,
+        sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB]
+    )
+
+
 def _add_items_to_queue(
     entity_hub: ayon_api.entity_hub.EntityHub,
-    ay_entity_deck: collections.deque,
+    ay_entities_level: List,
     ay_entity: Union[TaskEntity, FolderEntity],
     sg_ay_dict: Dict
 ):
-    """Helper method to add children of an entity to the processing queue.
+    """Helper method to add children of an entity to the next level to process.
 
     Args:
         entity_hub (ayon_api.entity_hub.EntityHub): The AYON EntityHub.
-        ay_entity_deck (collections.deque): The AYON entity deck.
+        ay_entities_level (list): The AYON entities of the next level.
         ay_entity (Union[TaskEntity, FolderEntity]): The AYON entity.
         sg_ay_dict (Dict): The Shotgrid AYON entity dictionary.
     """
     for ay_entity_child in entity_hub._entities_by_parent_id.get(
                 ay_entity.id, []
             ):
-        ay_entity_deck.append((sg_ay_dict, ay_entity_child))
+        ay_entities_level.append((sg_ay_dict, ay_entity_child))
 
 
-def _create_new_entity(
+def _get_sg_create_request(
     ay_entity: Union[ProjectEntity, TaskEntity, FolderEntity],
     sg_session: shotgun_api3.Shotgun,
     sg_project: Dict,
     sg_parent_entity: Dict,
     sg_enabled_entities: List[str],
-    project_code_field: str,
     custom_attribs_map: Dict[str, str],
 ):
-    """Helper method to create entities in Shotgrid.
+    """Helper method to prepare the creation of entities in Shotgrid.
 
     Args:
-        sg_session (shotgun_api3.Shotgun): The Shotgrid API session.
         ay_entity (dict): The AYON entity.
+        sg_session (shotgun_api3.Shotgun): The Shotgrid API session.
         sg_project (dict): The Shotgrid Project.
-        sg_type (str): The Shotgrid type of the new entity.
+        sg_parent_entity (dict): The Shotgrid parent entity.
         sg_enabled_entities (list): List of Shotgrid entities to be enabled.
-        project_code_field (str): The Shotgrid project code field.
         custom_attribs_map (dict): Dictionary of extra attributes to store in the SG entity.
+
+    Returns:
+        tuple(
+            sg_create_request (Optional[dict]): The `sg.batch()` request,
+                None if the entity can't be created.
+            sg_step_name (Optional[str]): Name of the Step of a Task, which
+                isn't part of the record returned by Shotgrid.
+        )
     """
+    sg_step_name = None
+
     # Task creation
     if ay_entity.entity_type == "task":
-        step_query_filters = [["code", "is", ay_entity.task_type]]
-
+        step_filters = {}
         if sg_parent_entity["type"] in ["Asset", "Shot", "Episode", "Sequence"]:
-            step_query_filters.append(
-                ["entity_type", "is", sg_parent_entity["type"]]
-            )
+            step_filters["entity_type"] = sg_parent_entity["type"]
 
-        task_step = sg_session.find_one(
-            "Step",
-            filters=step_query_filters,
-        )
+        task_step = sg_reference_data.find(
+            sg_session, "Step", ay_entity.task_type, **step_filters)
         if not task_step:
             log.error(
                 f"Unable to create Task {ay_entity.task_type} {ay_entity}\n"
                 f"-> Shotgrid is missing Pipeline Step {ay_entity.task_type}"
             )
-            return
+            return None, None
+        sg_step_name = task_step["code"]
+        task_step = {"type": "Step", "id": task_step["id"]}
 
         sg_type = "Task"
         data = {
@@ -410,17 +550,9 @@ def _create_new_entity(
         custom_attribs_map
     )
 
-    try:
-        sg_entity = sg_session.create(sg_type, data)
-    except Exception as e:
-        log.error(
-            f"Unable to create SG entity {sg_type} with data: {data} -> {e}")
-        return None
-
-    return get_sg_entity_as_ay_dict(
-        sg_session,
-        sg_entity["type"],
-        sg_entity["id"],
-        project_code_field,
-        custom_attribs_map=custom_attribs_map
-    )
+    sg_create_request = {
+        "request_type": "create",
+        "entity_type": sg_type,
+        "data": data,
+    }
+    return sg_create_request, sg_step_name
@@ -1,7 +1,8 @@
 import collections
 import random
+from datetime import datetime
 import shotgun_api3
-from typing import Dict, List, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import ayon_api
 from ayon_api.entity_hub import (
@@ -15,17 +16,33 @@ from constants import (
     CUST_FIELD_CODE_ID,
     CUST_FIELD_CODE_SYNC,
     SHOTGRID_ID_ATTRIB,
+    SHOTGRID_SYNC_WATERMARK_DATA,
     SHOTGRID_TYPE_ATTRIB,
 )
 
 from utils import (
+    AyonEntitiesIndex,
+    count_sg_entities,
     get_sg_entities,
+    iter_sg_entities,
+    get_sg_project_enabled_entities,
     get_asset_category,
+    send_sg_batch_requests,
     update_ay_entity_custom_attributes,
+    get_sg_ay_dict_mapped_values,
+    get_ay_entity_mapped_values,
+    get_mapped_values_hash,
+    get_ay_status_name,
+    SG_PREFETCHED_PAGES,
 )
 
 from utils import get_logger
 
+from .update_from_shotgrid import (
+    ShotgridEventsBatch,
+    remove_ayon_entity_from_sg_event,
+)
+
 
 log = get_logger(__file__)
 
@@ -36,47 +53,220 @@ def match_shotgrid_hierarchy_in_ayon(
     sg_session: shotgun_api3.Shotgun,
     sg_enabled_entities: List[str],
     project_code_field: str,
-    custom_attribs_map: Dict[str, str]
-):
+    custom_attribs_map: Dict[str, str],
+    sg_batch_size: int = 100,
+    ay_prefetch_max_entities: int = 50000,
+    incremental: bool = False,
+    commit_chunk_size: int = 0,
+    sync_checkpoint: Optional[Dict] = None,
+    checkpoint_callback: Optional[Callable[[Dict], None]] = None,
+) -> str:
     """Replicate a Shotgrid project into AYON.
 
-    This function creates a "deck" which we keep increasing while traversing
-    the Shotgrid project and finding new children, this is more efficient than
-    creating a dictionary with the while Shotgrid project structure since we
-    `popleft` the elements when processing them.
+    The Shotgrid project is traversed breadth first with a "deck", see
+    `_iter_sg_ay_dicts_breadth_first`, which is more efficient than creating
+    a dictionary with the while Shotgrid project structure.
+
+    The AYON IDs and sync statuses to write back to Shotgrid are collected
+    while traversing and sent through `sg.batch()` once the AYON changes
+    are committed. The synced attributes of existing AYON entities are only
+    updated when their hash differs from the one of the Shotgrid entity.
+
+    The whole AYON project is loaded at once before matching the entities,
+    unless the Shotgrid project has more than `ay_prefetch_max_entities`
+    entities, in which case the AYON entities are loaded along the
+    traversal, with a query for the children of each parent, and the
+    Shotgrid entities are streamed page by page, parents first, so they are
+    matched while the next pages download, with at most
+    `SG_PREFETCHED_PAGES` pages of each entity type in memory.
+
+    Every successful sync stores in the AYON project data the time and the
+    ID of the last Shotgrid event when it started. An `incremental` sync
+    only queries the Shotgrid entities updated after that time, matches the
+    subtrees under them, and removes the entities retired after that event.
+    If there's no previous sync, or the parent of an updated entity can't
+    be found in AYON, the whole project is synced instead.
+
+    With a `commit_chunk_size`, the changes are committed every time that
+    many entities are processed, parents always before their children, and
+    `checkpoint_callback` gets the Shotgrid IDs processed so far. Passing
+    that checkpoint back as `sync_checkpoint` resumes the sync, the entities
+    in it are only matched to reach their children.
 
     Args:
         entity_hub (ayon_api.entity_hub.EntityHub): The AYON EntityHub.
         sg_project (dict): The Shotgrid project.
         sg_project (shotgun_api3.Shotgun): The Shotgrid session.
         project_code_field (str): The Shotgrid project code field.
+        sg_batch_size (int): Maximum amount of requests per `sg.batch()`.
+        ay_prefetch_max_entities (int): Maximum amount of Shotgrid entities
+            for which the whole AYON project is loaded at once.
+        incremental (bool): Only sync what changed since the last sync.
+        commit_chunk_size (int): Amount of entities per commit, 0 to commit
+            everything at the end.
+        sync_checkpoint (Optional[dict]): Checkpoint of a previous attempt
+            of this sync to resume from.
+        checkpoint_callback (Optional[Callable[[dict], None]]): Called with
+            the checkpoint after each chunk is committed.
+
+    Returns:
+        str: The sync status of the project, "Synced" or "Failed".
     """
-    log.info("Getting Shotgrid entities.")
-    sg_ay_dicts, sg_ay_dicts_parents = get_sg_entities(
-        sg_session,
-        sg_project,
-        sg_enabled_entities,
-        project_code_field,
-        custom_attribs_map,
+    sync_checkpoint = sync_checkpoint or {}
+    # Shotgrid IDs are only unique within an entity type, the checkpoint
+    # stores [type, ID] pairs since it goes through JSON
+    checkpoint_sg_ids = {
+        tuple(sg_type_id)
+        for sg_type_id in sync_checkpoint.get("processed_sg_ids", [])
+    }
+    if checkpoint_sg_ids:
+        log.info(
+            f"Resuming sync after {len(checkpoint_sg_ids)} processed entities.")
+
+    # Entities updated while we sync are picked up by the next one, when
+    # resuming that's since the first attempt
+    new_sg_sync_watermark = (
+        sync_checkpoint.get("sg_sync_watermark")
+        or _get_sg_sync_watermark(sg_session)
     )
 
-    sg_ay_dicts_deck = collections.deque()
+    sg_sync_watermark = None
+    if incremental:
+        sg_sync_watermark = entity_hub.project_entity.data.get(
+            SHOTGRID_SYNC_WATERMARK_DATA)
+        if not sg_sync_watermark:
+            log.info("Project was never synced, syncing the whole project.")
+
+    sg_ay_dicts_roots = None
+    if sg_sync_watermark:
+        sg_updated_after = datetime.fromisoformat(
+            sg_sync_watermark["updated_at"])
+        log.info(f"Getting Shotgrid entities updated after {sg_updated_after}.")
+        sg_ay_dicts, sg_ay_dicts_parents = get_sg_entities(
+            sg_session,
+            sg_project,
+            sg_enabled_entities,
+            project_code_field,
+            custom_attribs_map,
+            updated_after=sg_updated_after,
+        )
+        sg_ay_dicts_roots = _get_updated_sg_ay_dicts_roots(
+            entity_hub,
+            sg_session,
+            sg_project,
+            sg_ay_dicts,
+            sg_ay_dicts_parents,
+        )
+        if sg_ay_dicts_roots is None:
+            log.warning(
+                "Some updated Shotgrid entities have parents that aren't in "
+                "AYON, syncing the whole project."
+            )
+            sg_sync_watermark = None
+
+    # The AYON entity matched to each Shotgrid entity, by type and ID, so
+    # their children can be matched under it
+    ay_entities_by_sg_type_id = {
+        ("Project", sg_project["id"]): entity_hub.project_entity
+    }
+
+    # Answer all the lookups from memory instead of querying each entity,
+    # unless only a few entities changed or the project is too big, then
+    # the Shotgrid entities are streamed too
+    prefetch_ay_entities = False
+    if sg_ay_dicts_roots is None:
+        sg_entities_count = count_sg_entities(
+            sg_session, sg_project, sg_enabled_entities)
+        prefetch_ay_entities = sg_entities_count <= ay_prefetch_max_entities
+
+    if sg_ay_dicts_roots is None and not prefetch_ay_entities:
+        log.info(
+            f"Shotgrid project has {sg_entities_count} entities, streaming "
+            "them and getting AYON entities along the hierarchy."
+        )
+        sg_ay_dicts_items = _iter_streamed_sg_ay_dicts(
+            iter_sg_entities(
+                sg_session,
+                sg_project,
+                sg_enabled_entities,
+                project_code_field,
+                custom_attribs_map,
+                max_prefetched_pages=SG_PREFETCHED_PAGES,
+            ),
+            ay_entities_by_sg_type_id,
+        )
+    else:
+        if sg_ay_dicts_roots is None:
+            log.info("Getting Shotgrid entities.")
+            sg_ay_dicts, sg_ay_dicts_parents = get_sg_entities(
+                sg_session,
+                sg_project,
+                sg_enabled_entities,
+                project_code_field,
+                custom_attribs_map,
+            )
+            # Append the project's direct children.
+            sg_ay_dicts_roots = [
+                (entity_hub.project_entity, sg_ay_dict_child_key)
+                for sg_ay_dict_child_key in sg_ay_dicts_parents[
+                    ("Project", sg_project["id"])]
+            ]
 
-    # Append the project's direct children.
-    for sg_ay_dict_child_id in sg_ay_dicts_parents[sg_project["id"]]:
-        sg_ay_dicts_deck.append(
-            (entity_hub.project_entity, sg_ay_dict_child_id)
+        sg_ay_dicts_items = _iter_sg_ay_dicts_breadth_first(
+            sg_ay_dicts,
+            sg_ay_dicts_parents,
+            sg_ay_dicts_roots,
+            ay_entities_by_sg_type_id,
         )
 
-    sg_project_sync_status = "Synced"
+    if prefetch_ay_entities:
+        log.info("Getting AYON entities.")
+        entity_hub.query_entities_from_server()
+
+    ay_entities_index = AyonEntitiesIndex(entity_hub)
+
+    sg_project_sync_status = sync_checkpoint.get("sync_status", "Synced")
     processed_ids = set()
+    # Shotgrid updates to send once all the entities are processed, and the
+    # AYON entity each of them belongs to
+    sg_batch_requests = []
+    sg_batch_ay_entities = []
+    # Existing entities whose synced attributes changed in Shotgrid, and the
+    # ones left untouched
+    updated_ay_entities_count = 0
+    unchanged_ay_entities_count = 0
+    updated_sg_entities_count = 0
+    chunk_entities_count = 0
+
+    for ay_parent_entity, sg_ay_dict in sg_ay_dicts_items:
+        if commit_chunk_size and chunk_entities_count >= commit_chunk_size:
+            log.info(f"Committing a chunk of {chunk_entities_count} entities.")
+            if not _commit_sync_chunk(
+                entity_hub,
+                sg_session,
+                sg_batch_requests,
+                sg_batch_ay_entities,
+                sg_batch_size,
+            ):
+                sg_project_sync_status = "Failed"
+            updated_sg_entities_count += len(sg_batch_requests)
+            sg_batch_requests = []
+            sg_batch_ay_entities = []
+            chunk_entities_count = 0
+
+            if checkpoint_callback is not None:
+                checkpoint_callback({
+                    "processed_sg_ids": [
+                        list(sg_type_id)
+                        for sg_type_id in sorted(processed_ids, key=str)
+                    ],
+                    "sg_sync_watermark": new_sg_sync_watermark,
+                    "sync_status": sg_project_sync_status,
+                })
 
-    while sg_ay_dicts_deck:
-        log.debug(f"Deck size: {len(sg_ay_dicts_deck)}")
-        (ay_parent_entity, sg_ay_dict_child_id) = sg_ay_dicts_deck.popleft()
-        sg_ay_dict = sg_ay_dicts[sg_ay_dict_child_id]
         sg_entity_id = sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB]
-        if sg_entity_id in processed_ids:
+        sg_type_id = _get_sg_type_id(sg_ay_dict)
+        if sg_type_id in processed_ids:
             msg = (
                 f"Entity {sg_entity_id} already processed, skipping..."
                 f"Sg Ay Dict: {sg_ay_dict} - "
@@ -85,25 +275,39 @@ def match_shotgrid_hierarchy_in_ayon(
             log.warning(msg)
             continue
 
-        processed_ids.add(sg_entity_id)
+        processed_ids.add(sg_type_id)
 
         ay_entity = None
         sg_entity_sync_status = "Synced"
 
+        # Load all the siblings with a single query
+        if not prefetch_ay_entities:
+            ay_entities_index.load_children(ay_parent_entity)
+
         ay_id = sg_ay_dict["data"].get(CUST_FIELD_CODE_ID)
         if ay_id:
             ay_entity = entity_hub.get_or_query_entity_by_id(
                 ay_id, [sg_ay_dict["type"]])
 
-        # If we haven't found the ay_entity by its id, check by its name
-        # to avoid creating duplicates and erroring out
+        # If we haven't found the ay_entity by its id, check by the ShotGrid
+        # entity it was synced with, or by its name, to avoid creating
+        # duplicates and erroring out
+        if ay_entity is None:
+            ay_entity = ay_entities_index.get_entity_by_sg_id(
+                sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB], sg_entity_id)
+
         if ay_entity is None:
             # Use min_length=0 so names like '_edit_shot' don't become 'edit_shot'
             name = slugify_string(sg_ay_dict["name"], min_length=0)
-            for child in ay_parent_entity.children:
-                if child.name.lower() == name.lower():
-                    ay_entity = child
-                    break
+            ay_entity = ay_entities_index.get_child_by_name(
+                ay_parent_entity, name)
+
+        # Synced by a previous attempt, we only need it to reach its children
+        if ay_entity is not None and sg_type_id in checkpoint_sg_ids:
+            ay_entities_by_sg_type_id[sg_type_id] = ay_entity
+            continue
+
+        chunk_entities_count += 1
 
         # If we couldn't find it we create it.
         if ay_entity is None:
@@ -111,7 +315,8 @@ def match_shotgrid_hierarchy_in_ayon(
                 ay_entity = get_asset_category(
                     entity_hub,
                     ay_parent_entity,
-                    sg_ay_dict
+                    sg_ay_dict,
+                    ay_entities_index=ay_entities_index,
                 )
 
             # We only create new entities for Folders/Tasks entities
@@ -123,6 +328,8 @@ def match_shotgrid_hierarchy_in_ayon(
                     ay_parent_entity,
                     sg_ay_dict
                 )
+                if ay_entity:
+                    ay_entities_index.add(ay_entity)
         else:
             ay_sg_id_attrib = ay_entity.attribs.get(
                 SHOTGRID_ID_ATTRIB
@@ -135,9 +342,11 @@ def match_shotgrid_hierarchy_in_ayon(
                     "Entity '%s' parent (%s) is different than in Flow (%s), reparenting it.",
                     ay_entity.name, ay_entity.parent.name, ay_parent_entity.name
                 )
+                old_parent_id = ay_entity.parent_id
                 entity_hub.set_entity_parent(
-                    ay_entity.id, ay_parent_entity.id, ay_entity.parent_id
+                    ay_entity.id, ay_parent_entity.id, old_parent_id
                 )
+                ay_entities_index.set_parent(ay_entity, old_parent_id)
 
             # If the ShotGrid ID in AYON doesn't match the one in ShotGrid
             if str(ay_sg_id_attrib) != str(sg_entity_id):  # noqa
@@ -149,16 +358,28 @@ def match_shotgrid_hierarchy_in_ayon(
                 sg_entity_sync_status = "Failed"
                 sg_project_sync_status = "Failed"
             else:
-                log.debug(
-                    "Updating ayon %s '%s' custom attributes: %s",
-                    ay_entity.entity_type, ay_entity.name, sg_ay_dict
-                )
-                update_ay_entity_custom_attributes(
-                    ay_entity,
-                    sg_ay_dict,
-                    custom_attribs_map,
-                    ay_project=entity_hub.project_entity
-                )
+                sg_mapped_values = get_sg_ay_dict_mapped_values(
+                    sg_ay_dict, custom_attribs_map, entity_hub.project_entity)
+                ay_mapped_values = get_ay_entity_mapped_values(
+                    ay_entity, list(sg_mapped_values))
+
+                if (
+                    get_mapped_values_hash(sg_mapped_values)
+                    == get_mapped_values_hash(ay_mapped_values)
+                ):
+                    unchanged_ay_entities_count += 1
+                else:
+                    log.debug(
+                        "Updating ayon %s '%s' custom attributes: %s",
+                        ay_entity.entity_type, ay_entity.name, sg_ay_dict
+                    )
+                    update_ay_entity_custom_attributes(
+                        ay_entity,
+                        sg_ay_dict,
+                        custom_attribs_map,
+                        ay_project=entity_hub.project_entity
+                    )
+                    updated_ay_entities_count += 1
 
         # skip if no ay_entity is found
         # perhaps due Task with project entity as parent
@@ -168,7 +389,6 @@ def match_shotgrid_hierarchy_in_ayon(
 
         # Update SG entity with new created data
         sg_ay_dict["data"][CUST_FIELD_CODE_ID] = ay_entity.id
-        sg_ay_dicts[sg_entity_id] = sg_ay_dict
 
         # If the entity is not a "Folder" or "AssetCategory" we update the
         # entity ID and sync status in Shotgrid and AYON
@@ -177,7 +397,7 @@ def match_shotgrid_hierarchy_in_ayon(
                 "Folder", "AssetCategory"
             ]
             and (
-                sg_ay_dict["data"][CUST_FIELD_CODE_ID] != ay_entity.id
+                ay_id != ay_entity.id
                 or sg_ay_dict["data"][CUST_FIELD_CODE_SYNC] != sg_entity_sync_status  # noqa
             )
         ):
@@ -188,28 +408,44 @@ def match_shotgrid_hierarchy_in_ayon(
                 CUST_FIELD_CODE_SYNC: sg_entity_sync_status
             }
             # Update Shotgrid entity with Ayon ID and sync status
-            sg_session.update(
-                sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB],
-                sg_entity_id,
-                update_data
-            )
+            sg_batch_requests.append({
+                "request_type": "update",
+                "entity_type": sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB],
+                "entity_id": sg_entity_id,
+                "data": update_data,
+            })
+            sg_batch_ay_entities.append(ay_entity)
             ay_entity.data.update(update_data)
 
-        # If the entity has children, add it to the deck
-        for sg_child_id in sg_ay_dicts_parents.get(sg_entity_id, []):
-            log.debug("Adding child entities from ayon entity %s -> %s", ay_entity.name, sg_child_id)
-            sg_ay_dicts_deck.append((ay_entity, sg_child_id))
+        # Its children are matched under it
+        ay_entities_by_sg_type_id[_get_sg_type_id(sg_ay_dict)] = ay_entity
+
+    if sg_sync_watermark:
+        _remove_retired_entities(
+            entity_hub,
+            sg_session,
+            sg_project,
+            sg_enabled_entities,
+            project_code_field,
+            sg_sync_watermark["event_id"],
+        )
 
-    try:
-        entity_hub.commit_changes()
-    except Exception as e:
-        msg = "Unable to commit all entities to AYON!"
-        log.error(msg, exc_info=True)
-        raise Exception(msg) from e
+    if not _commit_sync_chunk(
+        entity_hub,
+        sg_session,
+        sg_batch_requests,
+        sg_batch_ay_entities,
+        sg_batch_size,
+    ):
+        sg_project_sync_status = "Failed"
+    updated_sg_entities_count += len(sg_batch_requests)
 
     log.info(
         "Processed entities successfully!. "
-        f"Amount of entities: {len(processed_ids)}"
+        f"Amount of entities: {len(processed_ids)} "
+        f"(updated in AYON: {updated_ay_entities_count}, "
+        f"unchanged: {unchanged_ay_entities_count}, "
+        f"updated in Shotgrid: {updated_sg_entities_count})"
     )
     # Sync project attributes from Shotgrid to AYON
     entity_hub.project_entity.attribs.set(
@@ -237,6 +473,10 @@ def match_shotgrid_hierarchy_in_ayon(
             attrib_value
         )
 
+    if sg_project_sync_status == "Synced" and new_sg_sync_watermark:
+        entity_hub.project_entity.data[SHOTGRID_SYNC_WATERMARK_DATA] = (
+            new_sg_sync_watermark)
+
     entity_hub.commit_changes()
 
     # Update Shotgrid project with Ayon ID and sync status
@@ -249,6 +489,271 @@ def match_shotgrid_hierarchy_in_ayon(
         }
     )
 
+    return sg_project_sync_status
+
+
+def _get_sg_type_id(sg_ay_dict: Dict):
+    """Get the Shotgrid type and ID of a Shotgrid AYON entity dictionary."""
+    return (
+        sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB],
+        sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB],
+    )
+
+
+def _iter_sg_ay_dicts_breadth_first(
+    sg_ay_dicts: Dict,
+    sg_ay_dicts_parents: Dict,
+    sg_ay_dicts_roots: List,
+    ay_entities_by_sg_type_id: Dict,
+):
+    """Traverse the Shotgrid entities breadth first from the given roots.
+
+    This creates a "deck" which we keep increasing while traversing the
+    Shotgrid project and finding new children, we `popleft` the elements
+    when processing them. The children of an entity are only added once it
+    is matched to an AYON entity in `ay_entities_by_sg_type_id`.
+
+    Yields:
+        tuple[Union[ProjectEntity, FolderEntity], dict]: The AYON parent
+            entity and the Shotgrid entity to match under it.
+    """
+    sg_ay_dicts_deck = collections.deque(sg_ay_dicts_roots)
+    while sg_ay_dicts_deck:
+        log.debug(f"Deck size: {len(sg_ay_dicts_deck)}")
+        (ay_parent_entity, sg_ay_dict_child_key) = sg_ay_dicts_deck.popleft()
+        sg_ay_dict = sg_ay_dicts[sg_ay_dict_child_key]
+        yield ay_parent_entity, sg_ay_dict
+
+        sg_type_id = _get_sg_type_id(sg_ay_dict)
+        ay_entity = ay_entities_by_sg_type_id.get(sg_type_id)
+        if ay_entity is None:
+            continue
+
+        # If the entity has children, add it to the deck
+        for sg_child_key in sg_ay_dicts_parents.get(sg_type_id, []):
+            log.debug("Adding child entities from ayon entity %s -> %s", ay_entity.name, sg_child_key)
+            sg_ay_dicts_deck.append((ay_entity, sg_child_key))
+
+
+def _iter_streamed_sg_ay_dicts(
+    sg_ay_dicts_pages,
+    ay_entities_by_sg_type_id: Dict,
+):
+    """Match the Shotgrid entities as they are streamed by pages.
+
+    Parents come before their children in the stream, so by the time an
+    entity comes its parent is already in `ay_entities_by_sg_type_id`,
+    unless it couldn't be matched.
+
+    Yields:
+        tuple[Union[ProjectEntity, FolderEntity], dict]: The AYON parent
+            entity and the Shotgrid entity to match under it.
+    """
+    for sg_ay_dicts_page in sg_ay_dicts_pages:
+        for sg_ay_dict in sg_ay_dicts_page:
+            sg_parent = sg_ay_dict["sg_parent"]
+            ay_parent_entity = ay_entities_by_sg_type_id.get(
+                (sg_parent["type"], sg_parent["id"]))
+            if ay_parent_entity is None:
+                log.debug(
+                    f"Parent of {sg_ay_dict['name']} wasn't synced, "
+                    "skipping it."
+                )
+                continue
+            yield ay_parent_entity, sg_ay_dict
+
+
+def _commit_sync_chunk(
+    entity_hub: ayon_api.entity_hub.EntityHub,
+    sg_session: shotgun_api3.Shotgun,
+    sg_batch_requests: List[Dict],
+    sg_batch_ay_entities: List,
+    sg_batch_size: int,
+) -> bool:
+    """Commit the AYON changes and send the Shotgrid updates of a sync.
+
+    The Shotgrid updates are only sent once the AYON commit succeeds, so
+    Shotgrid never points to AYON entities that weren't created.
+
+    Returns:
+        bool: Whether all the Shotgrid updates succeeded.
+    """
+    try:
+        entity_hub.commit_changes()
+    except Exception as e:
+        msg = "Unable to commit all entities to AYON!"
+        log.error(msg, exc_info=True)
+        raise Exception(msg) from e
+
+    log.info(f"Updating {len(sg_batch_requests)} entities in Shotgrid.")
+    _, sg_errors = send_sg_batch_requests(
+        sg_session,
+        sg_batch_requests,
+        chunk_size=sg_batch_size,
+    )
+
+    for index, error in sg_errors.items():
+        ay_entity = sg_batch_ay_entities[index]
+        sg_request = sg_batch_requests[index]
+        log.error(
+            f"Unable to update {sg_request['entity_type']} "
+            f"<{sg_request['entity_id']}> in Shotgrid with the ID of the "
+            f"AYON entity {ay_entity.name} <{ay_entity.id}>: {error}"
+        )
+
+    return not sg_errors
+
+
+def _get_sg_sync_watermark(sg_session: shotgun_api3.Shotgun) -> Optional[Dict]:
+    """Get up to when Shotgrid would be synced if a sync started now.
+
+    Both the time and the event ID come from the last Shotgrid event, so
+    they don't depend on the clock of the machine running the sync.
+
+    Returns:
+        Optional[dict]: The `updated_at` time, in ISO format, and the
+            `event_id`, None if there are no events.
+    """
+    sg_event = sg_session.find_one(
+        "EventLogEntry",
+        filters=[],
+        fields=["id", "created_at"],
+        order=[{"field_name": "id", "direction": "desc"}],
+    )
+    if not sg_event:
+        return None
+
+    return {
+        "updated_at": sg_event["created_at"].isoformat(),
+        "event_id": sg_event["id"],
+    }
+
+
+def _get_updated_sg_ay_dicts_roots(
+    entity_hub: ayon_api.entity_hub.EntityHub,
+    sg_session: shotgun_api3.Shotgun,
+    sg_project: Dict,
+    sg_ay_dicts: Dict,
+    sg_ay_dicts_parents: Dict,
+) -> Optional[List]:
+    """Find the AYON parents of the updated Shotgrid subtrees.
+
+    The parents of the updated entities are either updated too, so the
+    entities are reached from them, the project, or entities we look up in
+    AYON through the AYON ID stored in Shotgrid.
+
+    Returns:
+        Optional[list]: The AYON parent entity and the Shotgrid type and ID
+            of the top entity of each subtree, None if any parent isn't in
+            AYON.
+    """
+    sg_ay_dicts_roots = []
+    # (shotgrid type, shotgrid id) -> children (shotgrid type, shotgrid id)
+    sg_children_by_parent = {}
+    for sg_parent_key, sg_children_keys in sg_ay_dicts_parents.items():
+        if sg_parent_key == ("Project", sg_project["id"]):
+            sg_ay_dicts_roots.extend(
+                (entity_hub.project_entity, sg_child_key)
+                for sg_child_key in sg_children_keys
+            )
+            continue
+
+        if sg_parent_key in sg_ay_dicts:
+            continue
+
+        sg_children_by_parent[sg_parent_key] = sg_children_keys
+
+    sg_parent_ids_by_type = collections.defaultdict(list)
+    for sg_parent_type, sg_parent_id in sg_children_by_parent:
+        sg_parent_ids_by_type[sg_parent_type].append(sg_parent_id)
+
+    for sg_parent_type, sg_parent_ids in sg_parent_ids_by_type.items():
+        sg_parents = sg_session.find(
+            sg_parent_type,
+            filters=[["id", "in", sg_parent_ids]],
+            fields=[CUST_FIELD_CODE_ID],
+        )
+        for sg_parent in sg_parents:
+            ay_id = sg_parent.get(CUST_FIELD_CODE_ID)
+            ay_parent_entity = None
+            if ay_id:
+                ay_parent_entity = entity_hub.get_or_query_entity_by_id(
+                    ay_id, ["folder"])
+
+            if (
+                ay_parent_entity is None
+                or str(ay_parent_entity.attribs.get(SHOTGRID_ID_ATTRIB))
+                != str(sg_parent["id"])
+            ):
+                log.debug(
+                    f"Shotgrid {sg_parent_type} <{sg_parent['id']}> not "
+                    "found in AYON."
+                )
+                return None
+
+            sg_ay_dicts_roots.extend(
+                (ay_parent_entity, sg_child_key)
+                for sg_child_key in sg_children_by_parent.pop(
+                    (sg_parent_type, sg_parent["id"]))
+            )
+
+    # Parents that don't exist in Shotgrid anymore
+    if sg_children_by_parent:
+        return None
+
+    return sg_ay_dicts_roots
+
+
+def _remove_retired_entities(
+    entity_hub: ayon_api.entity_hub.EntityHub,
+    sg_session: shotgun_api3.Shotgun,
+    sg_project: Dict,
+    sg_enabled_entities: List[str],
+    project_code_field: str,
+    after_event_id: int,
+):
+    """Remove from AYON the entities retired in Shotgrid after an event.
+
+    The changes are left in the EntityHub to be committed with the rest.
+    """
+    project_entity_types = {
+        sg_entity_type
+        for sg_entity_type, _ in get_sg_project_enabled_entities(
+            sg_session, sg_project, sg_enabled_entities)
+    }
+    sg_events = sg_session.find(
+        "EventLogEntry",
+        filters=[
+            ["project", "is", sg_project],
+            ["id", "greater_than", after_event_id],
+            ["event_type", "ends_with", "_Retirement"],
+        ],
+        fields=["meta"],
+        order=[{"field_name": "id", "direction": "asc"}],
+    )
+
+    sg_events_batch = ShotgridEventsBatch()
+    for sg_event in sg_events:
+        sg_event_meta = sg_event["meta"]
+        if sg_event_meta.get("entity_type") not in project_entity_types:
+            continue
+
+        try:
+            remove_ayon_entity_from_sg_event(
+                sg_event_meta,
+                sg_session,
+                entity_hub,
+                project_code_field,
+                sg_events_batch=sg_events_batch,
+            )
+        except Exception:
+            log.warning(
+                "Unable to remove retired entity "
+                f"{sg_event_meta.get('entity_type')} "
+                f"<{sg_event_meta.get('entity_id')}>.",
+                exc_info=True
+            )
+
 
 def _create_new_entity(
     entity_hub: ayon_api.entity_hub.EntityHub,
@@ -303,10 +808,7 @@ def _create_new_entity(
         # Entity hub expects the statuses to be provided with the `name` and
         # not the `short_name` (which is what we get from SG) so we convert
         # the short name back to the long name before setting it
-        status_mapping = {
-            status.short_name: status.name for status in entity_hub.project_entity.statuses
-        }
-        new_status_name = status_mapping.get(status)
+        new_status_name = get_ay_status_name(entity_hub.project_entity, status)
         if not new_status_name:
             log.warning(
                 "Status with short name '%s' doesn't exist in project", status
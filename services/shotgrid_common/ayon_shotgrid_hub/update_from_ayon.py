@@ -13,8 +13,8 @@ from ayon_api.entity_hub import (
 from utils import (
     get_sg_entity_parent_field,
     get_sg_statuses,
-    get_sg_tags,
-    get_sg_custom_attributes_data
+    get_sg_custom_attributes_data,
+    sg_reference_data,
 )
 from constants import (
     CUST_FIELD_CODE_ID,  # Shotgrid Field for the Ayon ID.
@@ -198,16 +198,17 @@ def update_sg_entity_from_ayon_event(
         elif ayon_event["topic"].endswith("tags_changed"):
             tags_event_list = new_attribs
             new_attribs = {"tags": []}
-            sg_tags = get_sg_tags(sg_session)
             for tag_name in tags_event_list:
-                if tag_name.lower() in sg_tags:
-                    tag_id = sg_tags[tag_name]
+                sg_tag = sg_reference_data.find(sg_session, "Tag", tag_name)
+                if sg_tag:
+                    tag_id = sg_tag["id"]
                 else:
                     log.info(
                         f"Tag '{tag_name}' not found in ShotGrid, "
                         "creating a new one."
                     )
                     new_tag = sg_session.create("Tag", {'name': tag_name})
+                    sg_reference_data.add("Tag", new_tag)
                     tag_id = new_tag["id"]
 
                 new_attribs["tags"].append(
@@ -348,23 +349,19 @@ def _create_sg_entity(
     if ay_entity.entity_type == "task" and sg_parent_type != "AssetCategory":
         sg_field_name = "content"
 
-        step_query_filters = [["code", "is", ay_entity.task_type]]
-
+        step_filters = {}
         if sg_parent_type in ["Asset", "Shot"]:
-            step_query_filters.append(
-                ["entity_type", "is", sg_parent_type]
-            )
+            step_filters["entity_type"] = sg_parent_type
 
-        sg_step = sg_session.find_one(
-            "Step",
-            filters=step_query_filters,
-        )
+        sg_step = sg_reference_data.find(
+            sg_session, "Step", ay_entity.task_type, **step_filters)
 
         if not sg_step:
             raise ValueError(
                 f"Unable to create Task {ay_entity.task_type} {ay_entity}\n"
                 f"-> Shotgrid is missing Pipeline Step {ay_entity.task_type}"
             )
+        sg_step = {"type": "Step", "id": sg_step["id"]}
 
     parent_field = get_sg_entity_parent_field(
         sg_session,
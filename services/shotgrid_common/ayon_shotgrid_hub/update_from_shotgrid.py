@@ -31,7 +31,9 @@ from utils import (
     get_asset_category,
     get_sg_entity_as_ay_dict,
     get_sg_entity_parent_field,
+    send_sg_batch_requests,
     update_ay_entity_custom_attributes,
+    get_ay_status_name,
 )
 from constants import (
     CUST_FIELD_CODE_ID,  # ShotGrid Field for the Ayon ID.
@@ -47,6 +49,84 @@ from utils import get_logger
 log = get_logger(__file__)
 
 
+class ShotgridEventsBatch:
+    """Collect the changes of several ShotGrid events to write them at once.
+
+    When given to the functions of this module, they don't commit the AYON
+    EntityHub nor write the AYON ID back to ShotGrid, instead the hub is
+    committed once by `commit` and all the `sg_ayon_id` updates are sent
+    through `sg.batch()`.
+
+    Since the AYON IDs are only written to ShotGrid at the end, we keep track
+    of the ones assigned during the batch so later events (i.e. the creation
+    of a child entity) can find them.
+    """
+    def __init__(self):
+        self._ay_ids_by_sg_entity = {}
+        self._sg_batch_requests = []
+        # index of the event whose changes are being collected, used to map
+        # ShotGrid errors back to the event that caused them
+        self.current_event_index = None
+
+    def fill_ay_id(self, sg_ay_dict: Dict):
+        """Set the AYON ID assigned within the batch to a ShotGrid dict."""
+        if not sg_ay_dict or sg_ay_dict["data"].get(CUST_FIELD_CODE_ID):
+            return
+
+        ay_id = self._ay_ids_by_sg_entity.get((
+            sg_ay_dict["attribs"].get(SHOTGRID_TYPE_ATTRIB),
+            sg_ay_dict["attribs"].get(SHOTGRID_ID_ATTRIB),
+        ))
+        if ay_id:
+            sg_ay_dict["data"][CUST_FIELD_CODE_ID] = ay_id
+
+    def set_sg_ay_id(self, sg_type: str, sg_id: int, ay_id: str):
+        """Queue the update of the AYON ID of a ShotGrid entity."""
+        self._ay_ids_by_sg_entity[(sg_type, sg_id)] = ay_id
+        self._sg_batch_requests.append((
+            self.current_event_index,
+            {
+                "request_type": "update",
+                "entity_type": sg_type,
+                "entity_id": sg_id,
+                "data": {CUST_FIELD_CODE_ID: ay_id},
+            }
+        ))
+
+    def commit(
+        self,
+        ayon_entity_hub: ayon_api.entity_hub.EntityHub,
+        sg_session: shotgun_api3.Shotgun,
+        chunk_size: int = 100,
+    ) -> Dict[int, Exception]:
+        """Commit the AYON changes and send the ShotGrid updates.
+
+        Args:
+            ayon_entity_hub (ayon_api.entity_hub.EntityHub): The AYON
+                EntityHub.
+            sg_session (shotgun_api3.Shotgun): The ShotGrid API session.
+            chunk_size (int): Maximum amount of requests per `sg.batch()`.
+
+        Returns:
+            dict[int, Exception]: Errors of the ShotGrid updates, keyed by
+                the index of the event that queued them.
+        """
+        ayon_entity_hub.commit_changes()
+
+        sg_batch_requests, self._sg_batch_requests = (
+            self._sg_batch_requests, []
+        )
+        _, errors = send_sg_batch_requests(
+            sg_session,
+            [sg_request for _, sg_request in sg_batch_requests],
+            chunk_size=chunk_size,
+        )
+        return {
+            sg_batch_requests[index][0]: error
+            for index, error in errors.items()
+        }
+
+
 def create_ay_entity_from_sg_event(
     sg_event: Dict,
     sg_project: Dict,
@@ -54,7 +134,8 @@ def create_ay_entity_from_sg_event(
     ayon_entity_hub: ayon_api.entity_hub.EntityHub,
     sg_enabled_entities: List[str],
     project_code_field: str,
-    custom_attribs_map: Optional[Dict[str, str]] = None
+    custom_attribs_map: Optional[Dict[str, str]] = None,
+    sg_events_batch: Optional[ShotgridEventsBatch] = None,
 ):
     """Create an AYON entity from a ShotGrid Event.
 
@@ -67,6 +148,8 @@ def create_ay_entity_from_sg_event(
         project_code_field (str): The Shotgrid project code field.
         custom_attribs_map (Optional[dict]): A dictionary that maps ShotGrid
             attributes to Ayon attributes.
+        sg_events_batch (Optional[ShotgridEventsBatch]): If provided, changes
+            are not committed but collected in the batch.
 
     Returns:
         ay_entity (ayon_api.entity_hub.EntityHub.Entity): The newly
@@ -92,6 +175,8 @@ def create_ay_entity_from_sg_event(
         custom_attribs_map=custom_attribs_map,
         extra_fields=extra_fields,
     )
+    if sg_events_batch is not None:
+        sg_events_batch.fill_ay_id(sg_ay_dict)
     log.debug(f"ShotGrid Entity as AYON dict: {sg_ay_dict}")
     if not sg_ay_dict:
         log.warning(
@@ -160,6 +245,8 @@ def create_ay_entity_from_sg_event(
             sg_ay_dict["data"][sg_parent_field]["id"],
             project_code_field,
         )
+        if sg_events_batch is not None:
+            sg_events_batch.fill_ay_id(sg_parent_entity_dict)
 
         log.debug(f"ShotGrid Parent entity: {sg_parent_entity_dict}")
         ay_parent_entity = ayon_entity_hub.get_or_query_entity_by_id(
@@ -216,11 +303,8 @@ def create_ay_entity_from_sg_event(
         # Entity hub expects the statuses to be provided with the `name` and
         # not the `short_name` (which is what we get from SG) so we convert
         # the short name back to the long name before setting it
-        status_mapping = {
-            status.short_name: status.name
-            for status in ayon_entity_hub.project_entity.statuses
-        }
-        new_status_name = status_mapping.get(status)
+        new_status_name = get_ay_status_name(
+            ayon_entity_hub.project_entity, status)
         if not new_status_name:
             log.warning(
                 "Status with short name '%s' doesn't exist in project", status
@@ -250,6 +334,14 @@ def create_ay_entity_from_sg_event(
         except ValueError as e:
             log.warning(f"Tags sync not implemented: {e}")
 
+    if sg_events_batch is not None:
+        sg_events_batch.set_sg_ay_id(
+            sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB],
+            sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB],
+            ay_entity.id
+        )
+        return ay_entity
+
     try:
         ayon_entity_hub.commit_changes()
 
@@ -273,7 +365,8 @@ def update_ayon_entity_from_sg_event(
     ayon_entity_hub: ayon_api.entity_hub.EntityHub,
     sg_enabled_entities: List[str],
     project_code_field: str,
-    custom_attribs_map: Optional[Dict[str, str]] = None
+    custom_attribs_map: Optional[Dict[str, str]] = None,
+    sg_events_batch: Optional[ShotgridEventsBatch] = None,
 ):
     """Try to update an entity in Ayon.
 
@@ -286,6 +379,8 @@ def update_ayon_entity_from_sg_event(
         project_code_field (str): The ShotGrid project code field.
         custom_attribs_map (dict): A dictionary that maps ShotGrid
             attributes to Ayon attributes.
+        sg_events_batch (Optional[ShotgridEventsBatch]): If provided, changes
+            are not committed but collected in the batch.
 
     Returns:
         ay_entity (ayon_api.entity_hub.EntityHub.Entity): The modified entity.
@@ -298,6 +393,8 @@ def update_ayon_entity_from_sg_event(
         project_code_field,
         custom_attribs_map=custom_attribs_map
     )
+    if sg_events_batch is not None:
+        sg_events_batch.fill_ay_id(sg_ay_dict)
 
     if not sg_ay_dict:
         log.warning(
@@ -318,7 +415,8 @@ def update_ayon_entity_from_sg_event(
                 ayon_entity_hub,
                 sg_enabled_entities,
                 project_code_field,
-                custom_attribs_map
+                custom_attribs_map,
+                sg_events_batch=sg_events_batch,
             )
         except Exception:
             log.error("AYON Entity could not be created", exc_info=True)
@@ -332,10 +430,13 @@ def update_ayon_entity_from_sg_event(
     if not ay_entity:
         raise ValueError("Unable to update a non existing entity.")
 
-    # make sure the entity is not immutable
-    if (
-        ay_entity.immutable_for_hierarchy
-        and sg_event["attribute_name"] in SG_RESTRICTED_ATTR_FIELDS
+    # make sure the entity is not immutable, the leecher might have
+    # coalesced several changes into this event
+    changed_attributes = sg_event.get(
+        "attribute_names", [sg_event["attribute_name"]])
+    if ay_entity.immutable_for_hierarchy and any(
+        attribute_name in SG_RESTRICTED_ATTR_FIELDS
+        for attribute_name in changed_attributes
     ):
         raise ValueError("Entity is immutable, aborting...")
 
@@ -366,16 +467,24 @@ def update_ayon_entity_from_sg_event(
         ay_project=ayon_entity_hub.project_entity
     )
 
-    ayon_entity_hub.commit_changes()
+    if sg_events_batch is None:
+        ayon_entity_hub.commit_changes()
 
     if sg_ay_dict["data"].get(CUST_FIELD_CODE_ID) != ay_entity.id:
-        sg_session.update(
-            sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB],
-            sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB],
-            {
-                CUST_FIELD_CODE_ID: ay_entity.id
-            }
-        )
+        if sg_events_batch is not None:
+            sg_events_batch.set_sg_ay_id(
+                sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB],
+                sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB],
+                ay_entity.id
+            )
+        else:
+            sg_session.update(
+                sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB],
+                sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB],
+                {
+                    CUST_FIELD_CODE_ID: ay_entity.id
+                }
+            )
     
     ay_entity.attribs.set(
         SHOTGRID_ID_ATTRIB,
@@ -394,6 +503,7 @@ def remove_ayon_entity_from_sg_event(
     sg_session: shotgun_api3.Shotgun,
     ayon_entity_hub: ayon_api.entity_hub.EntityHub,
     project_code_field: str,
+    sg_events_batch: Optional[ShotgridEventsBatch] = None,
 ):
     """Try to remove an entity in Ayon.
 
@@ -402,6 +512,8 @@ def remove_ayon_entity_from_sg_event(
         sg_session (shotgun_api3.Shotgun): The ShotGrid API session.
         ayon_entity_hub (ayon_api.entity_hub.EntityHub): The AYON EntityHub.
         project_code_field (str): The ShotGrid field that contains the Ayon ID.
+        sg_events_batch (Optional[ShotgridEventsBatch]): If provided, changes
+            are not committed but collected in the batch.
     """
     # for now we are ignoring Task type entities
     # TODO: Handle Task entities
@@ -437,6 +549,9 @@ def remove_ayon_entity_from_sg_event(
                 "no longer exists in ShotGrid."
             )
 
+    if sg_events_batch is not None:
+        sg_events_batch.fill_ay_id(sg_ay_dict)
+
     if not sg_ay_dict["data"].get(CUST_FIELD_CODE_ID):
         log.warning(
             "Entity does not have an Ayon ID, aborting..."
@@ -461,7 +576,8 @@ def remove_ayon_entity_from_sg_event(
         log.info("Entity is immutable.")
         ay_entity.attribs.set(SHOTGRID_ID_ATTRIB, SHOTGRID_REMOVED_VALUE)
 
-    ayon_entity_hub.commit_changes()
+    if sg_events_batch is None:
+        ayon_entity_hub.commit_changes()
 
 
 def sync_user(
@@ -10,6 +10,10 @@ SHOTGRID_ID_ATTRIB = "shotgridId"
 SHOTGRID_PATH_ATTRIB = "shotgridPath"
 SHOTGRID_TYPE_ATTRIB = "shotgridType"
 
+# Key of the AYON project data where we store up to when it was synced from
+# ShotGrid, for incremental syncs.
+SHOTGRID_SYNC_WATERMARK_DATA = "shotgridSyncWatermark"
+
 
 REMOVED_ID_VALUE = "removed"
 
@@ -157,3 +161,25 @@ SG_EVENT_QUERY_FIELDS = [
     "session_uuid",
     "created_at",
 ]
+
+# Keys of the ShotGrid Event `meta` read by the processor, the only ones the
+# leecher keeps when dispatching compact payloads.
+SG_EVENT_META_FIELDS = [
+    "type",
+    "entity_type",
+    "entity_id",
+    "attribute_name",
+    "attribute_names",  # Set when the leecher coalesces change events.
+    "in_create",
+]
+
+# Entity types that don't belong to any project but that the services keep
+# cached, the leecher forwards their events as `shotgrid-cache-event` so the
+# processor can refresh its caches.
+SG_CACHE_ENTITY_TYPES = [
+    "DisplayColumn",  # ShotGrid fields, cached in `sg_schema_catalog`.
+    "HumanUser",  # Logins, cached in `sg_user_logins`.
+    "Tag",  # Cached in `sg_reference_data`.
+    "Step",  # Cached in `sg_reference_data`.
+    "Status",  # Cached in `sg_reference_data`.
+]
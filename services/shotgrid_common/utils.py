@@ -1,8 +1,13 @@
 import os
 import json
+import time
+import uuid
 import hashlib
 import logging
+import queue
+import threading
 import collections
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Optional, Union
 
@@ -22,7 +27,7 @@ from ayon_api.entity_hub import (
     FolderEntity,
 )
 from ayon_api.utils import slugify_string
-from ayon_api import get_attributes_for_type
+from ayon_api import get_attributes_for_type, get_project
 
 import shotgun_api3
 
@@ -91,6 +96,22 @@ def get_event_hash(event_topic: str, event_id: int) -> str:
     return hashlib.sha256(json_data.encode("utf-8")).hexdigest()
 
 
+def get_sg_service_session_uuid(script_name: str) -> str:
+    """Get the session UUID the services tag their ShotGrid changes with.
+
+    The UUID is derived from the script name so the leecher can recognize
+    the events caused by the processor and the transmitter without any
+    shared state.
+
+    Args:
+        script_name (str): The ShotGrid script name used by the services.
+
+    Returns:
+        str: The session UUID.
+    """
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"ayon-shotgrid/{script_name}"))
+
+
 def _sg_to_ay_dict(
     sg_entity: dict,
     project_code_field: str,
@@ -409,6 +430,133 @@ def create_sg_entities_in_ay(
     return sg_folder_entities, sg_steps
 
 
+class AyonEntitiesIndex:
+    """Index the entities of an EntityHub to match them with ShotGrid ones.
+
+    Finding a child of an entity by name means going through all of its
+    children, which done for every ShotGrid entity of a large hierarchy (i.e.
+    thousands of shots in a sequence) becomes quadratic. Instead, the
+    children of each parent are indexed by their lowercase name the first
+    time they're needed, and the entities by their ShotGrid type and ID,
+    and the indexes are kept up to date with `add` and `set_parent` as
+    entities are created or moved.
+
+    The ShotGrid index starts with the entities in the EntityHub when it's
+    first used, i.e. the whole project if it was queried beforehand, and
+    the children loaded through `load_children` are added to it.
+
+    Args:
+        entity_hub (ayon_api.EntityHub): The project's entity hub.
+    """
+
+    def __init__(self, entity_hub):
+        self._entity_hub = entity_hub
+        # parent id -> {lower name: [entities]}
+        self._children_by_name = {}
+        # (shotgrid type, shotgrid id) -> entity
+        self._entities_by_sg_id = None
+
+    def _get_children_by_name(self, parent_entity):
+        children_by_name = self._children_by_name.get(parent_entity.id)
+        if children_by_name is None:
+            children_by_name = {}
+            for child in parent_entity.get_children():
+                children_by_name.setdefault(child.name.lower(), []).append(
+                    child)
+                if self._entities_by_sg_id is not None:
+                    self._add_sg_id(child)
+            self._children_by_name[parent_entity.id] = children_by_name
+        return children_by_name
+
+    def _get_entities_by_sg_id(self):
+        if self._entities_by_sg_id is None:
+            self._entities_by_sg_id = {}
+            for entity in self._entity_hub.entities:
+                self._add_sg_id(entity)
+        return self._entities_by_sg_id
+
+    def _add_sg_id(self, entity):
+        if entity.entity_type == "project":
+            return
+        sg_type = entity.attribs.get(SHOTGRID_TYPE_ATTRIB)
+        sg_id = entity.attribs.get(SHOTGRID_ID_ATTRIB)
+        if sg_type and sg_id:
+            self._entities_by_sg_id.setdefault((sg_type, str(sg_id)), entity)
+
+    def load_children(self, parent_entity):
+        """Load the children of an entity, with a single query, and index them.
+
+        Args:
+            parent_entity: Ayon parent entity.
+        """
+        self._get_children_by_name(parent_entity)
+
+    def get_child_by_name(self, parent_entity, name, folder_type=None):
+        """Find a child of an entity by its (case-insensitive) name.
+
+        Args:
+            parent_entity: Ayon parent entity.
+            name (str): Name of the child.
+            folder_type (Optional[str]): Only match folders of this type.
+
+        Returns:
+            Optional[BaseEntity]: The first child that matches.
+        """
+        for child in self._get_children_by_name(parent_entity).get(
+            name.lower(), []
+        ):
+            if folder_type is None or (
+                child.entity_type == "folder"
+                and child.folder_type == folder_type
+            ):
+                return child
+        return None
+
+    def get_entity_by_sg_id(self, sg_type, sg_id):
+        """Find an entity by the ShotGrid entity it was synced with.
+
+        Only the entities in the EntityHub when the index was first used,
+        and the ones loaded or added through the index, are looked at.
+
+        Args:
+            sg_type (str): The ShotGrid entity type.
+            sg_id (Union[int, str]): The ShotGrid ID.
+
+        Returns:
+            Optional[BaseEntity]: The entity, None if there's none.
+        """
+        return self._get_entities_by_sg_id().get((sg_type, str(sg_id)))
+
+    def add(self, entity):
+        """Index an entity that was just created."""
+        children_by_name = self._children_by_name.get(entity.parent_id)
+        if children_by_name is not None:
+            children_by_name.setdefault(entity.name.lower(), []).append(
+                entity)
+        if self._entities_by_sg_id is not None:
+            self._add_sg_id(entity)
+
+    def set_parent(self, entity, old_parent_id):
+        """Move an entity that was just reparented in the indexes."""
+        children_by_name = self._children_by_name.get(old_parent_id)
+        if children_by_name is not None:
+            name = entity.name.lower()
+            same_name_children = [
+                child
+                for child in children_by_name.get(name, [])
+                if child is not entity
+            ]
+            if same_name_children:
+                children_by_name[name] = same_name_children
+            else:
+                children_by_name.pop(name, None)
+
+        children_by_name = self._children_by_name.get(entity.parent_id)
+        if children_by_name is not None:
+            children_by_name.setdefault(entity.name.lower(), []).append(
+                entity)
+
+
 def create_asset_category(entity_hub, parent_entity, sg_ay_dict):
     """Create an "AssetCategory" folder in AYON.
 
@@ -442,7 +590,9 @@ def create_asset_category(entity_hub, parent_entity, sg_ay_dict):
     return asset_category_entity
 
 
-def get_asset_category(entity_hub, parent_entity, sg_ay_dict):
+def get_asset_category(
+    entity_hub, parent_entity, sg_ay_dict, ay_entities_index=None
+):
     """Look for existing "AssetCategory" folders in AYON.
 
         Asset categories are not entities per se in ShotGrid, they are
@@ -454,6 +604,8 @@ def get_asset_category(entity_hub, parent_entity, sg_ay_dict):
         entity_hub (ayon_api.EntityHub): The project's entity hub.
         parent_entity: Ayon parent entity.
         sg_ay_dict (dict): The ShotGrid entity ready for Ayon consumption.
+        ay_entities_index (Optional[AyonEntitiesIndex]): Index of the
+            entities to look the category up in and add it to once created.
 
     """
     # just in case the asset type doesn't exist yet
@@ -463,25 +615,35 @@ def get_asset_category(entity_hub, parent_entity, sg_ay_dict):
     asset_category_name = slugify_string(
         sg_ay_dict["data"]["sg_asset_type"]).lower()
 
-    asset_categories = [
-        entity
-        for entity in parent_entity.get_children()
-        if (
-            entity.entity_type == "folder"
-            and entity.folder_type == "AssetCategory"
-            and entity.name == asset_category_name
-        )
-    ]
+    if ay_entities_index is not None:
+        asset_category = ay_entities_index.get_child_by_name(
+            parent_entity, asset_category_name, folder_type="AssetCategory")
+        if asset_category is not None:
+            return asset_category
+    else:
+        asset_categories = [
+            entity
+            for entity in parent_entity.get_children()
+            if (
+                entity.entity_type == "folder"
+                and entity.folder_type == "AssetCategory"
+                and entity.name == asset_category_name
+            )
+        ]
 
-    for asset_category in asset_categories:
-        return asset_category
+        for asset_category in asset_categories:
+            return asset_category
 
     try:
-        return create_asset_category(entity_hub, parent_entity, sg_ay_dict)
+        asset_category = create_asset_category(
+            entity_hub, parent_entity, sg_ay_dict)
     except Exception:
         log.error("Unable to create AssetCategory.", exc_info=True)
+        return None
 
-    return None
+    if ay_entities_index is not None:
+        ay_entities_index.add(asset_category)
+    return asset_category
 
 
 def get_or_create_sg_field(
@@ -522,6 +684,7 @@ def get_or_create_sg_field(
                 field_name,
                 properties=field_properties,
             )
+            sg_schema_catalog.invalidate(sg_entity_type)
             return attribute_exists
         except Exception:
             log.error(
@@ -533,6 +696,94 @@ def get_or_create_sg_field(
     return attribute_exists
 
 
+class ShotgridSchemaCatalog:
+    """Process wide cache of the ShotGrid schema.
+
+    The fields of an entity type are read with a single `schema_field_read`
+    the first time they're needed and kept for `ttl` seconds, so checking
+    whether a field exists or is editable doesn't cost a request. Creating
+    fields through `get_or_create_sg_field` and leeched `DisplayColumn`
+    events invalidate it.
+
+    Args:
+        ttl (int): Seconds after which the fields of an entity type are
+            read again.
+    """
+
+    def __init__(self, ttl: int = 600):
+        self.ttl = ttl
+        # entity type -> (fields schema, time they were read)
+        self._fields_by_entity_type = {}
+        self._lock = threading.Lock()
+
+    def get_fields(
+        self,
+        sg_session: shotgun_api3.Shotgun,
+        sg_entity_type: str,
+    ) -> dict:
+        """Get the schema of all the fields of an entity type.
+
+        Args:
+            sg_session (shotgun_api3.Shotgun): Instance of a ShotGrid API
+                Session, only used if the schema is not cached.
+            sg_entity_type (str): The ShotGrid entity type.
+
+        Returns:
+            dict: The fields schema by field code, empty if the entity type
+                doesn't exist or the schema couldn't be read, only the
+                former is cached.
+        """
+        with self._lock:
+            cached = self._fields_by_entity_type.get(sg_entity_type)
+
+        if cached is not None and time.time() - cached[1] <= self.ttl:
+            return cached[0]
+
+        try:
+            sg_fields = sg_session.schema_field_read(sg_entity_type)
+        except shotgun_api3.Fault:
+            # ShotGrid rejected the request, the entity type doesn't exist
+            log.debug(
+                f"Unable to read the schema of {sg_entity_type}.",
+                exc_info=True
+            )
+            sg_fields = {}
+        except Exception:
+            # Timeouts, server errors... don't keep them around
+            log.warning(
+                f"Unable to read the schema of {sg_entity_type}.",
+                exc_info=True
+            )
+            return {}
+
+        with self._lock:
+            self._fields_by_entity_type[sg_entity_type] = (
+                sg_fields, time.time()
+            )
+
+        return sg_fields
+
+    def get_field(
+        self,
+        sg_session: shotgun_api3.Shotgun,
+        sg_entity_type: str,
+        field_code: str,
+    ) -> Optional[dict]:
+        """Get the schema of a field, None if it doesn't exist."""
+        return self.get_fields(sg_session, sg_entity_type).get(field_code)
+
+    def invalidate(self, sg_entity_type: Optional[str] = None):
+        """Forget the schema of an entity type, or of all of them."""
+        with self._lock:
+            if sg_entity_type is None:
+                self._fields_by_entity_type.clear()
+            else:
+                self._fields_by_entity_type.pop(sg_entity_type, None)
+
+
+sg_schema_catalog = ShotgridSchemaCatalog()
+
+
 def check_sg_attribute_exists(
     sg_session: shotgun_api3.Shotgun,
     sg_entity_type: str,
@@ -540,25 +791,298 @@ def check_sg_attribute_exists(
     check_writable: bool = False,
 ) -> bool:
     """Validate whether given field code exists under that entity type"""
-    try:
-        schema_field = sg_session.schema_field_read(
-            sg_entity_type,
-            field_name=field_code
+    field_schema = sg_schema_catalog.get_field(
+        sg_session, sg_entity_type, field_code)
+    if not field_schema:
+        return False
+
+    # If we are checking whether the attribute can be written to
+    # we check the "editable" key in the schema field
+    if check_writable:
+        is_writable = field_schema.get("editable", {}).get("value")
+        if not is_writable:
+            return False
+
+    return {field_code: field_schema}
+
+
+class ShotgridUserLogins:
+    """Process wide index of the login of the ShotGrid users by their ID.
+
+    AYON assignees are user names (the ShotGrid login), while ShotGrid only
+    gives us the ID and display name of the assigned users. ShotGrid doesn't
+    return deep fields (i.e. `task_assignees.HumanUser.login`) through
+    multi-entity fields, so we keep the logins around, querying the missing
+    ones with a single request.
+
+    Args:
+        ttl (int): Seconds after which a login is queried again.
+    """
+
+    def __init__(self, ttl: int = 3600):
+        self.ttl = ttl
+        # user id -> (login, time it was queried)
+        self._logins = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, sg_session: shotgun_api3.Shotgun, sg_users: list):
+        """Query the logins of the given users that aren't cached.
+
+        Args:
+            sg_session (shotgun_api3.Shotgun): Shotgun Session object.
+            sg_users (list[dict]): Entities as returned in `task_assignees`,
+                other than HumanUser (i.e. groups) are skipped.
+        """
+        now = time.time()
+        with self._lock:
+            missing_ids = {
+                sg_user["id"]
+                for sg_user in sg_users
+                if sg_user["type"] == "HumanUser"
+                and (
+                    sg_user["id"] not in self._logins
+                    or now - self._logins[sg_user["id"]][1] > self.ttl
+                )
+            }
+
+        if not missing_ids:
+            return
+
+        sg_users_data = sg_session.find(
+            "HumanUser",
+            [["id", "in", list(missing_ids)]],
+            fields=["login"],
         )
-        # If we are checking whether the attribute can be written to
-        # we check the "editable" key in the schema field
-        if check_writable:
-            is_writable = schema_field[field_code].get(
-                "editable", {}).get("value")
-            if not is_writable:
-                return False
-
-        return schema_field
-    except Exception:
-        # shotgun_api3.shotgun.Fault: API schema_field_read()
-        pass
+        with self._lock:
+            for sg_user in sg_users_data:
+                self._logins[sg_user["id"]] = (sg_user["login"], now)
+
+    def get_logins(
+        self,
+        sg_session: shotgun_api3.Shotgun,
+        sg_users: list,
+    ) -> list:
+        """Get the logins of the users, querying the missing ones.
+
+        Args:
+            sg_session (shotgun_api3.Shotgun): Shotgun Session object.
+            sg_users (list[dict]): Entities as returned in `task_assignees`.
+
+        Returns:
+            list[str]: The logins of the HumanUsers, in the same order.
+        """
+        # TODO: add support for group assignments
+        self.prefetch(sg_session, sg_users)
+
+        logins = []
+        with self._lock:
+            for sg_user in sg_users:
+                if sg_user["type"] != "HumanUser":
+                    continue
+
+                cached = self._logins.get(sg_user["id"])
+                if cached is None:
+                    raise ValueError(
+                        f"Unable to find HumanUser {sg_user['id']} "
+                        "in ShotGrid."
+                    )
+                logins.append(cached[0])
+
+        return logins
+
+    def invalidate(self, sg_user_id: Optional[int] = None):
+        """Forget the login of a user, or of all of them."""
+        with self._lock:
+            if sg_user_id is None:
+                self._logins.clear()
+            else:
+                self._logins.pop(sg_user_id, None)
+
+
+sg_user_logins = ShotgridUserLogins()
+
+
+class ShotgridSessionsPool:
+    """Process wide pool of ShotGrid sessions to query in parallel.
+
+    `shotgun_api3.Shotgun` objects can't be shared across threads, so each
+    thread querying in parallel borrows its own session, created with the
+    same credentials as the session it was asked for, and gives it back
+    once done so the connection is reused.
+
+    Args:
+        max_sessions (int): Maximum amount of sessions used at the same time
+            by a single query, 1 to not query in parallel.
+    """
+
+    def __init__(self, max_sessions: int = 4):
+        self.max_sessions = max_sessions
+        # (url, script name) -> idle sessions
+        self._idle_sessions = collections.defaultdict(list)
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        sg_session: shotgun_api3.Shotgun,
+    ) -> shotgun_api3.Shotgun:
+        """Get an idle session like `sg_session`, or create a new one."""
+        key = (sg_session.base_url, sg_session.config.script_name)
+        with self._lock:
+            if self._idle_sessions[key]:
+                return self._idle_sessions[key].pop()
+
+        if sg_session.config.script_name:
+            pooled_session = shotgun_api3.Shotgun(
+                sg_session.base_url,
+                script_name=sg_session.config.script_name,
+                api_key=sg_session.config.api_key,
+            )
+        else:
+            pooled_session = shotgun_api3.Shotgun(
+                sg_session.base_url,
+                session_token=sg_session.config.session_token,
+            )
+        pooled_session.set_session_uuid(sg_session.config.session_uuid)
+        return pooled_session
+
+    def release(self, pooled_session: shotgun_api3.Shotgun):
+        """Give back a session got with `acquire`."""
+        key = (pooled_session.base_url, pooled_session.config.script_name)
+        with self._lock:
+            if len(self._idle_sessions[key]) < self.max_sessions:
+                self._idle_sessions[key].append(pooled_session)
+                return
+
+        pooled_session.close()
+
+    def invalidate(self):
+        """Close all the idle sessions."""
+        with self._lock:
+            idle_sessions = [
+                pooled_session
+                for pooled_sessions in self._idle_sessions.values()
+                for pooled_session in pooled_sessions
+            ]
+            self._idle_sessions.clear()
+
+        for pooled_session in idle_sessions:
+            pooled_session.close()
+
+
+sg_sessions_pool = ShotgridSessionsPool()
+
+# Pages each parallel ShotGrid query fetches ahead of the one being consumed
+# when the entities are streamed
+SG_PREFETCHED_PAGES = 2
+
+
+def _iter_sg_entity_pages(
+    sg_session: shotgun_api3.Shotgun,
+    entity_name: str,
+    sg_filters: list,
+    query_fields: list,
+    page_size: int,
+):
+    """Query the entities of a type page by page, ordered by ID."""
+    page = 1
+    while True:
+        sg_entities = sg_session.find(
+            entity_name,
+            filters=sg_filters,
+            fields=query_fields,
+            order=[{"field_name": "id", "direction": "asc"}],
+            limit=page_size,
+            page=page,
+        )
+        page += 1
+
+        if sg_entities:
+            yield sg_entities
+
+        if len(sg_entities) < page_size:
+            break
+
+
+def _iter_sg_entity_types_pages(
+    sg_session: shotgun_api3.Shotgun,
+    sg_queries: list,
+    page_size: int,
+    max_prefetched_pages: Optional[int] = None,
+):
+    """Query the entities of several types in parallel.
+
+    Each entity type is queried in its own thread, with a session of
+    `sg_sessions_pool`, up to `sg_sessions_pool.max_sessions` at a time.
+    The pages are yielded in the order of the queries, and all of them stop
+    once the iteration stops.
+
+    Args:
+        sg_session (shotgun_api3.Shotgun): Shotgun Session object.
+        sg_queries (list[tuple(str, list, list)]): The entity type, filters
+            and fields of each query.
+        page_size (int): Amount of entities per query.
+        max_prefetched_pages (Optional[int]): Pages each query keeps ahead
+            of the consumed ones before waiting, unbounded if not provided.
+
+    Yields:
+        tuple(int, list[dict]): The index of the query and a page of it.
+    """
+    max_workers = min(sg_sessions_pool.max_sessions, len(sg_queries))
+    if max_workers <= 1:
+        for index, sg_query in enumerate(sg_queries):
+            for sg_entities in _iter_sg_entity_pages(
+                sg_session, *sg_query, page_size
+            ):
+                yield index, sg_entities
+        return
+
+    # Each query puts its pages, and then None or the error that stopped it
+    pages_queues = [
+        queue.Queue(maxsize=max_prefetched_pages or 0) for _ in sg_queries
+    ]
+    stop_event = threading.Event()
+
+    def _put(index, item):
+        """Wait for room in the queue, False if the iteration stopped."""
+        while not stop_event.is_set():
+            try:
+                pages_queues[index].put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
 
-    return False
+    def _query_pages(index):
+        if stop_event.is_set():
+            return
+        try:
+            pooled_session = sg_sessions_pool.acquire(sg_session)
+            try:
+                for sg_entities in _iter_sg_entity_pages(
+                    pooled_session, *sg_queries[index], page_size
+                ):
+                    if not _put(index, sg_entities):
+                        return
+            finally:
+                sg_sessions_pool.release(pooled_session)
+        except Exception as e:
+            _put(index, e)
+            return
+        _put(index, None)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for index in range(len(sg_queries)):
+            executor.submit(_query_pages, index)
+
+        for index, pages_queue in enumerate(pages_queues):
+            while (sg_entities := pages_queue.get()) is not None:
+                if isinstance(sg_entities, Exception):
+                    raise sg_entities
+                yield index, sg_entities
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def get_sg_entities(
@@ -568,19 +1092,27 @@ def get_sg_entities(
     project_code_field: str,
     custom_attribs_map: dict,
     extra_fields: Optional[list] = None,
+    updated_after: Optional[datetime] = None,
 ) -> tuple[dict, dict]:
     """Get all available entities within a ShotGrid Project.
 
     We check with ShotGrid to see what entities are enabled in a given project,
-    then we build two dictionaries, one containing all entities with their ID
-    as key and the representation as the value, and another dictionary where we
-    store all the children on an entity, the key is the parent entity, and the
-    value a list of it's children; all this by querying all the existing
-    entities in a project for the enabled entities.
+    then we build two dictionaries, one containing all entities with their
+    type and ID as key and the representation as the value, and another
+    dictionary where we store all the children on an entity, the key is the
+    parent entity, and the value a set of it's children; all this by querying
+    all the existing entities in a project for the enabled entities.
+
+    ShotGrid IDs are only unique within an entity type, so the entities are
+    always keyed by a `(type, id)` tuple.
 
     Note: Asset Categories in ShotGrid aren't entities per se, or at least not
     queryable from the API, so we treat them as folders.
 
+    Each entity also gets its parent, as a ShotGrid link, in the
+    `sg_parent` key, since when only the entities updated after a given time
+    are queried their parents might not be there.
+
     Args:
         sg_session (shotgun_api3.Shotgun): Shotgun Session object.
         sg_project (dict): The ShotGrid project to query its entities.
@@ -589,16 +1121,100 @@ def get_sg_entities(
         custom_attribs_map (dict): Dictionary that maps names of attributes in
             AYON to ShotGrid equivalents.
         extra_fields (list): List of extra fields to pass to the query.
+        updated_after (Optional[datetime]): Only get the entities updated
+            after this time.
 
     Returns:
         tuple(
-            entities_by_id (dict): A dict containing all entities with
-                their ID as key.
-            entities_by_parent_id (dict): A dict containing all entities
-                that have children.
+            entities_by_type_id (dict): A dict containing all entities with
+                their type and ID as key.
+            entities_by_parent_type_id (dict): The type and ID of the
+                children of each entity that has children.
         )
 
     """
+    if not project_code_field:
+        project_code_field = "code"
+
+    sg_ay_dicts = {
+        ("Project", sg_project["id"]): _sg_to_ay_dict(
+            sg_project,
+            project_code_field,
+            custom_attribs_map,
+        ),
+    }
+
+    sg_ay_dicts_parents: Dict[tuple, set] = (
+        collections.defaultdict(set)
+    )
+
+    for sg_ay_dicts_page in iter_sg_entities(
+        sg_session,
+        sg_project,
+        sg_enabled_entities,
+        project_code_field,
+        custom_attribs_map,
+        extra_fields=extra_fields,
+        updated_after=updated_after,
+    ):
+        for sg_ay_dict in sg_ay_dicts_page:
+            sg_type_id = (
+                sg_ay_dict["attribs"][SHOTGRID_TYPE_ATTRIB],
+                sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB],
+            )
+            sg_parent = sg_ay_dict["sg_parent"]
+            sg_ay_dicts[sg_type_id] = sg_ay_dict
+            sg_ay_dicts_parents[(sg_parent["type"], sg_parent["id"])].add(
+                sg_type_id)
+
+    return sg_ay_dicts, sg_ay_dicts_parents
+
+
+def iter_sg_entities(
+    sg_session: shotgun_api3.Shotgun,
+    sg_project: dict,
+    sg_enabled_entities: list,
+    project_code_field: str,
+    custom_attribs_map: dict,
+    extra_fields: Optional[list] = None,
+    updated_after: Optional[datetime] = None,
+    page_size: int = 500,
+    max_prefetched_pages: Optional[int] = None,
+):
+    """Iterate the entities of a ShotGrid Project page by page.
+
+    Same as `get_sg_entities` but the entities are queried, converted and
+    yielded a page at a time, so they can be processed while the next pages
+    are downloaded. The entity types are queried in the order of the project
+    hierarchy and Asset Categories are yielded before their first Asset, so
+    parents always come before their children.
+
+    The entity types are queried in parallel, with the sessions of
+    `sg_sessions_pool`, and their pages buffered until they're consumed, so
+    the time it takes is close to the one of the biggest entity type. When
+    the memory matters more than the time, `max_prefetched_pages` bounds the
+    pages each entity type gets ahead of the consumed ones, then the types
+    after the one being consumed mostly wait and the time gets closer to
+    the sum of all of them.
+
+    Args:
+        sg_session (shotgun_api3.Shotgun): Shotgun Session object.
+        sg_project (dict): The ShotGrid project to query its entities.
+        sg_enabled_entities (list): List of ShotGrid entities to query.
+        project_code_field (str): The ShotGrid project code field.
+        custom_attribs_map (dict): Dictionary that maps names of attributes in
+            AYON to ShotGrid equivalents.
+        extra_fields (list): List of extra fields to pass to the query.
+        updated_after (Optional[datetime]): Only get the entities updated
+            after this time.
+        page_size (int): Amount of entities per query.
+        max_prefetched_pages (Optional[int]): Pages each entity type is
+            queried ahead of the consumed ones, unbounded if not provided.
+
+    Yields:
+        list[dict]: The ShotGrid entities ready for Ayon consumption, with
+            their parent in the `sg_parent` key.
+    """
     query_fields = list(SG_COMMON_ENTITY_FIELDS)
 
     if extra_fields and isinstance(extra_fields, list):
@@ -607,52 +1223,55 @@ def get_sg_entities(
     for sg_attrib in custom_attribs_map.values():
         query_fields.extend([f"sg_{sg_attrib}", sg_attrib])
 
-    project_enabled_entities = get_sg_project_enabled_entities(
+    project_enabled_entities = _sort_sg_entities_by_hierarchy(
         sg_session,
-        sg_project,
-        sg_enabled_entities
+        get_sg_project_enabled_entities(
+            sg_session,
+            sg_project,
+            sg_enabled_entities
+        ),
     )
 
     if not project_code_field:
         project_code_field = "code"
 
-    entities_to_ignore = []
+    asset_category_names = set()
 
-    sg_ay_dicts = {
-        sg_project["id"]: _sg_to_ay_dict(
-            sg_project,
-            project_code_field,
-            custom_attribs_map,
-        ),
-    }
-
-    sg_ay_dicts_parents: Dict[str, set] = (
-        collections.defaultdict(set)
-    )
-
-    for enabled_entity in project_enabled_entities:
-        entity_name, parent_field = enabled_entity
+    sg_queries = []
+    for entity_name, _ in project_enabled_entities:
+        sg_filters = [["project", "is", sg_project]]
+        if updated_after is not None:
+            sg_filters.append(["updated_at", "greater_than", updated_after])
+        sg_queries.append((entity_name, sg_filters, query_fields))
 
-        # Potential fix when shotgrid api returns the same entity more than
-        # once, we store the entities in a dictionary to avoid duplicates
-        if entity_name in entities_to_ignore:
-            continue
+    for index, sg_entities in _iter_sg_entity_types_pages(
+        sg_session, sg_queries, page_size, max_prefetched_pages
+    ):
+        entity_name, parent_field = project_enabled_entities[index]
 
-        sg_entities = sg_session.find(
-            entity_name,
-            filters=[["project", "is", sg_project]],
-            fields=query_fields,
+        # Query the logins of all the assignees at once
+        sg_user_logins.prefetch(
+            sg_session,
+            [
+                assignee
+                for sg_entity in sg_entities
+                for assignee in sg_entity.get("task_assignees") or []
+            ]
         )
 
+        sg_ay_dicts_page = []
         for sg_entity in sg_entities:
-            parent_id = sg_project["id"]
+            sg_parent = {"type": "Project", "id": sg_project["id"]}
 
             if (
                 parent_field != "project"
                 and sg_entity[parent_field]
                 and entity_name != "Asset"
             ):
-                parent_id = sg_entity[parent_field]["id"]
+                sg_parent = {
+                    "type": sg_entity[parent_field]["type"],
+                    "id": sg_entity[parent_field]["id"],
+                }
 
             elif entity_name == "Asset" and sg_entity["sg_asset_type"]:
                 # Asset Categories (sg_asset_type) are not entities
@@ -662,13 +1281,13 @@ def get_sg_entities(
                 # asset category entity name
                 cat_ent_name = slugify_string(asset_category).lower()
 
-                if cat_ent_name not in sg_ay_dicts:
-                    asset_category_entity = {
+                if cat_ent_name not in asset_category_names:
+                    asset_category_names.add(cat_ent_name)
+                    sg_ay_dicts_page.append({
                         "label": asset_category,
                         "name": cat_ent_name,
                         "attribs": {
-                            SHOTGRID_ID_ATTRIB: slugify_string(
-                                asset_category).lower(),
+                            SHOTGRID_ID_ATTRIB: cat_ent_name,
                             SHOTGRID_TYPE_ATTRIB: "AssetCategory",
                         },
                         "data": {
@@ -677,41 +1296,117 @@ def get_sg_entities(
                         },
                         "type": "folder",
                         "folder_type": "AssetCategory",
-                    }
-                    sg_ay_dicts[cat_ent_name] = asset_category_entity
-                    sg_ay_dicts_parents[sg_project["id"]].add(cat_ent_name)
+                        "sg_parent": {
+                            "type": "Project", "id": sg_project["id"]
+                        },
+                    })
 
-                parent_id = cat_ent_name
+                sg_parent = {"type": "AssetCategory", "id": cat_ent_name}
 
             # Transform task_assignees list of dictionary entries
             # to just a list of the login names as used in AYON DB
             # so it's easier later to set
-            task_assignees = sg_entity.get("task_assignees")
-            if task_assignees:
-                task_assignees_list = []
-                for assignee in task_assignees:
-                    # Skip task assignments that aren't from a human user (i.e. groups)
-                    # TODO: add support for group assignments
-                    if assignee["type"] != "HumanUser":
-                        continue
-                    sg_user = get_sg_user_by_id(
-                        sg_session, assignee["id"], extra_fields=["login"]
-                    )
-                    task_assignees_list.append(sg_user["login"])
-                
-                sg_entity["task_assignees"] = task_assignees_list
+            if sg_entity.get("task_assignees"):
+                sg_entity["task_assignees"] = sg_user_logins.get_logins(
+                    sg_session, sg_entity["task_assignees"])
 
             sg_ay_dict = _sg_to_ay_dict(
                 sg_entity,
                 project_code_field,
                 custom_attribs_map,
             )
+            sg_ay_dict["sg_parent"] = sg_parent
+            sg_ay_dicts_page.append(sg_ay_dict)
 
-            sg_id = sg_ay_dict["attribs"][SHOTGRID_ID_ATTRIB]
-            sg_ay_dicts[sg_id] = sg_ay_dict
-            sg_ay_dicts_parents[parent_id].add(sg_id)
+        if sg_ay_dicts_page:
+            yield sg_ay_dicts_page
 
-    return sg_ay_dicts, sg_ay_dicts_parents
+
+def count_sg_entities(
+    sg_session: shotgun_api3.Shotgun,
+    sg_project: dict,
+    sg_enabled_entities: list,
+) -> int:
+    """Count the entities of the enabled types within a ShotGrid Project.
+
+    Args:
+        sg_session (shotgun_api3.Shotgun): Shotgun Session object.
+        sg_project (dict): The ShotGrid project to count its entities.
+        sg_enabled_entities (list): List of ShotGrid entities to count.
+
+    Returns:
+        int: The amount of entities, without the Asset Categories.
+    """
+    sg_entities_count = 0
+    for entity_name, _ in get_sg_project_enabled_entities(
+        sg_session,
+        sg_project,
+        sg_enabled_entities
+    ):
+        sg_summary = sg_session.summarize(
+            entity_name,
+            filters=[["project", "is", sg_project]],
+            summary_fields=[{"field": "id", "type": "count"}],
+        )
+        sg_entities_count += sg_summary["summaries"]["id"]
+
+    return sg_entities_count
+
+
+def _sort_sg_entities_by_hierarchy(
+    sg_session: shotgun_api3.Shotgun,
+    project_enabled_entities: list,
+) -> list:
+    """Sort the enabled entity types so parents come before their children.
+
+    The types a parent field can point to come from the ShotGrid schema, a
+    Task `entity` can be a Shot or an Asset for instance, so Tasks go after
+    both. Types in a cycle keep their original order.
+
+    Args:
+        sg_session (shotgun_api3.Shotgun): Shotgun Session object.
+        project_enabled_entities (list[tuple(entity type, parent field)]):
+            As returned by `get_sg_project_enabled_entities`.
+
+    Returns:
+        list[tuple(entity type, parent field)]: The sorted entity types.
+    """
+    enabled_entity_names = {
+        entity_name for entity_name, _ in project_enabled_entities
+    }
+    parent_entity_names = {}
+    for entity_name, parent_field in project_enabled_entities:
+        parent_types = []
+        if parent_field != "project":
+            field_schema = sg_schema_catalog.get_field(
+                sg_session, entity_name, parent_field) or {}
+            parent_types = (
+                field_schema.get("properties", {})
+                .get("valid_types", {})
+                .get("value")
+            ) or []
+        parent_entity_names[entity_name] = {
+            parent_type
+            for parent_type in parent_types
+            if parent_type in enabled_entity_names
+            and parent_type != entity_name
+        }
+
+    sorted_entities = []
+    sorted_entity_names = set()
+    pending_entities = list(project_enabled_entities)
+    while pending_entities:
+        ready_entities = [
+            enabled_entity
+            for enabled_entity in pending_entities
+            if parent_entity_names[enabled_entity[0]] <= sorted_entity_names
+        ] or pending_entities[:1]
+        for enabled_entity in ready_entities:
+            pending_entities.remove(enabled_entity)
+            sorted_entities.append(enabled_entity)
+            sorted_entity_names.add(enabled_entity[0])
+
+    return sorted_entities
 
 
 def get_sg_entity_as_ay_dict(
@@ -767,20 +1462,9 @@ def get_sg_entity_as_ay_dict(
     # Transform task_assignees list of dictionary entries
     # to just a list of the login names as used in AYON DB
     # so it's easier later to set
-    task_assignees = sg_entity.get("task_assignees")
-    if task_assignees:
-        task_assignees_list = []
-        for assignee in task_assignees:
-            # Skip task assignments that aren't from a human user (i.e. groups)
-            # TODO: add support for group assignments
-            if assignee["type"] != "HumanUser":
-                continue
-            sg_user = get_sg_user_by_id(
-                sg_session, assignee["id"], extra_fields=["login"]
-            )
-            task_assignees_list.append(sg_user["login"])
-        
-        sg_entity["task_assignees"] = task_assignees_list
+    if sg_entity.get("task_assignees"):
+        sg_entity["task_assignees"] = sg_user_logins.get_logins(
+            sg_session, sg_entity["task_assignees"])
 
     sg_ay_dict = _sg_to_ay_dict(
         sg_entity, project_code_field, custom_attribs_map
@@ -797,6 +1481,29 @@ def get_sg_entity_as_ay_dict(
     return sg_ay_dict
 
 
+def get_sg_record_as_ay_dict(
+    sg_entity: dict,
+    project_code_field: str,
+    custom_attribs_map: Optional[Dict[str, str]] = None,
+) -> dict:
+    """Morph a ShotGrid record we already have to an Ayon compatible one.
+
+    Like `get_sg_entity_as_ay_dict` but without querying the entity, i.e.
+    for the records returned by `sg.create()`, which must contain the
+    fields `_sg_to_ay_dict` reads for their entity type.
+
+    Args:
+        sg_entity (dict): The ShotGrid record.
+        project_code_field (str): The ShotGrid project code field.
+        custom_attribs_map (Optional[dict]): Dictionary that maps names of
+            attributes in AYON to ShotGrid equivalents.
+
+    Returns:
+        dict: The ShotGrid entity ready for Ayon consumption.
+    """
+    return _sg_to_ay_dict(sg_entity, project_code_field, custom_attribs_map)
+
+
 def get_sg_entity_parent_field(
     sg_session: shotgun_api3.Shotgun,
     sg_project: dict,
@@ -817,17 +1524,9 @@ def get_sg_entity_parent_field(
     Returns:
         sg_parent_field (str): The field that points to the entity parent.
     """
-    sg_parent_field = ""
-
-    for entity_tuple in get_sg_project_enabled_entities(
+    return sg_project_hierarchies.get_parent_fields(
         sg_session, sg_project, sg_enabled_entities
-    ):
-        entity_type, parent_field = entity_tuple
-
-        if entity_type == sg_entity_type:
-            sg_parent_field = parent_field
-
-    return sg_parent_field
+    ).get(sg_entity_type, "")
 
 
 def get_sg_missing_ay_attributes(sg_session: shotgun_api3.Shotgun):
@@ -841,13 +1540,9 @@ def get_sg_missing_ay_attributes(sg_session: shotgun_api3.Shotgun):
     """
     missing_attrs = []
     for ayon_attr, attr_dict in SG_PROJECT_ATTRS.items():
-        try:
-            sg_session.schema_field_read(
-                "Project",
-                field_name=f"sg_{ayon_attr}"
-            )
-        except Exception:
-            # shotgun_api3.shotgun.Fault: API schema_field_read()
+        if not check_sg_attribute_exists(
+            sg_session, "Project", f"sg_{ayon_attr}"
+        ):
             missing_attrs.append(ayon_attr)
 
     return missing_attrs
@@ -976,6 +1671,84 @@ def get_sg_project_by_code_name(
     return sg_project
 
 
+class ShotgridProjectHierarchies:
+    """Process wide cache of the hierarchy of the ShotGrid projects.
+
+    Finding the enabled entity types of a project and their parent fields
+    takes a query for its tracking settings plus a read of its schema, and
+    they're needed for almost every event, so we keep them for `ttl`
+    seconds. The processor invalidates a project whenever it changes.
+
+    Args:
+        ttl (int): Seconds after which the hierarchy of a project is
+            queried again.
+    """
+
+    def __init__(self, ttl: int = 600):
+        self.ttl = ttl
+        # (project id, enabled entities) -> (enabled entities and their
+        #   parent field, parent field by entity type, time they were read)
+        self._hierarchies = {}
+        self._lock = threading.Lock()
+
+    def _get_hierarchy(self, sg_session, sg_project, sg_enabled_entities):
+        key = (sg_project["id"], tuple(sg_enabled_entities))
+        with self._lock:
+            cached = self._hierarchies.get(key)
+
+        if cached is not None and time.time() - cached[2] <= self.ttl:
+            return cached
+
+        project_entities = _query_sg_project_enabled_entities(
+            sg_session, sg_project, sg_enabled_entities)
+        hierarchy = (project_entities, dict(project_entities), time.time())
+        # Don't remember projects that couldn't be found
+        if project_entities:
+            with self._lock:
+                self._hierarchies[key] = hierarchy
+        return hierarchy
+
+    def get_enabled_entities(
+        self,
+        sg_session: shotgun_api3.Shotgun,
+        sg_project: dict,
+        sg_enabled_entities: list,
+    ) -> list:
+        """See `get_sg_project_enabled_entities`."""
+        project_entities, _, _ = self._get_hierarchy(
+            sg_session, sg_project, sg_enabled_entities)
+        return list(project_entities)
+
+    def get_parent_fields(
+        self,
+        sg_session: shotgun_api3.Shotgun,
+        sg_project: dict,
+        sg_enabled_entities: list,
+    ) -> dict:
+        """Get the field pointing to the parent of each enabled entity type.
+
+        Returns:
+            dict[str, str]: Parent field by entity type.
+        """
+        _, parent_fields, _ = self._get_hierarchy(
+            sg_session, sg_project, sg_enabled_entities)
+        return parent_fields
+
+    def invalidate(self, sg_project_id: Optional[int] = None):
+        """Forget the hierarchy of a project, or of all of them."""
+        with self._lock:
+            if sg_project_id is None:
+                self._hierarchies.clear()
+                return
+
+            for key in list(self._hierarchies):
+                if key[0] == sg_project_id:
+                    del self._hierarchies[key]
+
+
+sg_project_hierarchies = ShotgridProjectHierarchies()
+
+
 def get_sg_project_enabled_entities(
     sg_session: shotgun_api3.Shotgun,
     sg_project: dict,
@@ -987,6 +1760,8 @@ def get_sg_project_enabled_entities(
     find all the enabled entity type (Shots, Sequence, etc) in a specific
     project and provide the configured field that points to the parent entity.
 
+    The result is cached in `sg_project_hierarchies`.
+
     Args:
         sg_session (shotgun_api3.Shotgun): Shotgun Session object.
         project_name (str): The project name to look for.
@@ -995,6 +1770,16 @@ def get_sg_project_enabled_entities(
         project_entities (list[tuple(entity type, parent field)]): List of
             enabled entities names and their respective parent field.
     """
+    return sg_project_hierarchies.get_enabled_entities(
+        sg_session, sg_project, sg_enabled_entities)
+
+
+def _query_sg_project_enabled_entities(
+    sg_session: shotgun_api3.Shotgun,
+    sg_project: dict,
+    sg_enabled_entities: list,
+) -> list:
+    """Query the enabled entities of a project and their parent fields."""
     sg_project = sg_session.find_one(
         "Project",
         filters=[["id", "is", sg_project["id"]]],
@@ -1046,6 +1831,200 @@ def get_sg_project_enabled_entities(
     return project_entities
 
 
+class ShotgridReferenceData:
+    """Process wide cache of the ShotGrid Tags, Pipeline Steps and Statuses.
+
+    These are small tables shared by all the projects that we look up by
+    name all the time (i.e. every time tags change in AYON or a Task is
+    created), so each of them is queried once, the first time it's needed,
+    and indexed by its case-insensitive name (the `code` for Steps and
+    Statuses).
+
+    It's kept up to date with the leeched events of those entities (see
+    `update_from_sg_event`) and with the Tags we create (see `add`). Since
+    the transmitter doesn't get the leeched events, a name that isn't found
+    is queried before giving up, and everything is reloaded after `ttl`
+    seconds.
+
+    Args:
+        ttl (int): Seconds after which an entity type is queried again.
+    """
+    # entity type -> (field holding the name, fields to query)
+    ENTITY_FIELDS = {
+        "Tag": ("name", ["name"]),
+        "Step": ("code", ["code", "short_name", "entity_type"]),
+        "Status": ("code", ["code", "name"]),
+    }
+
+    def __init__(self, ttl: int = 3600):
+        self.ttl = ttl
+        # entity type -> {id: record}
+        self._records = {}
+        # entity type -> {lower name: [records]}
+        self._records_by_name = {}
+        self._loaded_at = {}
+        self._lock = threading.RLock()
+
+    def _ensure_loaded(self, sg_session, sg_entity_type):
+        with self._lock:
+            loaded_at = self._loaded_at.get(sg_entity_type)
+            if loaded_at is not None and time.time() - loaded_at <= self.ttl:
+                return
+
+        _, fields = self.ENTITY_FIELDS[sg_entity_type]
+        sg_records = sg_session.find(sg_entity_type, [], fields=fields)
+
+        with self._lock:
+            self._records[sg_entity_type] = {}
+            self._records_by_name[sg_entity_type] = {}
+            for sg_record in sg_records:
+                self._insert(sg_entity_type, sg_record)
+            self._loaded_at[sg_entity_type] = time.time()
+
+    def _insert(self, sg_entity_type, sg_record):
+        name_field, _ = self.ENTITY_FIELDS[sg_entity_type]
+        self._remove(sg_entity_type, sg_record["id"])
+        self._records[sg_entity_type][sg_record["id"]] = sg_record
+        self._records_by_name[sg_entity_type].setdefault(
+            (sg_record.get(name_field) or "").lower(), []
+        ).append(sg_record)
+
+    def _remove(self, sg_entity_type, sg_id):
+        name_field, _ = self.ENTITY_FIELDS[sg_entity_type]
+        sg_record = self._records[sg_entity_type].pop(sg_id, None)
+        if sg_record is None:
+            return
+
+        name = (sg_record.get(name_field) or "").lower()
+        same_name_records = [
+            record
+            for record in self._records_by_name[sg_entity_type].get(name, [])
+            if record["id"] != sg_id
+        ]
+        if same_name_records:
+            self._records_by_name[sg_entity_type][name] = same_name_records
+        else:
+            self._records_by_name[sg_entity_type].pop(name, None)
+
+    def get_all(
+        self,
+        sg_session: shotgun_api3.Shotgun,
+        sg_entity_type: str,
+    ) -> list:
+        """Get all the records of an entity type.
+
+        Args:
+            sg_session (shotgun_api3.Shotgun): ShotGrid Session object.
+            sg_entity_type (str): One of `ENTITY_FIELDS`.
+
+        Returns:
+            list[dict]: The records with their queried fields.
+        """
+        self._ensure_loaded(sg_session, sg_entity_type)
+        with self._lock:
+            return list(self._records[sg_entity_type].values())
+
+    def find(
+        self,
+        sg_session: shotgun_api3.Shotgun,
+        sg_entity_type: str,
+        name: str,
+        **field_values,
+    ) -> Optional[dict]:
+        """Find a record by its (case-insensitive) name.
+
+        Args:
+            sg_session (shotgun_api3.Shotgun): ShotGrid Session object.
+            sg_entity_type (str): One of `ENTITY_FIELDS`.
+            name (str): The name (or code) of the record.
+            field_values: Other fields the record must match, i.e. the
+                `entity_type` of a Step.
+
+        Returns:
+            Optional[dict]: The record, None if it doesn't exist.
+        """
+        self._ensure_loaded(sg_session, sg_entity_type)
+        sg_record = self._find_cached(sg_entity_type, name, field_values)
+        if sg_record is not None:
+            return sg_record
+
+        # It might have been created since we loaded them
+        name_field, fields = self.ENTITY_FIELDS[sg_entity_type]
+        filters = [[name_field, "is", name]]
+        filters.extend(
+            [field, "is", value] for field, value in field_values.items()
+        )
+        sg_record = sg_session.find_one(
+            sg_entity_type, filters, fields=fields)
+        if sg_record is not None:
+            self.add(sg_entity_type, sg_record)
+        return sg_record
+
+    def _find_cached(self, sg_entity_type, name, field_values):
+        with self._lock:
+            records_by_name = self._records_by_name.get(sg_entity_type, {})
+            for sg_record in records_by_name.get(name.lower(), []):
+                if all(
+                    sg_record.get(field) == value
+                    for field, value in field_values.items()
+                ):
+                    return sg_record
+        return None
+
+    def add(self, sg_entity_type: str, sg_record: dict):
+        """Add a record we created (or found) to the cache.
+
+        Records of entity types that haven't been loaded yet are skipped,
+        they'll come with the rest once they're needed.
+        """
+        with self._lock:
+            if sg_entity_type in self._records:
+                self._insert(sg_entity_type, sg_record)
+
+    def update_from_sg_event(
+        self,
+        sg_session: shotgun_api3.Shotgun,
+        sg_event_meta: dict,
+    ):
+        """Apply a leeched event of one of the cached entity types.
+
+        Args:
+            sg_session (shotgun_api3.Shotgun): ShotGrid Session object.
+            sg_event_meta (dict): The `meta` key from a ShotGrid Event.
+        """
+        sg_entity_type = sg_event_meta.get("entity_type")
+        sg_id = sg_event_meta.get("entity_id")
+        with self._lock:
+            if sg_entity_type not in self._records:
+                return
+
+        if sg_event_meta.get("type") == "entity_retirement":
+            with self._lock:
+                self._remove(sg_entity_type, sg_id)
+            return
+
+        _, fields = self.ENTITY_FIELDS[sg_entity_type]
+        sg_record = sg_session.find_one(
+            sg_entity_type, [["id", "is", sg_id]], fields=fields)
+        with self._lock:
+            if sg_record is None:
+                self._remove(sg_entity_type, sg_id)
+            else:
+                self._insert(sg_entity_type, sg_record)
+
+    def invalidate(self, sg_entity_type: Optional[str] = None):
+        """Forget the records of an entity type, or of all of them."""
+        with self._lock:
+            for entity_type in list(self._loaded_at):
+                if sg_entity_type in (None, entity_type):
+                    self._loaded_at.pop(entity_type)
+                    self._records.pop(entity_type, None)
+                    self._records_by_name.pop(entity_type, None)
+
+
+sg_reference_data = ShotgridReferenceData()
+
+
 def get_sg_statuses(
     sg_session: shotgun_api3.Shotgun,
     sg_entity_type: Optional[str] = None
@@ -1069,13 +2048,14 @@ def get_sg_statuses(
             status_field = "sg_status"
         else:
             status_field = "sg_status_list"
-        entity_status = sg_session.schema_field_read(sg_entity_type, status_field)
-        sg_statuses = entity_status["sg_status_list"]["properties"]["display_values"]["value"]
+        entity_status = sg_schema_catalog.get_field(
+            sg_session, sg_entity_type, status_field)
+        sg_statuses = entity_status["properties"]["display_values"]["value"]
         return sg_statuses
 
     sg_statuses = {
         status["code"]: status["name"]
-        for status in sg_session.find("Status", [], fields=["name", "code"])
+        for status in sg_reference_data.get_all(sg_session, "Status")
     }
     return sg_statuses
 
@@ -1095,7 +2075,7 @@ def get_sg_tags(
     """
     sg_tags = {
         tags["name"].lower(): tags["id"]
-        for tags in sg_session.find("Tag", [], fields=["name", "id"])
+        for tags in sg_reference_data.get_all(sg_session, "Tag")
     }
     return sg_tags
 
@@ -1113,30 +2093,129 @@ def get_sg_pipeline_steps(
     Returns:
         sg_steps (list): ShotGrid Project Pipeline Steps list.
     """
-    sg_steps = []
-    enabled_entities = get_sg_project_enabled_entities(
-        sg_session,
-        shotgrid_project,
-        sg_enabled_entities
-    )
+    enabled_entities = {
+        entity
+        for entity, _ in get_sg_project_enabled_entities(
+            sg_session,
+            shotgrid_project,
+            sg_enabled_entities
+        )
+    }
 
-    pipeline_steps = sg_session.find(
-        "Step",
-        filters=[{
-                "filter_operator": "any",
-                "filters": [
-                    ["entity_type", "is", entity]
-                    for entity, _ in enabled_entities
-                ]
-            }],
-        fields=["code", "short_name", "entity_type"]
-    )
+    sg_steps = {
+        (step["code"], step["short_name"].lower())
+        for step in sg_reference_data.get_all(sg_session, "Step")
+        if step["entity_type"] in enabled_entities
+    }
+    return list(sg_steps)
+
+
+class AyonProjectAnatomy:
+    """The anatomy of an AYON project, indexed the way the services read it.
+
+    Args:
+        ay_project (dict): The project as returned by `ayon_api.get_project`.
+    """
+
+    def __init__(self, ay_project: dict):
+        self.name = ay_project["name"]
+        self.code = ay_project.get("code")
+        self.attribs = dict(ay_project.get("attrib") or {})
+        self.statuses = list(ay_project.get("statuses") or [])
+        self.tags = list(ay_project.get("tags") or [])
+        self.task_types = list(ay_project.get("taskTypes") or [])
+        self.folder_types = list(ay_project.get("folderTypes") or [])
+
+        self.tag_names = {tag["name"] for tag in self.tags}
+        self.task_types_by_lower_name = {
+            task_type["name"].lower(): task_type
+            for task_type in self.task_types
+        }
+        self.folder_type_names = [
+            folder_type["name"] for folder_type in self.folder_types
+        ]
+
+
+class AyonProjectAnatomies:
+    """Process wide cache of the anatomy of the AYON projects.
+
+    Statuses, tags, task and folder types and the project attributes are
+    read for almost every event (i.e. to check whether a project is pushed
+    to ShotGrid), but they rarely change, so we query each project once and
+    keep it for `ttl` seconds. The transmitter invalidates a project
+    whenever it gets its `entity.project.changed` event.
+
+    The statuses of the entities are converted with `get_ay_status_name`
+    from the project of the entity hub instead, since a sync creates the
+    missing ones in it.
+
+    Args:
+        ttl (int): Seconds after which a project is queried again.
+    """
+
+    def __init__(self, ttl: int = 600):
+        self.ttl = ttl
+        # project name -> (anatomy, time it was read)
+        self._anatomies = {}
+        self._lock = threading.Lock()
+
+    def get(self, project_name: str) -> Optional[AyonProjectAnatomy]:
+        """Get the anatomy of a project.
+
+        Args:
+            project_name (str): The AYON project name.
+
+        Returns:
+            Optional[AyonProjectAnatomy]: None if the project doesn't exist.
+        """
+        with self._lock:
+            cached = self._anatomies.get(project_name)
+
+        if cached is not None and time.time() - cached[1] <= self.ttl:
+            return cached[0]
+
+        ay_project = get_project(project_name)
+        # Don't remember projects that couldn't be found
+        if not ay_project:
+            return None
+
+        anatomy = AyonProjectAnatomy(ay_project)
+        with self._lock:
+            self._anatomies[project_name] = (anatomy, time.time())
+        return anatomy
+
+    def invalidate(self, project_name: Optional[str] = None):
+        """Forget the anatomy of a project, or of all of them."""
+        with self._lock:
+            if project_name is None:
+                self._anatomies.clear()
+            else:
+                self._anatomies.pop(project_name, None)
+
+
+ay_project_anatomies = AyonProjectAnatomies()
+
+
+def get_ay_status_name(
+    ay_project: ProjectEntity,
+    status_short_name: str,
+) -> Optional[str]:
+    """Get the name of an AYON project status from its short name.
+
+    The entity hub expects statuses by their `name`, while ShotGrid only
+    knows their `short_name`.
 
-    for step in pipeline_steps:
-        sg_steps.append((step["code"], step["short_name"].lower()))
+    Args:
+        ay_project (ProjectEntity): The project of the entity hub.
+        status_short_name (str): The ShotGrid status short name.
 
-    sg_steps = list(set(sg_steps))
-    return sg_steps
+    Returns:
+        Optional[str]: None if the project has no such status.
+    """
+    for status in ay_project.statuses:
+        if status.short_name == status_short_name:
+            return status.name
+    return None
 
 
 def get_sg_custom_attributes_data(
@@ -1208,10 +2287,13 @@ def update_ay_entity_custom_attributes(
             # Entity hub expects the statuses to be provided with the `name` and
             # not the `short_name` (which is what we get from SG) so we convert
             # the short name back to the long name before setting it
-            status_mapping = {
-                status.short_name: status.name for status in ay_project.statuses
-            }
-            new_status_name = status_mapping.get(attrib_value)
+            new_status_name = get_ay_status_name(ay_project, attrib_value)
+            if not new_status_name:
+                log.warning(
+                    "Status with short name '%s' doesn't exist in project",
+                    attrib_value
+                )
+                continue
             try:
                 ay_entity.status = new_status_name
             except ValueError as e:
@@ -1230,3 +2312,160 @@ def update_ay_entity_custom_attributes(
                     ay_attrib, ay_entity.name
                 )
                 continue
+
+
+def get_sg_ay_dict_mapped_values(
+    sg_ay_dict: dict,
+    custom_attribs_map: dict,
+    ay_project: Optional[ProjectEntity] = None,
+) -> dict:
+    """Get the values `update_ay_entity_custom_attributes` would set.
+
+    Tags are converted to their names and statuses to their AYON name, so
+    they can be compared with the ones of an AYON entity. Statuses missing
+    in the project keep their short name, so they never look unchanged.
+
+    Args:
+        sg_ay_dict (dict): The ShotGrid entity ready for Ayon consumption.
+        custom_attribs_map (dict): Dictionary that maps names of attributes in
+            AYON to ShotGrid equivalents.
+        ay_project (Optional[ProjectEntity]): The project of the entity hub,
+            needed to convert the statuses.
+
+    Returns:
+        dict: The values by AYON attribute, without the empty ones.
+    """
+    mapped_values = {}
+    for ay_attrib in custom_attribs_map:
+        attrib_value = (
+            sg_ay_dict["attribs"].get(ay_attrib) or sg_ay_dict.get(ay_attrib)
+        )
+        if attrib_value is None:
+            continue
+
+        if ay_attrib == "tags":
+            attrib_value = [tag["name"] for tag in attrib_value]
+        elif ay_attrib == "status" and ay_project is not None:
+            attrib_value = (
+                get_ay_status_name(ay_project, attrib_value) or attrib_value
+            )
+        mapped_values[ay_attrib] = attrib_value
+
+    return mapped_values
+
+
+def get_ay_entity_mapped_values(
+    ay_entity: Union[ProjectEntity, FolderEntity, TaskEntity],
+    ay_attribs: list,
+) -> dict:
+    """Get the current values of some attributes of an AYON entity.
+
+    Args:
+        ay_entity (Union[ProjectEntity, FolderEntity, TaskEntity]): The
+            AYON entity.
+        ay_attribs (list): The AYON attributes, including `tags`, `status`
+            and `assignees`.
+
+    Returns:
+        dict: The values by AYON attribute.
+    """
+    mapped_values = {}
+    for ay_attrib in ay_attribs:
+        if ay_attrib in ("tags", "status", "assignees"):
+            mapped_values[ay_attrib] = getattr(ay_entity, ay_attrib, None)
+        else:
+            mapped_values[ay_attrib] = ay_entity.attribs.get(ay_attrib)
+    return mapped_values
+
+
+def _normalize_mapped_value(ay_attrib, value):
+    # Dates are only synced to the day, see `get_sg_custom_attributes_data`
+    if "date" in ay_attrib.lower():
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return value
+        if isinstance(value, datetime):
+            return value.strftime("%Y-%m-%d")
+
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+
+    if isinstance(value, (list, tuple, set)):
+        return sorted(value, key=str)
+
+    return value
+
+
+def get_mapped_values_hash(mapped_values: dict) -> str:
+    """Hash the values of the synced attributes of an entity.
+
+    Values are normalized so the ones of an AYON entity and of a ShotGrid
+    entity hash the same when syncing them wouldn't change anything.
+
+    Args:
+        mapped_values (dict): The values by AYON attribute, as returned by
+            `get_sg_ay_dict_mapped_values` or `get_ay_entity_mapped_values`.
+
+    Returns:
+        str: The SHA-256 hash of the values.
+    """
+    normalized_values = {
+        ay_attrib: _normalize_mapped_value(ay_attrib, value)
+        for ay_attrib, value in mapped_values.items()
+        if value is not None
+    }
+    json_data = json.dumps(normalized_values, sort_keys=True, default=str)
+    return hashlib.sha256(json_data.encode("utf-8")).hexdigest()
+
+
+def send_sg_batch_requests(
+    sg_session: shotgun_api3.Shotgun,
+    sg_batch_requests: list,
+    chunk_size: int = 100,
+) -> tuple[list, dict]:
+    """Send a list of requests through `sg.batch()` in chunks.
+
+    ShotGrid runs each batch call within a transaction, so a single faulty
+    request would make the whole chunk fail; when that happens we retry the
+    requests of the chunk one by one so the error can be mapped back to the
+    request that caused it.
+
+    Args:
+        sg_session (shotgun_api3.Shotgun): ShotGrid Session object.
+        sg_batch_requests (list): List of `sg.batch()` compatible requests.
+        chunk_size (int): Maximum amount of requests per `sg.batch()` call.
+
+    Returns:
+        tuple(
+            results (list): The result of each request, `None` if it failed.
+            errors (dict[int, Exception]): Exceptions raised by the failed
+                requests keyed by their index in `sg_batch_requests`.
+        )
+    """
+    results = [None] * len(sg_batch_requests)
+    errors = {}
+    chunk_size = max(chunk_size, 1)
+
+    for chunk_start in range(0, len(sg_batch_requests), chunk_size):
+        chunk = sg_batch_requests[chunk_start:chunk_start + chunk_size]
+        try:
+            results[chunk_start:chunk_start + len(chunk)] = (
+                sg_session.batch(chunk)
+            )
+            continue
+        except Exception:
+            log.warning(
+                "ShotGrid batch request failed, retrying one by one.",
+                exc_info=True
+            )
+
+        for index, sg_request in enumerate(chunk, start=chunk_start):
+            try:
+                results[index] = sg_session.batch([sg_request])[0]
+            except Exception as e:
+                log.error(f"ShotGrid request failed: {sg_request} -> {e}")
+                errors[index] = e
+
+    return results, errors
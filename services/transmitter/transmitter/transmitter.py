@@ -15,7 +15,13 @@ import shotgun_api3
 
 from ayon_shotgrid_hub import AyonShotgridHub
 
-from utils import get_logger
+from utils import (
+    ay_project_anatomies,
+    get_logger,
+    get_sg_service_session_uuid,
+    sg_project_hierarchies,
+    sg_schema_catalog,
+)
 
 
 class ShotgridTransmitter:
@@ -97,6 +103,21 @@ class ShotgridTransmitter:
             except Exception:
                 self.sg_polling_frequency = 10
 
+            # The transmitter doesn't get the leeched schema changes, so
+            # the cached schema is only refreshed once it expires
+            try:
+                sg_schema_catalog.ttl = int(
+                    service_settings.get("sg_schema_cache_ttl", 600))
+            except Exception:
+                sg_schema_catalog.ttl = 600
+            sg_project_hierarchies.ttl = sg_schema_catalog.ttl
+
+            try:
+                ay_project_anatomies.ttl = int(
+                    service_settings.get("ayon_anatomy_cache_ttl", 600))
+            except Exception:
+                ay_project_anatomies.ttl = 600
+
         except Exception as e:
             self.log.error("Unable to get Addon settings from the server.")
             raise e
@@ -118,6 +139,9 @@ class ShotgridTransmitter:
             except Exception as e:
                 self.log.error("Unable to create Shotgrid Session.")
                 raise e
+            # Let the leecher skip the events caused by the transmitter
+            self._sg.set_session_uuid(
+                get_sg_service_session_uuid(self.sg_script_name))
 
         try:
             self._sg.connect()
@@ -149,6 +173,7 @@ class ShotgridTransmitter:
             "entity.folder.status_changed",
             "entity.folder.tags_changed",
             "entity.version.status_changed",
+            "entity.project.changed",
         ]
 
         while True:
@@ -195,11 +220,22 @@ class ShotgridTransmitter:
                 source_event = ayon_api.get_event(event["dependsOn"])
 
                 project_name = source_event["project"]
-                ay_project = ayon_api.get_project(project_name)
+
+                if source_event["topic"] == "entity.project.changed":
+                    # We only care about them to refresh the cached anatomy
+                    ay_project_anatomies.invalidate(project_name)
+                    ayon_api.update_event(
+                        event["id"],
+                        project_name=project_name,
+                        status="finished"
+                    )
+                    continue
+
+                ay_anatomy = ay_project_anatomies.get(project_name)
 
                 if (
-                    not ay_project
-                    or not ay_project["attrib"].get("shotgridPush", False)
+                    not ay_anatomy
+                    or not ay_anatomy.attribs.get("shotgridPush", False)
                 ):
                     # This should never happen since we only fetch events of
                     # projects we have shotgridPush enabled; but just in case
@@ -217,7 +253,7 @@ class ShotgridTransmitter:
                     )
                     continue
 
-                project_code = ay_project.get("code")
+                project_code = ay_anatomy.code
 
                 hub = AyonShotgridHub(
                     self.get_sg_connection(),